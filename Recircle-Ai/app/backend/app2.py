@@ -1,52 +1,244 @@
-from flask import Flask, request, jsonify
+import time
+_import_started = time.perf_counter()  # reported on /health as import_seconds
+
+from flask import Flask, request, jsonify, g, has_request_context
 from flask_cors import CORS
-from datetime import datetime
+from datetime import datetime, timedelta
+from array import array
+from collections import OrderedDict, deque
+import contextlib
+import functools
+import itertools
+import operator
+import hashlib
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+import multiprocessing
 import json
+import random
 import uuid
 import atexit
 from pyngrok import ngrok
-import time
 import os
 import logging
+import logging.handlers
 import math
+import queue
+import re
 import sys
-import nltk
-from nltk.sentiment.vader import SentimentIntensityAnalyzer
-from nltk.tokenize import sent_tokenize
+import threading
+import zlib
+import numpy as np
+from fast_json import FastJSONProvider, JSONFragment
+from journal import Journal
+from sqlite_storage import SQLiteStorage
 
 # ==================== CONFIGURATION & SETUP ====================
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[logging.StreamHandler(sys.stdout)]
+# Configure logging. Records are formatted lazily (%-style arguments) and, by
+# default, written by a QueueListener thread so request threads never block on
+# stdout.
+#   RECIRCLE_LOG_LEVEL         root level (INFO)
+#   RECIRCLE_LOG_FORMAT        text (default) or json, one object per line
+#   RECIRCLE_LOG_ASYNC         0 writes from the calling thread instead
+#   RECIRCLE_LOG_SAMPLE        fraction of requests whose INFO/DEBUG records are kept (1.0)
+#   RECIRCLE_LOG_SAMPLE_ROUTES per-route overrides, e.g. "/calculate-impact=0.01,/health=0"
+#   RECIRCLE_LOG_BODY_MAX      cap on the request body logged at DEBUG (1024 characters)
+LOG_LEVEL = os.environ.get("RECIRCLE_LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.environ.get("RECIRCLE_LOG_FORMAT", "text")
+LOG_ASYNC = os.environ.get("RECIRCLE_LOG_ASYNC", "1") == "1"
+LOG_SAMPLE_RATE = float(os.environ.get("RECIRCLE_LOG_SAMPLE", "1.0"))
+LOG_SAMPLE_ROUTES = {
+    route.strip(): float(rate)
+    for route, _, rate in (item.rpartition("=") for item in os.environ.get("RECIRCLE_LOG_SAMPLE_ROUTES", "").split(","))
+    if route.strip()
+}
+LOG_BODY_MAX = int(os.environ.get("RECIRCLE_LOG_BODY_MAX", "1024"))
+
+class JsonLogFormatter(logging.Formatter):
+    FIELDS = ("request_id", "route", "method", "status", "duration_ms")
+    
+    def format(self, record):
+        entry = {"time": self.formatTime(record), "level": record.levelname, "message": record.getMessage()}
+        for field in self.FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+class RequestLogFilter(logging.Filter):
+    """Tags records with the request id; drops INFO/DEBUG records of unsampled requests"""
+    
+    def filter(self, record):
+        if not has_request_context():
+            return True
+        record.request_id = g.get("request_id")
+        return record.levelno >= logging.WARNING or g.get("log_sampled", True)
+
+log_writer = logging.StreamHandler(sys.stdout)
+log_writer.setFormatter(
+    JsonLogFormatter() if LOG_FORMAT == "json" else logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
 )
+log_listener = None
+if LOG_ASYNC:
+    log_queue = queue.SimpleQueue()
+    log_handler = logging.handlers.QueueHandler(log_queue)
+    # prepare() merges args (and any traceback) into the message; log_writer adds the rest
+    log_handler.setFormatter(logging.Formatter('%(message)s'))
+    log_listener = logging.handlers.QueueListener(log_queue, log_writer)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+else:
+    log_handler = log_writer
+log_handler.addFilter(RequestLogFilter())
+# The app logger is wired explicitly: basicConfig does nothing when the host
+# (gunicorn, pytest) has already configured the root logger, which would leave
+# the queue and the request sampling out. Other loggers use root as before.
 logger = logging.getLogger(__name__)
+logger.setLevel(LOG_LEVEL)
+logger.addHandler(log_handler)
+logger.propagate = False
+logging.basicConfig(level=LOG_LEVEL, handlers=[log_handler])
+
+def use_sync_logging():
+    """In a forked child the listener thread is gone; write records directly"""
+    log_writer.addFilter(RequestLogFilter())
+    root = logging.getLogger()
+    if log_handler in root.handlers:
+        root.handlers = [log_writer]
+    logger.handlers = [log_writer]
 
 app = Flask(__name__)
 CORS(app)
 
-# NLTK Setup
-print("📥 Setting up NLTK resources...")
-try:
-    nltk.data.find('sentiment/vader_lexicon')
-except LookupError:
-    nltk.download('vader_lexicon', quiet=True)
+# Response encoder behind every jsonify (see fast_json.py):
+#   RECIRCLE_JSON   auto (orjson when installed, default), orjson or stdlib
+app.json = FastJSONProvider(app, os.environ.get("RECIRCLE_JSON", "auto"))
+
+# NLTK Setup (lazy): nltk, the VADER lexicon and punkt are loaded on first use
+# or by a warmup thread, never at import, so impact-only workers skip them.
+#   RECIRCLE_NLTK_DATA     nltk_data directory searched first (bundled resources)
+#   RECIRCLE_NLTK_OFFLINE  1 = never call nltk.download; missing resources fail warmup
+#   RECIRCLE_NLTK_WARMUP   lazy (first trust request), background (default) or eager
+#   RECIRCLE_VADER_IMAGE   lexicon image from `python vader_image.py build`, mmapped
+#                          and shared by forked workers instead of parsed per process
+NLTK_DATA_DIR = os.environ.get("RECIRCLE_NLTK_DATA")
+NLTK_OFFLINE = os.environ.get("RECIRCLE_NLTK_OFFLINE", "0") == "1"
+NLTK_WARMUP = os.environ.get("RECIRCLE_NLTK_WARMUP", "background")
+VADER_IMAGE_PATH = os.environ.get("RECIRCLE_VADER_IMAGE")
+NLTK_RESOURCES = [
+    ('sentiment/vader_lexicon', 'vader_lexicon'),
+    ('tokenizers/punkt', 'punkt'),
+    ('tokenizers/punkt_tab', 'punkt_tab')
+]
+
+sentiment_analyzer = None
+sentence_tokenize = None
+nltk_lock = threading.Lock()
+nltk_status = {
+    "state": "cold",
+    "warmup_mode": NLTK_WARMUP,
+    "offline": NLTK_OFFLINE,
+    "data_dir": NLTK_DATA_DIR,
+    "lexicon": None,
+    "warmup_seconds": None,
+    "error": None
+}
 
-for resource in ['punkt', 'punkt_tab']:
+def _load_nltk():
+    import nltk
+    from nltk.sentiment.vader import SentimentIntensityAnalyzer
+    
+    if NLTK_DATA_DIR and NLTK_DATA_DIR not in nltk.data.path:
+        nltk.data.path.insert(0, NLTK_DATA_DIR)
+    if not NLTK_OFFLINE:
+        for resource, package in NLTK_RESOURCES:
+            if VADER_IMAGE_PATH and package == 'vader_lexicon':
+                continue
+            try:
+                nltk.data.find(resource)
+            except LookupError:
+                nltk.download(package, quiet=True, download_dir=NLTK_DATA_DIR)
+    
+    analyzer = None
+    if VADER_IMAGE_PATH:
+        from vader_image import LexiconImage, image_analyzer
+        try:
+            analyzer = image_analyzer(LexiconImage(VADER_IMAGE_PATH))
+            nltk_status["lexicon"] = f"image:{VADER_IMAGE_PATH}"
+        except (OSError, ValueError) as exc:
+            logger.warning("⚠️ VADER image unusable (%s); loading the NLTK lexicon", exc)
+    if analyzer is None:
+        analyzer = SentimentIntensityAnalyzer()
+        nltk_status["lexicon"] = "nltk"
+    analyzer.polarity_scores("Warm up")
+    
+    # One punkt instance for the process instead of a lookup per sent_tokenize call
     try:
-        nltk.data.find(f'tokenizers/{resource}')
-    except LookupError:
-        nltk.download(resource, quiet=True)
-
-sia = SentimentIntensityAnalyzer()
-print("✅ NLTK & Sentiment analyzer initialized")
+        from nltk.tokenize import PunktTokenizer
+        punkt = PunktTokenizer("english")
+    except ImportError:  # NLTK < 3.8.2 ships pickled models only
+        punkt = nltk.data.load('tokenizers/punkt/english.pickle')
+    punkt.tokenize("Warm up. Ready.")
+    return analyzer, punkt.tokenize
+
+def warm_sentiment():
+    """Return the shared VADER analyzer, building it (and punkt) on first call"""
+    global sentiment_analyzer, sentence_tokenize
+    if sentiment_analyzer is not None:
+        return sentiment_analyzer
+    with nltk_lock:
+        if sentiment_analyzer is None:
+            nltk_status["state"] = "warming"
+            started = time.perf_counter()
+            try:
+                analyzer, tokenize = _load_nltk()
+            except Exception as exc:
+                # NLTK's LookupError text is a multi-line banner; keep it on one line
+                nltk_status.update(state="failed", error=" ".join(str(exc).replace("*", "").split())[:300])
+                logger.error("❌ NLTK warmup failed: %s", nltk_status["error"])
+                raise
+            sentence_tokenize = tokenize
+            sentiment_analyzer = analyzer
+            nltk_status.update(state="warm", warmup_seconds=round(time.perf_counter() - started, 3), error=None)
+            logger.info("✅ NLTK & Sentiment analyzer initialized in %ss", nltk_status["warmup_seconds"])
+    return sentiment_analyzer
+
+def _background_warmup():
+    try:
+        warm_sentiment()
+    except Exception:
+        pass  # already logged; the first trust request retries
+
+def start_sentiment_warmup():
+    threading.Thread(target=_background_warmup, name="nltk-warmup", daemon=True).start()
+
+if NLTK_WARMUP == "eager":
+    warm_sentiment()
+
+# Most reviews are one short sentence that punkt would return unchanged, so
+# they skip it. A text whose only terminator is a single mark or a run of dots
+# at the end is one sentence; a trailing run of 2+ "!"/"?" is split before its
+# last mark, which is what punkt does. Anything else goes to punkt.
+_ONE_SENTENCE = re.compile(r"[^.!?]*(?:[.!?]|\.+)?")
+_TRAILING_MARKS = re.compile(r"[^.!?]*[^.!?\s][!?]{2,}")
+
+def split_sentences(text):
+    """sent_tokenize(text), without punkt for the common simple cases"""
+    text = text.rstrip()
+    if not text:
+        return []
+    if _ONE_SENTENCE.fullmatch(text):
+        return [text]
+    if _TRAILING_MARKS.fullmatch(text):
+        return [text[:-1], text[-1]]
+    warm_sentiment()
+    return sentence_tokenize(text)
 
 # ==================== GLOBAL DATA STORAGE ====================
 
-# Impact Analytics Data
-impact_reports = []
+# Impact Analytics Data (impact_reports is the columnar ImpactReportStore defined below)
 csr_summary = {
     "total_co2_saved": 0,
     "total_co2e_saved": 0,
@@ -62,6 +254,58 @@ csr_summary = {
     "compliance_standards": ["GHG Protocol", "ISO 14040", "UNEP Circular Economy"]
 }
 
+# Concurrency model for app.run(threaded=True): every impact write (store append,
+# score index, CSR/analytics aggregates, journal) goes through one writer lock,
+# while seller read-modify-write updates are serialised per seller on lock stripes.
+# Snapshots and analytics repairs also take the writer lock, from inside impact
+# writes as well as from seller writes, hence re-entrant.
+impact_write_lock = threading.RLock()
+SELLER_LOCK_STRIPES = 64
+seller_locks = [threading.Lock() for _ in range(SELLER_LOCK_STRIPES)]
+
+def seller_lock(seller_id):
+    return seller_locks[hash(seller_id) % SELLER_LOCK_STRIPES]
+
+# Running per-category totals and score histogram behind /impact-analytics
+impact_analytics = {
+    "category_breakdown": {},
+    "score_distribution": {
+        "champion": 0,
+        "warrior": 0,
+        "guardian": 0,
+        "protector": 0,
+        "beginner": 0,
+        "starter": 0
+    }
+}
+
+# Hour/day/month totals behind /impact-timeseries:
+# {granularity: {bucket key: {category: [count, score, co2, co2e, water, waste, social]}}}
+# A bucket key is the ISO created_at timestamp cut to the granularity
+ROLLUP_KEY_LENGTHS = {"hour": 13, "day": 10, "month": 7}  # "2026-10-18T13", "2026-10-18", "2026-10"
+ROLLUP_FIELDS = ("count", "total_score", "total_co2", "total_co2e", "total_water", "total_waste", "total_social_value")
+impact_rollups = {granularity: {} for granularity in ROLLUP_KEY_LENGTHS}
+
+# Immutable copy of the aggregates published after every write; dashboard reads
+# grab this one reference instead of reading the structures the writer mutates
+aggregate_snapshot = {
+    "version": 0,
+    "csr_summary": dict(csr_summary),
+    "category_breakdown": {},
+    "score_distribution": dict(impact_analytics["score_distribution"])
+}
+
+# Bumped after every write a cached GET response could observe (impact writes,
+# reviews, resets). Readers take the version before reading state, so a response
+# is never cached under a newer version than the data it was built from.
+state_version = 0
+state_version_lock = threading.Lock()
+
+def bump_state_version():
+    global state_version
+    with state_version_lock:
+        state_version += 1
+
 # Seller Trust Data
 sellers = {
     "seller1": {
@@ -183,6 +427,24 @@ IMPACT_CONFIG = {
     "max_quantity_bonus": 50
 }
 
+# UNEP circular economy factors per category
+CIRCULARITY_FACTORS = {
+    'Clothes': {'material_reuse': 0.85, 'lifetime_extension': 2.5, 'value_retention': 0.70},
+    'Electronics': {'material_reuse': 0.65, 'lifetime_extension': 3.0, 'value_retention': 0.60},
+    'Furniture': {'material_reuse': 0.90, 'lifetime_extension': 5.0, 'value_retention': 0.75},
+    'Food': {'material_reuse': 0.40, 'lifetime_extension': 0.5, 'value_retention': 0.30},
+    'Books': {'material_reuse': 0.95, 'lifetime_extension': 10.0, 'value_retention': 0.80}
+}
+
+# Static compliance text shared by every impact record
+CIRCULAR_ECONOMY_PRINCIPLES = [
+    "Design out waste and pollution",
+    "Keep products and materials in use", 
+    "Regenerate natural systems"
+]
+UNEP_ALIGNMENT = "Circularity Gap Reporting Framework"
+ISO_14040_IMPACT_CATEGORIES = ["climate_change", "water_use", "resource_depletion"]
+
 # ==================== SELLER TRUST CONFIGURATION ====================
 
 WEIGHTS = {
@@ -201,98 +463,134 @@ DELIVERY_MAP = {
 # ==================== MIDDLEWARE ====================
 
 @app.before_request
-def log_request_info():
-    """Uniform request logging for all modules"""
-    logger.info(f"📨 Incoming {request.method} {request.path}")
-    if request.get_data():
-        try:
-            body = json.loads(request.get_data())
-            logger.info(f"   Body: {json.dumps(body, indent=2)}")
-        except:
-            logger.info(f"   Body: {request.get_data()}")
+def start_request_context():
+    """Per-request context on `g`, shared by the logging middleware and handlers"""
+    g.request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex[:16]
+    g.started = time.perf_counter()
+    g.route = request.url_rule.rule if request.url_rule else request.path
+    rate = LOG_SAMPLE_ROUTES.get(g.route, LOG_SAMPLE_RATE)
+    g.log_sampled = rate >= 1 or random.random() < rate
+    if g.log_sampled and request.content_length and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("   Body: %s", request_body_preview())
+
+def request_body_preview():
+    """The request body for logs, capped at LOG_BODY_MAX characters.
+    
+    JSON bodies go through request.get_json, whose cached result is what the
+    handler's own get_json call returns, so the body is parsed only once.
+    """
+    if request.content_length > LOG_BODY_MAX or not request.is_json:
+        return f"{request.get_data()[:LOG_BODY_MAX]!r} ({request.content_length} bytes)"
+    preview = json.dumps(request.get_json(silent=True), separators=(",", ":"), ensure_ascii=False)
+    return preview if len(preview) <= LOG_BODY_MAX else preview[:LOG_BODY_MAX] + "..."
+
+@app.after_request
+def log_request(response):
+    duration_ms = round((time.perf_counter() - g.get("started", time.perf_counter())) * 1000, 2)
+    if "request_id" in g:
+        response.headers["X-Request-ID"] = g.request_id
+    logger.info("📨 %s %s -> %s in %.2fms", request.method, request.path, response.status_code, duration_ms,
+                extra={"route": g.get("route"), "method": request.method,
+                       "status": response.status_code, "duration_ms": duration_ms})
+    return response
 
 # ==================== IMPACT ANALYTICS FUNCTIONS ====================
 
-def calculate_ghg_compliant_impact(category, quantity_kg, distance_km=0):
-    """GHG Protocol compliant impact calculation"""
-    factors = GHG_EMISSION_FACTORS.get(category, {})
+class CategoryCoefficients:
+    """One category's entries from the factor tables, compiled for calculate_impact.
     
-    # Avoided production emissions (CO₂)
-    avoided_production = quantity_kg * factors.get('production', 0)
-    
-    # Avoided landfill methane (converted to CO₂e)
-    methane_kg = quantity_kg * factors.get('landfill_methane', 0)
-    avoided_methane_co2e = methane_kg * 25  # Methane is 25x CO₂
-    
-    # Other avoided emissions
-    avoided_processing = quantity_kg * factors.get('waste_processing', 0)
-    avoided_transport = distance_km * factors.get('transportation', 0)
+    Every impact output is linear in quantity (and distance) before rounding
+    and the score clamp, so an impact is a few multiply-adds on these fields.
+    Missing factors are 0, as with the .get(..., 0) lookups they replace.
+    """
+    __slots__ = (
+        "production", "landfill_methane", "waste_processing", "transportation",
+        "water_factor", "waste_factor", "social_multiplier", "impact_weight", "lca_boundary",
+        "material_reuse", "lifetime_extension", "value_retention"
+    )
     
+    def __init__(self, category):
+        factor = EMISSION_FACTORS.get(category, {})
+        ghg = GHG_EMISSION_FACTORS.get(category, {})
+        circular = CIRCULARITY_FACTORS.get(category, {})
+        self.production = ghg.get('production', 0)
+        self.landfill_methane = ghg.get('landfill_methane', 0)
+        self.waste_processing = ghg.get('waste_processing', 0)
+        self.transportation = ghg.get('transportation', 0)
+        self.water_factor = factor.get("water_factor", 0)
+        self.waste_factor = factor.get("waste_factor", 0)
+        self.social_multiplier = factor.get("social_multiplier", 0)
+        self.impact_weight = factor.get("impact_weight", 0)
+        self.lca_boundary = factor.get("lca_boundary")
+        self.material_reuse = circular.get('material_reuse', 0)
+        self.lifetime_extension = circular.get('lifetime_extension', 0)
+        self.value_retention = circular.get('value_retention', 0)
+
+CATEGORY_COEFFICIENTS = {category: CategoryCoefficients(category) for category in EMISSION_FACTORS}
+NO_COEFFICIENTS = CategoryCoefficients(None)
+
+# IMPACT_CONFIG is read once per process rather than per score
+_SCORE_WEIGHTS = (
+    IMPACT_CONFIG["co2_weight"], IMPACT_CONFIG["water_weight"],
+    IMPACT_CONFIG["waste_weight"], IMPACT_CONFIG["social_weight"]
+)
+_BASE_MULTIPLIER = IMPACT_CONFIG["base_multiplier"]
+_MAX_QUANTITY_BONUS = IMPACT_CONFIG["max_quantity_bonus"]
+_DIMINISHING_RETURNS = IMPACT_CONFIG["diminishing_returns"]
+
+def ghg_impact_values(coeff, quantity_kg, distance_km):
+    """Rounded (co2, co2e, production, methane_co2e, processing, transport) in kg"""
+    avoided_production = quantity_kg * coeff.production
+    avoided_methane_co2e = quantity_kg * coeff.landfill_methane * 25  # Methane is 25x CO₂
+    avoided_processing = quantity_kg * coeff.waste_processing
+    avoided_transport = distance_km * coeff.transportation
     total_co2 = avoided_production + avoided_processing + avoided_transport
-    total_co2e = total_co2 + avoided_methane_co2e
-    
-    return {
-        'total_co2_saved_kg': round(total_co2, 2),
-        'total_co2e_saved_kg': round(total_co2e, 2),  # CO₂ equivalent
-        'ghg_breakdown': {
-            'avoided_production': round(avoided_production, 2),
-            'avoided_methane_co2e': round(avoided_methane_co2e, 2),
-            'avoided_processing': round(avoided_processing, 2),
-            'avoided_transport': round(avoided_transport, 2)
-        },
-        'compliance': 'GHG Protocol Scope 3',
-        'carbon_footprint_reduction': round(total_co2e, 2)
-    }
+    return (
+        round(total_co2, 2), round(total_co2 + avoided_methane_co2e, 2),
+        round(avoided_production, 2), round(avoided_methane_co2e, 2),
+        round(avoided_processing, 2), round(avoided_transport, 2)
+    )
 
-def calculate_impact_score(impact_data):
-    """Calculate comprehensive impact score with standards compliance"""
-    
-    category = impact_data["category"]
-    quantity = impact_data["quantity_kg"]
-    factor = EMISSION_FACTORS[category]
-    
-    # Get individual impact values
-    co2e_saved = impact_data["co2e_saved_kg"]
-    water_saved = impact_data["water_saved_l"]
-    waste_diverted = impact_data["waste_diverted_kg"]
-    social_value = impact_data["social_value"]
-    
-    logger.info(f"📊 Calculating STANDARDS-COMPLIANT score for {quantity}kg of {category}")
-    
-    # Calculate base scores with CO₂e
-    co2_score = min(co2e_saved * 8, 200)
-    water_score = min(water_saved * 0.15, 150)
-    waste_score = min(waste_diverted * 12, 150)
-    social_score = min(social_value * 0.15, 100)
-    
-    # Apply weights
+def calculate_ghg_compliant_impact(category, quantity_kg, distance_km=0):
+    """GHG Protocol compliant impact calculation"""
+    coeff = CATEGORY_COEFFICIENTS.get(category, NO_COEFFICIENTS)
+    return ghg_protocol_record(*ghg_impact_values(coeff, quantity_kg, distance_km))
+
+def score_impact(impact_weight, quantity, co2e_saved, water_saved, waste_diverted, social_value):
+    """Impact score from the rounded impact values (see calculate_impact_score)"""
+    co2_weight, water_weight, waste_weight, social_weight = _SCORE_WEIGHTS
     weighted_score = (
-        co2_score * IMPACT_CONFIG["co2_weight"] +
-        water_score * IMPACT_CONFIG["water_weight"] +
-        waste_score * IMPACT_CONFIG["waste_weight"] +
-        social_score * IMPACT_CONFIG["social_weight"]
+        min(co2e_saved * 8, 200) * co2_weight +
+        min(water_saved * 0.15, 150) * water_weight +
+        min(waste_diverted * 12, 150) * waste_weight +
+        min(social_value * 0.15, 100) * social_weight
     )
-    
-    # Apply category weight and base multiplier
-    category_weight = factor["impact_weight"]
-    final_score = weighted_score * category_weight * IMPACT_CONFIG["base_multiplier"]
+    final_score = weighted_score * impact_weight * _BASE_MULTIPLIER
     
     # Ensure reasonable minimum score
     if final_score < 15 and (co2e_saved > 0 or water_saved > 0 or waste_diverted > 0):
         final_score = max(15, final_score)
     
     # Diminishing returns quantity bonus
-    quantity_bonus = min(quantity * 3, IMPACT_CONFIG["max_quantity_bonus"])
+    quantity_bonus = min(quantity * 3, _MAX_QUANTITY_BONUS)
     if quantity > 5:
-        quantity_bonus *= IMPACT_CONFIG["diminishing_returns"]
+        quantity_bonus *= _DIMINISHING_RETURNS
     if quantity > 10:
-        quantity_bonus *= IMPACT_CONFIG["diminishing_returns"]
-    
-    final_score += quantity_bonus
-    final_score = max(15, min(800, round(final_score)))
+        quantity_bonus *= _DIMINISHING_RETURNS
     
-    logger.info(f"🎯 FINAL STANDARDS-COMPLIANT impact score: {final_score}")
+    return max(15, min(800, round(final_score + quantity_bonus)))
+
+def calculate_impact_score(impact_data):
+    """Calculate comprehensive impact score with standards compliance"""
+    category = impact_data["category"]
+    quantity = impact_data["quantity_kg"]
+    logger.debug("📊 Calculating STANDARDS-COMPLIANT score for %skg of %s", quantity, category)
     
+    final_score = score_impact(
+        CATEGORY_COEFFICIENTS[category].impact_weight, quantity, impact_data["co2e_saved_kg"],
+        impact_data["water_saved_l"], impact_data["waste_diverted_kg"], impact_data["social_value"]
+    )
+    logger.debug("🎯 FINAL STANDARDS-COMPLIANT impact score: %s", final_score)
     return final_score
 
 def get_impact_level(score):
@@ -325,29 +623,169 @@ def get_performance_rating(score):
     else:
         return "Developing 📈"
 
-def calculate_circular_economy_metrics(category, quantity_kg):
-    """Calculate circular economy benefits based on UNEP principles"""
-    circularity_factors = {
-        'Clothes': {'material_reuse': 0.85, 'lifetime_extension': 2.5, 'value_retention': 0.70},
-        'Electronics': {'material_reuse': 0.65, 'lifetime_extension': 3.0, 'value_retention': 0.60},
-        'Furniture': {'material_reuse': 0.90, 'lifetime_extension': 5.0, 'value_retention': 0.75},
-        'Food': {'material_reuse': 0.40, 'lifetime_extension': 0.5, 'value_retention': 0.30},
-        'Books': {'material_reuse': 0.95, 'lifetime_extension': 10.0, 'value_retention': 0.80}
+def get_score_band(score):
+    """Score distribution band used by the analytics dashboard"""
+    if score >= 600:
+        return "champion"   # 600-800
+    elif score >= 450:
+        return "warrior"    # 450-599
+    elif score >= 300:
+        return "guardian"   # 300-449
+    elif score >= 200:
+        return "protector"  # 200-299
+    elif score >= 100:
+        return "beginner"   # 100-199
+    else:
+        return "starter"    # 0-99
+
+def empty_impact_analytics():
+    """Fresh analytics aggregate with zeroed score bands"""
+    return {
+        "category_breakdown": {},
+        "score_distribution": {band: 0 for band in ("champion", "warrior", "guardian", "protector", "beginner", "starter")}
     }
+
+def accumulate_impact_analytics(analytics, impact_data):
+    """Fold one impact record into the per-category totals and score histogram"""
+    category = impact_data["category"]
+    totals = analytics["category_breakdown"].get(category)
+    if totals is None:
+        totals = analytics["category_breakdown"][category] = {
+            "count": 0,
+            "total_score": 0,
+            "total_co2": 0,
+            "total_co2e": 0,
+            "total_water": 0,
+            "total_waste": 0
+        }
     
-    factors = circularity_factors.get(category, {})
+    totals["count"] += 1
+    totals["total_score"] += impact_data["impact_score"]
+    totals["total_co2"] += impact_data["co2_saved_kg"]
+    totals["total_co2e"] += impact_data.get("co2e_saved_kg", impact_data["co2_saved_kg"])
+    totals["total_water"] += impact_data["water_saved_l"]
+    totals["total_waste"] += impact_data["waste_diverted_kg"]
+    analytics["score_distribution"][get_score_band(impact_data["impact_score"])] += 1
+
+def accumulate_impact_rollups(rollups, impacts):
+    """Fold impact records into the hour/day/month buckets.
     
-    return {
-        'material_circularity': round(quantity_kg * factors.get('material_reuse', 0), 2),
-        'lifetime_extension_years': factors.get('lifetime_extension', 0),
-        'value_retention_rate': factors.get('value_retention', 0),
-        'circular_economy_principles': [
-            "Design out waste and pollution",
-            "Keep products and materials in use", 
-            "Regenerate natural systems"
-        ],
-        'unep_alignment': "Circularity Gap Reporting Framework"
+    Touched buckets are copied, updated in record order (so float totals
+    match one-at-a-time updates) and swapped in, so a concurrent reader sees
+    each bucket either before or after the batch, never half-updated.
+    """
+    updated = {}
+    
+    def copied_bucket(granularity, bucket_key):
+        bucket = updated.get((granularity, bucket_key))
+        if bucket is None:
+            current = rollups[granularity].get(bucket_key, {})
+            bucket = updated[granularity, bucket_key] = {name: list(totals) for name, totals in current.items()}
+        return bucket
+    
+    # The hour key fixes the day and month keys too, so buckets are resolved once per hour
+    buckets_by_hour = {}
+    for impact_data in impacts:
+        created_at = impact_data["created_at"]
+        buckets = buckets_by_hour.get(created_at[:13])
+        if buckets is None:
+            buckets = buckets_by_hour[created_at[:13]] = [
+                copied_bucket(granularity, created_at[:key_length])
+                for granularity, key_length in ROLLUP_KEY_LENGTHS.items()
+            ]
+        category = impact_data["category"]
+        score = impact_data["impact_score"]
+        co2 = impact_data["co2_saved_kg"]
+        co2e = impact_data.get("co2e_saved_kg", co2)
+        water = impact_data["water_saved_l"]
+        waste = impact_data["waste_diverted_kg"]
+        social = impact_data["social_value"]
+        for bucket in buckets:
+            totals = bucket.get(category)
+            if totals is None:
+                totals = bucket[category] = [0, 0, 0, 0, 0, 0, 0]
+            totals[0] += 1
+            totals[1] += score
+            totals[2] += co2
+            totals[3] += co2e
+            totals[4] += water
+            totals[5] += waste
+            totals[6] += social
+    for (granularity, bucket_key), bucket in updated.items():
+        rollups[granularity][bucket_key] = bucket
+
+def top_impact_reports(limit, decode=None):
+    """Highest-scoring reports (ties in insertion order) without sorting the store"""
+    # One read of the global: a reset swaps in a new store with its own index,
+    # so positions always come from the store they index
+    store = impact_reports
+    positions = []
+    for bucket in reversed(store.score_index):
+        if len(positions) >= limit:
+            break
+        if bucket:
+            positions.extend(bucket[:limit - len(positions)])
+    return store.reports(positions, decode)
+
+def publish_aggregates():
+    """Publish a new immutable aggregate version (callers hold impact_write_lock)"""
+    global aggregate_snapshot
+    aggregate_snapshot = {
+        "version": aggregate_snapshot["version"] + 1,
+        "csr_summary": dict(csr_summary),
+        "category_breakdown": {
+            category: dict(totals) for category, totals in impact_analytics["category_breakdown"].items()
+        },
+        "score_distribution": dict(impact_analytics["score_distribution"])
     }
+    bump_state_version()
+
+def rebuild_impact_analytics(reports=None):
+    """Recompute the analytics aggregate from scratch by scanning every report"""
+    analytics = empty_impact_analytics()
+    if reports is None:
+        reports = (flat_impact(row) for row in storage.iter_rows())
+    for report in reports:
+        accumulate_impact_analytics(analytics, report)
+    return analytics
+
+def verify_impact_analytics(repair=False):
+    """Check the incremental aggregate against a full recompute, optionally repairing it"""
+    global impact_analytics
+    
+    # Writers must not append reports between the scan and the comparison or swap
+    with impact_write_lock:
+        expected = rebuild_impact_analytics()
+        consistent = expected == impact_analytics
+        if not consistent:
+            logger.warning("⚠️ Impact analytics drifted from report history%s", "; rebuilding" if repair else "")
+            if repair:
+                impact_analytics = expected
+                publish_aggregates()
+    return consistent
+
+def calculate_circular_economy_metrics(category, quantity_kg):
+    """Calculate circular economy benefits based on UNEP principles"""
+    coeff = CATEGORY_COEFFICIENTS.get(category, NO_COEFFICIENTS)
+    return circular_economy_record(coeff, round(quantity_kg * coeff.material_reuse, 2))
+
+def impact_values(category, quantity, distance_km):
+    """Every rounded number calculate_impact reports, as a tuple (memoisable)"""
+    coeff = CATEGORY_COEFFICIENTS[category]
+    ghg = ghg_impact_values(coeff, quantity, distance_km)
+    co2e = ghg[1]
+    water_saved = round(quantity * coeff.water_factor, 2)
+    waste_diverted = round(quantity * coeff.waste_factor, 2)
+    social_value = round(co2e * coeff.social_multiplier, 2)
+    material_circularity = round(quantity * coeff.material_reuse, 2)
+    score = score_impact(coeff.impact_weight, quantity, co2e, water_saved, waste_diverted, social_value)
+    return ghg, water_saved, waste_diverted, social_value, material_circularity, score
+
+# RECIRCLE_IMPACT_MEMO > 0 caches that many (category, quantity, distance)
+# results; typed, so 2 and 2.0 (which serialise differently) stay apart
+IMPACT_MEMO_SIZE = int(os.environ.get("RECIRCLE_IMPACT_MEMO", "0"))
+if IMPACT_MEMO_SIZE > 0:
+    impact_values = functools.lru_cache(maxsize=IMPACT_MEMO_SIZE, typed=True)(impact_values)
 
 def calculate_impact(transaction_data):
     """Calculate environmental impact with standards compliance"""
@@ -355,63 +793,48 @@ def calculate_impact(transaction_data):
     quantity = transaction_data['quantity_kg']
     distance_km = transaction_data.get('distance_km', 0)
     
-    if category not in EMISSION_FACTORS:
+    if category not in CATEGORY_COEFFICIENTS:
         category = "Food"
     
-    factor = EMISSION_FACTORS[category]
-    
-    # Calculate GHG Protocol compliant impacts
-    ghg_impact = calculate_ghg_compliant_impact(category, quantity, distance_km)
-    
-    # Calculate other impacts
-    water_saved = quantity * factor["water_factor"]
-    waste_diverted = quantity * factor["waste_factor"]
-    social_value = ghg_impact['total_co2e_saved_kg'] * factor["social_multiplier"]
+    impact_data = impact_record(impact_row(category, quantity, impact_values(category, quantity, distance_km)))
     
-    # Calculate circular economy metrics
-    circular_metrics = calculate_circular_economy_metrics(category, quantity)
-    
-    impact_data = {
-        "co2_saved_kg": ghg_impact['total_co2_saved_kg'],
-        "co2e_saved_kg": ghg_impact['total_co2e_saved_kg'],
-        "water_saved_l": round(water_saved, 2),
-        "waste_diverted_kg": round(waste_diverted, 2),
-        "social_value": round(social_value, 2),
-        "category": category,
-        "quantity_kg": quantity,
-        "carbon_footprint_reduction": ghg_impact['carbon_footprint_reduction'],
-        "compliance_standards": {
-            "ghg_protocol": ghg_impact,
-            "circular_economy": circular_metrics,
-            "iso_14040": {
-                "lca_boundary": factor["lca_boundary"],
-                "impact_categories": ["climate_change", "water_use", "resource_depletion"],
-                "data_quality": "industry_average"
-            }
-        }
-    }
-    
-    # Calculate impact score
-    impact_score = calculate_impact_score(impact_data)
-    impact_data["impact_score"] = impact_score
-    impact_data["impact_level"] = get_impact_level(impact_score)
-    
-    logger.info(f"🎯 Final standards-compliant impact data: {impact_data}")
+    logger.debug("🎯 Final standards-compliant impact data: %s", impact_data)
     
     return impact_data
 
+def calculate_impact_row(transaction_data, transaction_id, recorded_at):
+    """calculate_impact as a stored row (see ImpactReportStore.encode), for
+    projected responses that do not need the nested record built. The
+    quantity is kept as given, as calculate_impact reports it; the store
+    holds it as a double."""
+    category = transaction_data['category']
+    quantity = transaction_data['quantity_kg']
+    if category not in CATEGORY_COEFFICIENTS:
+        category = "Food"
+    
+    values = impact_values(category, quantity, transaction_data.get('distance_km', 0))
+    return impact_row(category, quantity, values, transaction_id, _epoch_us(recorded_at))
+
 def update_csr_summary(impact_data):
     """Update CSR summary with enhanced metrics"""
+    return update_csr_summary_batch([impact_data])
+
+def update_csr_summary_batch(impacts):
+    """Fold a batch of impact records into the CSR summary in a single update"""
     global csr_summary
     
     try:
-        csr_summary["total_co2_saved"] += impact_data["co2_saved_kg"]
-        csr_summary["total_co2e_saved"] += impact_data["co2e_saved_kg"]
-        csr_summary["total_water_saved"] += impact_data["water_saved_l"]
-        csr_summary["total_waste_diverted"] += impact_data["waste_diverted_kg"]
-        csr_summary["total_social_value"] += impact_data["social_value"]
-        csr_summary["total_impact_score"] += impact_data["impact_score"]
-        csr_summary["total_impacts"] = len(impact_reports)
+        # Accumulate in record order so totals match one-at-a-time updates exactly
+        accumulate_impact_rollups(impact_rollups, impacts)
+        for impact_data in impacts:
+            accumulate_impact_analytics(impact_analytics, impact_data)
+            csr_summary["total_co2_saved"] += impact_data["co2_saved_kg"]
+            csr_summary["total_co2e_saved"] += impact_data["co2e_saved_kg"]
+            csr_summary["total_water_saved"] += impact_data["water_saved_l"]
+            csr_summary["total_waste_diverted"] += impact_data["waste_diverted_kg"]
+            csr_summary["total_social_value"] += impact_data["social_value"]
+            csr_summary["total_impact_score"] += impact_data["impact_score"]
+        csr_summary["total_impacts"] += len(impacts)
         csr_summary["last_updated"] = datetime.now().strftime("%Y-%m-%d")
         
         if csr_summary["total_impacts"] > 0:
@@ -420,131 +843,1593 @@ def update_csr_summary(impact_data):
             csr_summary["average_impact_score"] = round(avg_score, 2)
             csr_summary["performance_rating"] = get_performance_rating(avg_score)
         
-        logger.info(f"✅ Enhanced CSR summary updated. Total CO₂e: {csr_summary['total_co2e_saved']}kg")
+        publish_aggregates()
+        logger.debug("✅ Enhanced CSR summary updated. Total CO₂e: %skg", csr_summary['total_co2e_saved'])
+        return True
+        
+    except Exception as e:
+        logger.error("❌ Error updating CSR summary: %s", e)
+        return False
+
+def record_impacts(impacts, now):
+    """Store impacts, fold them into the aggregates and queue them for /impact-stream"""
+    if shared_log_position is not None:
+        # Shared SQLite: this process's rows are folded with every other worker's, in id order
+        storage.add_impacts(impacts, now)
+        sync_shared_state()
+        return
+    with impact_write_lock:
+        rows = storage.add_impacts(impacts, now)
+        update_csr_summary_batch(impacts)
+        # Journal last: a snapshot taken here must see the aggregates with these rows
+        journal_append("impact", rows)
+    impact_stream.publish(impacts)
+
+def record_impact_rows(rows):
+    """record_impacts for rows from calculate_impact_row"""
+    if shared_log_position is not None:
+        storage.add_impact_rows(rows)
+        sync_shared_state()
+        return
+    impacts = [flat_impact(row) for row in rows]
+    with impact_write_lock:
+        storage.add_impact_rows(rows)
+        update_csr_summary_batch(impacts)
+        journal_append("impact", rows)
+    impact_stream.publish(impacts)
+
+def update_impact_row(row):
+    """update_impact_data for a row from calculate_impact_row"""
+    try:
+        record_impact_rows([row])
+        logger.info("✅ Impact data saved: %s | Score: %s", row[4], row[1])
         return True
         
     except Exception as e:
-        logger.error(f"❌ Error updating CSR summary: {e}")
+        logger.error("❌ Failed to save impact data: %s", e)
         return False
 
 def update_impact_data(transaction_id, impact_data):
-    """Store impact data in memory"""
-    global impact_reports, csr_summary
+    """Store impact data in the configured storage backend"""
+    global csr_summary
     
     try:
-        impact_data["calculated_at"] = datetime.now().isoformat()
+        now = datetime.now()
+        impact_data["calculated_at"] = now.isoformat()
         impact_data["transaction_id"] = transaction_id
-        impact_data["created_at"] = datetime.now().isoformat()
+        impact_data["created_at"] = now.isoformat()
+        
+        record_impacts([impact_data], now)
+        
+        logger.info("✅ Impact data saved: %s | Score: %s", transaction_id, impact_data['impact_score'])
+        return True
+        
+    except Exception as e:
+        logger.error("❌ Failed to save impact data: %s", e)
+        return False
+
+def reset_impact_state():
+    """Drop all impact reports and their aggregates"""
+    global impact_reports, csr_summary, impact_analytics, impact_rollups
+    impact_reports = ImpactReportStore()
+    impact_analytics = empty_impact_analytics()
+    impact_rollups = {granularity: {} for granularity in ROLLUP_KEY_LENGTHS}
+    csr_summary = {
+        "total_co2_saved": 0,
+        "total_co2e_saved": 0,
+        "total_water_saved": 0,
+        "total_waste_diverted": 0,
+        "total_social_value": 0,
+        "total_impact_score": 0,
+        "last_updated": datetime.now().strftime("%Y-%m-%d"),
+        "impact_level": "Getting Started 🚀",
+        "total_impacts": 0,
+        "average_impact_score": 0,
+        "performance_rating": "Developing 📈",
+        "compliance_standards": ["GHG Protocol", "ISO 14040", "UNEP Circular Economy"]
+    }
+    publish_aggregates()
+
+def update_impact_data_batch(impacts):
+    """Store a batch of impact records with one store and summary update"""
+    global csr_summary
+    
+    try:
+        now = datetime.now()
+        for impact_data in impacts:
+            impact_data["calculated_at"] = now.isoformat()
+            impact_data.setdefault("transaction_id", str(uuid.uuid4()))
+            impact_data["created_at"] = now.isoformat()
         
-        impact_reports.append(impact_data)
-        update_csr_summary(impact_data)
+        record_impacts(impacts, now)
         
-        logger.info(f"✅ Impact data saved: {transaction_id} | Score: {impact_data['impact_score']}")
+        logger.info("✅ Impact batch saved: %s records", len(impacts))
         return True
         
     except Exception as e:
-        logger.error(f"❌ Failed to save impact data: {e}")
+        logger.error("❌ Failed to save impact batch: %s", e)
         return False
 
+# ==================== BATCH IMPACT ENGINE ====================
+
+# Category codes index the precompiled coefficient columns below
+IMPACT_CATEGORIES = list(EMISSION_FACTORS)
+CATEGORY_CODES = {name: code for code, name in enumerate(IMPACT_CATEGORIES)}
+
+# One column per numeric CategoryCoefficients field, so the scalar and batch
+# engines read the same compiled coefficients
+IMPACT_COEFFICIENTS = {
+    name: np.array([getattr(CATEGORY_COEFFICIENTS[category], name) for category in IMPACT_CATEGORIES], dtype=np.float64)
+    for name in CategoryCoefficients.__slots__ if name != "lca_boundary"
+}
+
+def _round2(values):
+    """Vectorised round(x, 2) that reproduces Python's correctly rounded result"""
+    scaled = values * 100
+    rounded = np.round(scaled) / 100
+    # x * 100 can land on the wrong side of a .5 tie; defer those few to round()
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        idx = np.flatnonzero(near_tie)
+        rounded[idx] = [round(value, 2) for value in values[idx].tolist()]
+    return rounded
+
+def calculate_impact_columns(categories, quantities_kg, distances_km=None):
+    """Vectorised calculate_impact over arrays of category/quantity/distance"""
+    codes = np.array([CATEGORY_CODES.get(name, CATEGORY_CODES["Food"]) for name in categories], dtype=np.intp)
+    quantity = np.asarray(quantities_kg, dtype=np.float64)
+    if distances_km is None:
+        distance = np.zeros_like(quantity)
+    else:
+        distance = np.asarray(distances_km, dtype=np.float64)
+    
+    coeff = {name: column[codes] for name, column in IMPACT_COEFFICIENTS.items()}
+    
+    # GHG Protocol avoided emissions (same operation order as the scalar path)
+    avoided_production = quantity * coeff["production"]
+    avoided_methane_co2e = quantity * coeff["landfill_methane"] * 25
+    avoided_processing = quantity * coeff["waste_processing"]
+    avoided_transport = distance * coeff["transportation"]
+    total_co2 = avoided_production + avoided_processing + avoided_transport
+    total_co2e = total_co2 + avoided_methane_co2e
+    
+    co2e_saved = _round2(total_co2e)
+    water_saved = _round2(quantity * coeff["water_factor"])
+    waste_diverted = _round2(quantity * coeff["waste_factor"])
+    social_value = _round2(co2e_saved * coeff["social_multiplier"])
+    
+    # Impact score, mirroring score_impact
+    co2_weight, water_weight, waste_weight, social_weight = _SCORE_WEIGHTS
+    weighted_score = (
+        np.minimum(co2e_saved * 8, 200) * co2_weight +
+        np.minimum(water_saved * 0.15, 150) * water_weight +
+        np.minimum(waste_diverted * 12, 150) * waste_weight +
+        np.minimum(social_value * 0.15, 100) * social_weight
+    )
+    final_score = weighted_score * coeff["impact_weight"] * _BASE_MULTIPLIER
+    has_impact = (co2e_saved > 0) | (water_saved > 0) | (waste_diverted > 0)
+    final_score = np.where((final_score < 15) & has_impact, np.maximum(15, final_score), final_score)
+    
+    quantity_bonus = np.minimum(quantity * 3, _MAX_QUANTITY_BONUS)
+    quantity_bonus = np.where(quantity > 5, quantity_bonus * _DIMINISHING_RETURNS, quantity_bonus)
+    quantity_bonus = np.where(quantity > 10, quantity_bonus * _DIMINISHING_RETURNS, quantity_bonus)
+    impact_score = np.clip(np.rint(final_score + quantity_bonus), 15, 800).astype(np.int64)
+    
+    return {
+        "category_code": codes,
+        "quantity_kg": quantity,
+        "co2_saved_kg": _round2(total_co2),
+        "co2e_saved_kg": co2e_saved,
+        "water_saved_l": water_saved,
+        "waste_diverted_kg": waste_diverted,
+        "social_value": social_value,
+        "avoided_production": _round2(avoided_production),
+        "avoided_methane_co2e": _round2(avoided_methane_co2e),
+        "avoided_processing": _round2(avoided_processing),
+        "avoided_transport": _round2(avoided_transport),
+        "material_circularity": _round2(quantity * coeff["material_reuse"]),
+        "impact_score": impact_score
+    }
+
+def ghg_protocol_record(co2, co2e, production, methane, processing, transport):
+    return {
+        'total_co2_saved_kg': co2,
+        'total_co2e_saved_kg': co2e,  # CO₂ equivalent
+        'ghg_breakdown': {
+            'avoided_production': production,
+            'avoided_methane_co2e': methane,
+            'avoided_processing': processing,
+            'avoided_transport': transport
+        },
+        'compliance': 'GHG Protocol Scope 3',
+        'carbon_footprint_reduction': co2e
+    }
+
+def circular_economy_record(coeff, material_circularity):
+    return {
+        'material_circularity': material_circularity,
+        'lifetime_extension_years': coeff.lifetime_extension,
+        'value_retention_rate': coeff.value_retention,
+        'circular_economy_principles': CIRCULAR_ECONOMY_PRINCIPLES,
+        'unep_alignment': UNEP_ALIGNMENT
+    }
+
+def iso_14040_record(coeff):
+    return {
+        "lca_boundary": coeff.lca_boundary,
+        "impact_categories": ISO_14040_IMPACT_CATEGORIES,
+        "data_quality": "industry_average"
+    }
+
+def impact_record(row, select=True, stamped=False):
+    """The calculate_impact JSON shape from a row in the ImpactReportStore.encode layout.
+    
+    ``select`` is a field selection (see compile_projection); sub-objects it
+    leaves out are not built. ``stamped`` adds the stored report's
+    timestamps and transaction id.
+    """
+    (code, score, calculated_us, created_us, transaction_id, quantity, co2, co2e,
+     water, waste, social, production, methane, processing, transport, circularity) = row
+    record = {
+        "co2_saved_kg": co2,
+        "co2e_saved_kg": co2e,
+        "water_saved_l": water,
+        "waste_diverted_kg": waste,
+        "social_value": social,
+        "category": IMPACT_CATEGORIES[code],
+        "quantity_kg": quantity,
+        "carbon_footprint_reduction": co2e
+    }
+    standards = selected(select, "compliance_standards")
+    if standards is not None:
+        coeff = CATEGORY_COEFFICIENTS[IMPACT_CATEGORIES[code]]
+        record["compliance_standards"] = {}
+        if selected(standards, "ghg_protocol") is not None:
+            record["compliance_standards"]["ghg_protocol"] = ghg_protocol_record(
+                co2, co2e, production, methane, processing, transport
+            )
+        if selected(standards, "circular_economy") is not None:
+            record["compliance_standards"]["circular_economy"] = circular_economy_record(coeff, circularity)
+        if selected(standards, "iso_14040") is not None:
+            record["compliance_standards"]["iso_14040"] = iso_14040_record(coeff)
+    record["impact_score"] = score
+    record["impact_level"] = get_impact_level(score)
+    if stamped:
+        record["calculated_at"] = _isoformat_us(calculated_us)
+        record["transaction_id"] = transaction_id
+        record["created_at"] = _isoformat_us(created_us)
+    return record if select is True else pick(record, select)
+
+def impact_row(category, quantity, values, transaction_id=None, stamp=None):
+    """impact_values() output as a row in the ImpactReportStore.encode layout"""
+    ghg, water_saved, waste_diverted, social_value, material_circularity, impact_score = values
+    return [
+        CATEGORY_CODES[category], impact_score, stamp, stamp, transaction_id, quantity,
+        ghg[0], ghg[1], water_saved, waste_diverted, social_value, *ghg[2:], material_circularity
+    ]
+
+def calculate_impact_batch(categories, quantities_kg, distances_km=None):
+    """Calculate a batch of impacts, returning records shaped like calculate_impact"""
+    columns = calculate_impact_columns(categories, quantities_kg, distances_km)
+    # Rows in the stored layout; the stamp and transaction id slots stay empty
+    unset = itertools.repeat(None)
+    rows = zip(
+        columns["category_code"].tolist(), columns["impact_score"].tolist(), unset, unset, unset,
+        *(columns[name].tolist() for name in _NUMERIC_COLUMNS)
+    )
+    
+    impacts = [impact_record(row) for row in rows]
+    
+    logger.debug("🎯 Batch impact calculated for %s records", len(impacts))
+    return impacts
+
+# ==================== IMPACT REPORT STORE ====================
+
+_EPOCH = datetime(1970, 1, 1)
+_NUMERIC_COLUMNS = (
+    "quantity_kg", "co2_saved_kg", "co2e_saved_kg", "water_saved_l", "waste_diverted_kg",
+    "social_value", "avoided_production", "avoided_methane_co2e", "avoided_processing",
+    "avoided_transport", "material_circularity"
+)
+
+def _epoch_us(moment):
+    """Naive datetime -> integer microseconds since 1970-01-01 (exact round trip)"""
+    return (moment - _EPOCH) // timedelta(microseconds=1)
+
+def _isoformat_us(stamp):
+    """Inverse of _epoch_us, as an ISO 8601 string"""
+    return (_EPOCH + timedelta(microseconds=stamp)).isoformat()
+
+class ImpactReportStore:
+    """Struct-of-arrays store for impact reports.
+    
+    Numeric fields live in typed arrays, categories as small-int codes,
+    timestamps as epoch microseconds and transaction ids as 16 raw UUID bytes.
+    The static compliance text is shared, and the nested JSON shape is only
+    materialised when a report is read for serialisation.
+    """
+    
+    def __init__(self):
+        self.category_code = array('B')
+        self.impact_score = array('h')
+        self.calculated_at = array('q')
+        self.created_at = array('q')
+        self.transaction_uuid = bytearray()
+        # Transaction ids that are not canonical UUID strings, by position
+        self.transaction_ids = {}
+        for name in _NUMERIC_COLUMNS:
+            setattr(self, name, array('d'))
+        # Positions bucketed by integer impact score (scores are clamped to 15-800),
+        # for top_impact_reports; appended after the row, so every indexed position exists
+        self.score_index = [[] for _ in range(801)]
+    
+    def __len__(self):
+        return len(self.category_code)
+    
+    @staticmethod
+    def encode(impact_data, recorded_at):
+        """Flat row: [code, score, calculated_us, created_us, transaction_id, *numeric columns]"""
+        ghg = impact_data["compliance_standards"]["ghg_protocol"]["ghg_breakdown"]
+        circular = impact_data["compliance_standards"]["circular_economy"]
+        stamp = _epoch_us(recorded_at)
+        return [
+            CATEGORY_CODES[impact_data["category"]], int(impact_data["impact_score"]), stamp, stamp,
+            str(impact_data.get("transaction_id", "")), float(impact_data["quantity_kg"]),
+            impact_data["co2_saved_kg"], impact_data["co2e_saved_kg"], impact_data["water_saved_l"],
+            impact_data["waste_diverted_kg"], impact_data["social_value"], ghg["avoided_production"],
+            ghg["avoided_methane_co2e"], ghg["avoided_processing"], ghg["avoided_transport"],
+            circular["material_circularity"]
+        ]
+    
+    def append_row(self, row):
+        code, score, calculated_us, created_us, transaction_id = row[:5]
+        position = len(self)
+        
+        self.category_code.append(code)
+        self.impact_score.append(score)
+        self.calculated_at.append(calculated_us)
+        self.created_at.append(created_us)
+        for name, value in zip(_NUMERIC_COLUMNS, row[5:]):
+            getattr(self, name).append(value)
+        
+        try:
+            parsed = uuid.UUID(transaction_id)
+        except ValueError:
+            parsed = None
+        if parsed is None or str(parsed) != transaction_id:
+            self.transaction_ids[position] = transaction_id
+            self.transaction_uuid.extend(bytes(16))
+        else:
+            self.transaction_uuid.extend(parsed.bytes)
+        self.score_index[min(max(int(score), 0), 800)].append(position)
+    
+    def append(self, impact_data, recorded_at=None):
+        row = self.encode(impact_data, recorded_at or datetime.now())
+        self.append_row(row)
+        return row
+    
+    def extend(self, impacts, recorded_at=None):
+        recorded_at = recorded_at or datetime.now()
+        return [self.append(impact_data, recorded_at) for impact_data in impacts]
+    
+    def row(self, position):
+        return [
+            self.category_code[position], self.impact_score[position], self.calculated_at[position],
+            self.created_at[position], self.transaction_id(position), self.quantity_kg[position],
+            self.co2_saved_kg[position], self.co2e_saved_kg[position], self.water_saved_l[position],
+            self.waste_diverted_kg[position], self.social_value[position],
+            self.avoided_production[position], self.avoided_methane_co2e[position],
+            self.avoided_processing[position], self.avoided_transport[position],
+            self.material_circularity[position]
+        ]
+    
+    def state(self):
+        """Picklable column state for snapshots"""
+        columns = {name: getattr(self, name) for name in ("category_code", "impact_score", "calculated_at", "created_at") + _NUMERIC_COLUMNS}
+        return {"columns": columns, "transaction_uuid": bytes(self.transaction_uuid), "transaction_ids": self.transaction_ids}
+    
+    @classmethod
+    def from_state(cls, state):
+        store = cls()
+        for name, column in state["columns"].items():
+            setattr(store, name, column)
+        store.transaction_uuid = bytearray(state["transaction_uuid"])
+        store.transaction_ids = dict(state["transaction_ids"])
+        for position, score in enumerate(store.impact_score):
+            store.score_index[min(max(score, 0), 800)].append(position)
+        return store
+    
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self.materialize(position) for position in range(*key.indices(len(self)))]
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("impact report index out of range")
+        return self.materialize(key)
+    
+    def __iter__(self):
+        for position in range(len(self)):
+            yield self.materialize(position)
+    
+    def transaction_id(self, position):
+        if position in self.transaction_ids:
+            return self.transaction_ids[position]
+        return str(uuid.UUID(bytes=bytes(self.transaction_uuid[position * 16:position * 16 + 16])))
+    
+    def materialize(self, position):
+        """Rebuild the full JSON shape of one report"""
+        return self.record_from_row(self.row(position))
+    
+    def reports(self, positions, decode=None):
+        """Full reports at `positions`, or decode(row) for each when a decoder is given"""
+        decode = decode or self.record_from_row
+        return [decode(self.row(position)) for position in positions]
+    
+    @staticmethod
+    def record_from_row(row):
+        return impact_record(row, stamped=True)
+    
+    def iter_rows(self):
+        for position in range(len(self)):
+            yield self.row(position)
+    
+    def matching_positions(self, start, stop, categories=None, since_us=None, until_us=None):
+        """Positions in [start, stop) whose category code is in `categories` and whose
+        created_at lies in [since_us, until_us), read from the columns only"""
+        positions = range(start, stop)
+        if categories is not None:
+            codes = self.category_code
+            positions = [position for position in positions if codes[position] in categories]
+        if since_us is not None or until_us is not None:
+            created_at = self.created_at
+            low = -math.inf if since_us is None else since_us
+            high = math.inf if until_us is None else until_us
+            positions = [position for position in positions if low <= created_at[position] < high]
+        return positions
+    
+
+def flat_impact(row):
+    """Top-level numeric fields of a stored row, for aggregates without materialising"""
+    return {
+        "category": IMPACT_CATEGORIES[row[0]],
+        "impact_score": row[1],
+        "created_at": _isoformat_us(row[3]),
+        "transaction_id": row[4],
+        "quantity_kg": row[5],
+        "co2_saved_kg": row[6],
+        "co2e_saved_kg": row[7],
+        "water_saved_l": row[8],
+        "waste_diverted_kg": row[9],
+        "social_value": row[10]
+    }
+
+impact_reports = ImpactReportStore()
+
+# ==================== DURABLE STATE JOURNAL ====================
+
+# Set RECIRCLE_DATA_DIR to keep impact reports, CSR aggregates and sellers across restarts
+DATA_DIR = os.environ.get("RECIRCLE_DATA_DIR")
+SNAPSHOT_EVERY = int(os.environ.get("RECIRCLE_SNAPSHOT_EVERY", "100000"))
+JOURNAL_FSYNC_INTERVAL = float(os.environ.get("RECIRCLE_FSYNC_INTERVAL", "0.05"))
+journal = None
+
+def journal_append(kind, payloads):
+    """Append records to the journal (no-op when running memory-only)"""
+    if journal is None:
+        return
+    journal.append_many(kind, payloads)
+    if journal.records_since_snapshot >= SNAPSHOT_EVERY:
+        with impact_write_lock:
+            # Another writer may have snapshotted while this one waited
+            if journal.records_since_snapshot >= SNAPSHOT_EVERY:
+                snapshot_state()
+
+def snapshot_state():
+    """Persist reports, aggregates and sellers so startup can skip the journal history"""
+    started = time.time()
+    # Seller writes reach here holding only their stripe lock; the writer lock
+    # keeps impact writers from changing the columns and aggregates mid-pickle
+    with impact_write_lock:
+        journal.snapshot(lambda: {
+            "reports": impact_reports.state(),
+            "csr_summary": csr_summary,
+            "impact_analytics": impact_analytics,
+            "impact_rollups": impact_rollups,
+            # Sellers are replaced copy-on-write under their stripe locks, so each
+            # record is whole; copying here keeps the mapping stable while pickling
+            "sellers": dict(sellers)
+        })
+    logger.info("💾 Snapshot written at seq %s (%s reports) in %.2fs", journal.seq, len(impact_reports), time.time() - started)
+
+def replay_impact_rows(rows):
+    """Re-apply journaled impact rows to the store and aggregates without recalculating"""
+    for row in rows:
+        impact_reports.append_row(row)
+    flat = [flat_impact(row) for row in rows]
+    update_csr_summary_batch(flat)
+
+def restore_state():
+    """Load the latest snapshot, replay the journal tail and start journaling"""
+    global journal, impact_reports, csr_summary, impact_analytics, impact_rollups, sellers
+    
+    started = time.time()
+    journal = Journal(DATA_DIR, fsync_interval=JOURNAL_FSYNC_INTERVAL)
+    state, tail = journal.load()
+    
+    if state is not None:
+        impact_reports = ImpactReportStore.from_state(state["reports"])
+        csr_summary = state["csr_summary"]
+        impact_analytics = state["impact_analytics"]
+        if "impact_rollups" in state:
+            impact_rollups = state["impact_rollups"]
+        else:
+            # Snapshots written before rollups existed: bucket the stored reports once
+            accumulate_impact_rollups(impact_rollups, (flat_impact(row) for row in impact_reports.iter_rows()))
+        sellers = state["sellers"]
+        publish_aggregates()
+    
+    pending_rows = []
+    for kind, payload in tail:
+        if kind == "impact":
+            pending_rows.append(payload)
+            continue
+        if pending_rows:
+            replay_impact_rows(pending_rows)
+            pending_rows = []
+        if kind == "seller":
+            sellers[payload["id"]] = payload["data"]
+        elif kind == "reset":
+            reset_impact_state()
+    if pending_rows:
+        replay_impact_rows(pending_rows)
+    
+    journal.open()
+    atexit.register(close_journal)
+    logger.info("✅ Restored %s reports and %s sellers (%s journal records) in %.2fs",
+                len(impact_reports), len(sellers), len(tail), time.time() - started)
+    if journal.records_since_snapshot >= SNAPSHOT_EVERY:
+        snapshot_state()
+
+def close_journal():
+    global journal
+    with impact_write_lock:
+        if journal is not None:
+            snapshot_state()
+            journal.close()
+            journal = None
+
+# ==================== STORAGE BACKENDS ====================
+
+class MemoryStorage:
+    """In-process columnar storage (journaled to disk in "journal" mode)"""
+    
+    def __init__(self, name):
+        self.name = name
+    
+    def add_impacts(self, impacts, recorded_at):
+        return impact_reports.extend(impacts, recorded_at)
+    
+    def add_impact_rows(self, rows):
+        for row in rows:
+            impact_reports.append_row(row)
+    
+    def recent_reports(self, limit, decode=None):
+        store = impact_reports
+        start = -limit if limit < len(store) else 0
+        return store.reports(range(*slice(start, None).indices(len(store))), decode)
+    
+    def top_reports(self, limit, decode=None):
+        return top_impact_reports(limit, decode)
+    
+    def page_reports(self, cursor, limit, decode=None):
+        store = impact_reports
+        return store.reports(range(*slice(cursor, cursor + limit).indices(len(store))), decode)
+    
+    def iter_rows(self):
+        return impact_reports.iter_rows()
+    
+    def export_end(self):
+        return len(impact_reports)
+    
+    def export_rows(self, cursor, end, categories=None, since_us=None, until_us=None, chunk_size=1000):
+        """Chunks of (cursor after the row, row) for positions in [cursor, end) passing the filters"""
+        # A reset swaps in a new store; an export keeps reading the one it started on
+        store = impact_reports
+        for start in range(cursor, min(end, len(store)), chunk_size):
+            positions = store.matching_positions(start, min(start + chunk_size, end), categories, since_us, until_us)
+            if positions:
+                yield [(position + 1, store.row(position)) for position in positions]
+    
+    def reset(self):
+        journal_append("reset", [None])
+    
+    def seller_count(self):
+        return len(sellers)
+    
+    def seller_transaction(self):
+        # Per-seller stripe locks already serialise updates within the process
+        return contextlib.nullcontext()
+    
+    def get_seller(self, seller_id):
+        return sellers.get(seller_id)
+    
+    def save_seller(self, seller_id, seller_data):
+        sellers[seller_id] = seller_data
+        journal_append("seller", [{"id": seller_id, "data": seller_data}])
+
+# Storage mode is chosen at startup: local_memory (default), journal or sqlite
+STORAGE_MODE = os.environ.get("RECIRCLE_STORAGE", "journal" if DATA_DIR else "local_memory")
+SQLITE_PATH = os.environ.get("RECIRCLE_SQLITE_PATH", os.path.join(DATA_DIR or ".", "recircle.db"))
+
+# A SQLite database may be shared by several worker processes (see wsgi.py). Its
+# impact table is then the log each process folds into its own aggregates, in id
+# order, so every worker reports identical totals. (generation, last folded id)
+shared_log_position = None
+
+def init_storage():
+    """Create the configured storage backend and load aggregates from it"""
+    global shared_log_position
+    if STORAGE_MODE == "sqlite":
+        backend = SQLiteStorage(SQLITE_PATH, ImpactReportStore.encode, ImpactReportStore.record_from_row)
+        if backend.seller_count() == 0:
+            backend.save_sellers(sellers.items())
+        # Rebuild the in-memory aggregates from the table, in insertion order
+        generation, end = backend.log_position()
+        for chunk in backend.export_rows(0, end, chunk_size=10000):
+            update_csr_summary_batch([flat_impact(row) for _, row in chunk])
+        shared_log_position = (generation, end)
+        logger.info("✅ SQLite storage ready at %s (%s reports)", SQLITE_PATH, csr_summary["total_impacts"])
+        return backend
+    
+    if STORAGE_MODE == "journal":
+        if not DATA_DIR:
+            raise RuntimeError("RECIRCLE_STORAGE=journal requires RECIRCLE_DATA_DIR")
+        restore_state()
+    elif STORAGE_MODE != "local_memory":
+        raise RuntimeError(f"Unknown RECIRCLE_STORAGE mode: {STORAGE_MODE}")
+    return MemoryStorage(STORAGE_MODE)
+
+storage = init_storage()
+
+def sync_shared_state():
+    """Fold reports any process stored since the last sync into this process's
+    aggregates (no-op unless the storage is shared). Runs before every request."""
+    global shared_log_position
+    if shared_log_position is None or storage.log_position() == shared_log_position:
+        return
+    with impact_write_lock:
+        generation, last_id = shared_log_position
+        latest_generation, end = storage.log_position()
+        if latest_generation != generation:
+            reset_impact_state()
+            impact_stream.publish_reset()
+            last_id = 0
+        for chunk in storage.export_rows(last_id, end, chunk_size=10000):
+            flat = [flat_impact(row) for _, row in chunk]
+            update_csr_summary_batch(flat)
+            impact_stream.publish(flat)
+            last_id = chunk[-1][0]
+        shared_log_position = (latest_generation, last_id)
+
+app.before_request(sync_shared_state)
+
+# ==================== SENTIMENT CACHE ====================
+
+class SentimentCache:
+    """Bounded LRU of VADER compound scores keyed on whitespace-normalised sentences.
+    
+    VADER splits on whitespace and is case/punctuation sensitive, so only runs
+    of whitespace are collapsed; the cached compound is exactly what
+    the analyzer's polarity_scores would return. Both the entry count and an estimate of
+    the memory held are bounded.
+    """
+    
+    ENTRY_OVERHEAD = 120  # OrderedDict node + float, roughly
+    
+    def __init__(self, max_entries=50000, max_bytes=16 * 1024 * 1024, path=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.path = path
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+    
+    @staticmethod
+    def normalize(sentence):
+        return " ".join(sentence.split())
+    
+    def _entry_size(self, key):
+        return sys.getsizeof(key) + self.ENTRY_OVERHEAD
+    
+    def get(self, key):
+        with self.lock:
+            compound = self.entries.get(key)
+            if compound is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return compound
+    
+    def put(self, key, compound):
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                return
+            self.entries[key] = compound
+            self.bytes += self._entry_size(key)
+            while self.entries and (len(self.entries) > self.max_entries or self.bytes > self.max_bytes):
+                evicted, _ = self.entries.popitem(last=False)
+                self.bytes -= self._entry_size(evicted)
+                self.evictions += 1
+    
+    def compound(self, sentence):
+        key = self.normalize(sentence)
+        compound = self.get(key)
+        if compound is None:
+            compound = warm_sentiment().polarity_scores(sentence)['compound']
+            self.put(key, compound)
+        return compound
+    
+    def record(self, hits, misses):
+        """Count lookups made by another process's copy of the cache (pool workers)"""
+        with self.lock:
+            self.hits += hits
+            self.misses += misses
+    
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "approx_bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "persistent": self.path is not None
+        }
+    
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for key, compound in json.load(f):
+                    self.put(key, compound)
+            logger.info("✅ Loaded %s cached sentence scores from %s", len(self.entries), self.path)
+        except (OSError, ValueError) as exc:
+            logger.warning("⚠️ Ignoring unreadable sentiment cache %s: %s", self.path, exc)
+    
+    def save(self):
+        if not self.path:
+            return
+        with self.lock:
+            items = list(self.entries.items())
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"  # forked workers save concurrently
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(items, f, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+
+SENTIMENT_CACHE_PATH = os.environ.get(
+    "RECIRCLE_SENTIMENT_CACHE_PATH",
+    os.path.join(DATA_DIR, "sentiment_cache.json") if DATA_DIR else None
+)
+sentiment_cache = SentimentCache(
+    max_entries=int(os.environ.get("RECIRCLE_SENTIMENT_CACHE_SIZE", "50000")),
+    max_bytes=int(os.environ.get("RECIRCLE_SENTIMENT_CACHE_BYTES", str(16 * 1024 * 1024))),
+    path=SENTIMENT_CACHE_PATH
+)
+if SENTIMENT_CACHE_PATH:
+    sentiment_cache.load()
+    atexit.register(sentiment_cache.save)
+
 # ==================== SELLER TRUST FUNCTIONS ====================
 
+def score_sentences(sentences, compounds):
+    """Per-sentence trust rows and their weighted average from VADER compounds"""
+    total_score = 0
+    results = []
+
+    for sentence, compound in zip(sentences, compounds):
+        if compound >= 0.05:
+            label = "Positive"
+            trust_score = 80 + (compound * 20)
+            weight = 1.0
+        elif compound <= -0.05:
+            label = "Negative"
+            trust_score = max(0, 50 + (compound * 50))
+            weight = 1.5
+        else:
+            label = "Neutral"
+            trust_score = 50 + (compound * 10)
+            weight = 0.7
+
+        results.append({
+            "sentence": sentence.strip(),
+            "sentiment": label,
+            "compound": round(compound, 3),
+            "trust_score": round(trust_score, 2),
+            "weight": weight
+        })
+        total_score += trust_score * weight
+
+    total_weight = sum(r["weight"] for r in results)
+    avg_trust_score = round(total_score / total_weight, 2) if total_weight > 0 else 50.0
+    return results, avg_trust_score
+
+def has_review_text(review_text):
+    return bool(review_text and review_text.strip() and review_text.lower() != "no comment")
+
 def calculate_trust_score_paragraph(review_text):
     """Advanced sentence-level sentiment analysis for seller reviews"""
-    if not review_text or not review_text.strip() or review_text.lower() == "no comment":
+    if not has_review_text(review_text):
         return [], 50.0
 
     try:
-        sentences = sent_tokenize(review_text)
-        total_score = 0
-        results = []
-
-        for sentence in sentences:
-            sentiment = sia.polarity_scores(sentence)
-            compound = sentiment['compound']
-
-            if compound >= 0.05:
-                label = "Positive"
-                trust_score = 80 + (compound * 20)
-                weight = 1.0
-            elif compound <= -0.05:
-                label = "Negative"
-                trust_score = max(0, 50 + (compound * 50))
-                weight = 1.5
-            else:
-                label = "Neutral"
-                trust_score = 50 + (compound * 10)
-                weight = 0.7
-
-            results.append({
-                "sentence": sentence.strip(),
-                "sentiment": label,
-                "compound": round(compound, 3),
-                "trust_score": round(trust_score, 2),
-                "weight": weight
-            })
-            total_score += trust_score * weight
-
-        total_weight = sum(r["weight"] for r in results)
-        avg_trust_score = round(total_score / total_weight, 2) if total_weight > 0 else 50.0
-        return results, avg_trust_score
+        # Neither the fast-path split nor a cache hit needs NLTK; the analyzer
+        # (and punkt) are warmed by whichever of them first does
+        sentences = split_sentences(review_text)
+        return score_sentences(sentences, [sentiment_cache.compound(sentence) for sentence in sentences])
 
     except Exception as exc:
         logger.error("Error in sentence analysis: %s", exc)
         return [], 50.0
 
-def calculate_enhanced_trust_score(review_text, rating, delivery_experience, recommend):
-    """Calculate composite trust score from sentiment, rating, delivery, and recommendation"""
-    try:
-        sentence_analysis, sentiment_score = calculate_trust_score_paragraph(review_text)
+# Below this many sentences the NumPy setup of a batch costs more than it saves
+BATCH_SENTIMENT_MIN_SENTENCES = 16
 
-        try:
-            rating = float(rating)
-            rating_score = (max(1, min(5, rating)) / 5) * 100
-        except Exception:
-            rating_score = 50.0
-
-        delivery_lower = str(delivery_experience).lower().strip()
-        delivery_score = DELIVERY_MAP.get(delivery_lower, 60)
-
-        recommend_lower = str(recommend).lower().strip()
-        recommend_score = 100 if recommend_lower == "yes" else 40
-
-        trust_score = (
-            sentiment_score * WEIGHTS["sentiment"] +
-            rating_score * WEIGHTS["rating"] +
-            delivery_score * WEIGHTS["delivery"] +
-            recommend_score * WEIGHTS["recommend"]
-        )
+batch_sentiment_scorer = None
+batch_sentiment_lock = threading.Lock()
 
-        trust_score = max(0, min(100, trust_score))
+def get_batch_sentiment_scorer():
+    global batch_sentiment_scorer
+    analyzer = warm_sentiment()
+    with batch_sentiment_lock:
+        if batch_sentiment_scorer is None:
+            from vader_batch import BatchSentimentScorer
+            batch_sentiment_scorer = BatchSentimentScorer(analyzer)
+    return batch_sentiment_scorer
 
-        return {
-            "final_score": round(trust_score, 2),
-            "component_scores": {
-                "sentiment": round(sentiment_score, 2),
-                "rating": round(rating_score, 2),
-                "delivery": delivery_score,
-                "recommend": recommend_score
-            },
-            "sentence_analysis": sentence_analysis
-        }
+def calculate_trust_scores_batch(review_texts):
+    """calculate_trust_score_paragraph for a list of reviews.
+    
+    Sentences are looked up in sentiment_cache first; the misses of the batch
+    are scored in one vectorised VADER pass (see vader_batch.py) and cached.
+    Results are identical to scoring the reviews one by one.
+    """
+    outputs = [([], 50.0) for _ in review_texts]
+    try:
+        pending = [
+            (index, split_sentences(review_text))
+            for index, review_text in enumerate(review_texts)
+            if has_review_text(review_text)
+        ]
+        sentences = [sentence for _, review_sentences in pending for sentence in review_sentences]
+        keys = [sentiment_cache.normalize(sentence) for sentence in sentences]
+        compounds = [None] * len(sentences)
+        misses = {}  # normalised sentence -> one sentence to score for it
+        for position, key in enumerate(keys):
+            if key in misses:
+                continue
+            compounds[position] = sentiment_cache.get(key)
+            if compounds[position] is None:
+                misses[key] = sentences[position]
+        
+        if len(misses) < BATCH_SENTIMENT_MIN_SENTENCES:
+            scored = [warm_sentiment().polarity_scores(sentence)['compound'] for sentence in misses.values()]
+        else:
+            # polarity_scores rounds the compound to 4 places; match it exactly
+            scored = [round(compound, 4) for compound in get_batch_sentiment_scorer().compounds(list(misses.values()))]
+        scored = dict(zip(misses, scored))
+        for key, compound in scored.items():
+            sentiment_cache.put(key, compound)
+        compounds = [scored[key] if compound is None else compound for key, compound in zip(keys, compounds)]
+        
+        offset = 0
+        for index, review_sentences in pending:
+            outputs[index] = score_sentences(review_sentences, compounds[offset:offset + len(review_sentences)])
+            offset += len(review_sentences)
+    except Exception as exc:
+        logger.error("Error in batch sentence analysis: %s", exc)
+    return outputs
+
+def calculate_enhanced_trust_score(review_text, rating, delivery_experience, recommend):
+    """Calculate composite trust score from sentiment, rating, delivery, and recommendation"""
+    try:
+        sentence_analysis, sentiment_score = analyze_review_sentiment(review_text)
+        return combine_trust_components(sentence_analysis, sentiment_score, rating, delivery_experience, recommend)
 
     except Exception as exc:
         logger.error("Error in trust calculation: %s", exc)
         return {"final_score": 50.0, "component_scores": {}, "sentence_analysis": []}
 
+def combine_trust_components(sentence_analysis, sentiment_score, rating, delivery_experience, recommend):
+    """Weighted trust score from an already computed sentence analysis"""
+    try:
+        rating = float(rating)
+        rating_score = (max(1, min(5, rating)) / 5) * 100
+    except Exception:
+        rating_score = 50.0
+
+    delivery_lower = str(delivery_experience).lower().strip()
+    delivery_score = DELIVERY_MAP.get(delivery_lower, 60)
+
+    recommend_lower = str(recommend).lower().strip()
+    recommend_score = 100 if recommend_lower == "yes" else 40
+
+    trust_score = (
+        sentiment_score * WEIGHTS["sentiment"] +
+        rating_score * WEIGHTS["rating"] +
+        delivery_score * WEIGHTS["delivery"] +
+        recommend_score * WEIGHTS["recommend"]
+    )
+
+    trust_score = max(0, min(100, trust_score))
+
+    return {
+        "final_score": round(trust_score, 2),
+        "component_scores": {
+            "sentiment": round(sentiment_score, 2),
+            "rating": round(rating_score, 2),
+            "delivery": delivery_score,
+            "recommend": recommend_score
+        },
+        "sentence_analysis": sentence_analysis
+    }
+
 def update_seller_trust(seller_data, new_review_score, alpha=0.3):
     """EWMA update for seller trust score to avoid sharp swings"""
     old_score = seller_data.get("trustScore", 50.0)
     new_score = round(old_score * (1 - alpha) + new_review_score * alpha, 2)
-    logger.info("Trust score updated: %s -> %s", old_score, new_score)
+    logger.debug("Trust score updated: %s -> %s", old_score, new_score)
     return new_score
 
+def new_seller_record(seller_id, name=None):
+    now = datetime.now().isoformat()
+    return {
+        "name": name or f"Seller {seller_id}",
+        "trustScore": 50.0,
+        "totalReviews": 0,
+        "totalRating": 0,
+        "averageRating": 0.0,
+        "recommendedCount": 0,
+        "recommendRate": 0,
+        "createdAt": now,
+        "updatedAt": now
+    }
+
+def apply_review(seller, final_score, rating, recommend):
+    """Fold one scored review into a seller record: EWMA trust plus running stats"""
+    seller["trustScore"] = update_seller_trust(seller, final_score)
+
+    seller["totalReviews"] = seller.get("totalReviews", 0) + 1
+    seller["totalRating"] = seller.get("totalRating", 0) + float(rating)
+    if str(recommend).lower() == "yes":
+        seller["recommendedCount"] = seller.get("recommendedCount", 0) + 1
+
+    total_reviews = seller["totalReviews"]
+    recommended_count = seller.get("recommendedCount", 0)
+    seller["averageRating"] = round(seller["totalRating"] / total_reviews, 1)
+    seller["recommendRate"] = round((recommended_count / total_reviews) * 100) if total_reviews else 0
+    seller["updatedAt"] = datetime.now().isoformat()
+
+# ==================== SENTIMENT WORKER POOL ====================
+
+# RECIRCLE_SENTIMENT_WORKERS > 0 moves VADER scoring off the request threads into
+# forked worker processes; 0 (default) scores inline on the request thread
+SENTIMENT_WORKERS = int(os.environ.get("RECIRCLE_SENTIMENT_WORKERS", "0"))
+SENTIMENT_QUEUE_SIZE = int(os.environ.get("RECIRCLE_SENTIMENT_QUEUE", str(max(SENTIMENT_WORKERS, 1) * 16)))
+SENTIMENT_TIMEOUT = float(os.environ.get("RECIRCLE_SENTIMENT_TIMEOUT", "2.0"))
+
+sentiment_pool = None
+sentiment_slots = threading.BoundedSemaphore(SENTIMENT_QUEUE_SIZE)
+sentiment_pool_stats = {"submitted": 0, "completed": 0, "timeouts": 0, "rejected": 0, "errors": 0}
+sentiment_stats_lock = threading.Lock()
+
+def _count_sentiment(event):
+    with sentiment_stats_lock:
+        sentiment_pool_stats[event] += 1
+
+def start_sentiment_pool():
+    """Fork and pre-warm the workers; call before request threads start.
+    
+    The analyzer is built here in the parent, so forked workers inherit it warm
+    and no warmup thread can be holding nltk_lock at fork time.
+    """
+    global sentiment_pool
+    warm_sentiment()
+    sentiment_pool = ProcessPoolExecutor(
+        max_workers=SENTIMENT_WORKERS,
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=use_sync_logging
+    )
+    # Submitting one task per worker forces every process to start now
+    for future in [sentiment_pool.submit(len, "") for _ in range(SENTIMENT_WORKERS)]:
+        future.result()
+    atexit.register(sentiment_pool.shutdown, wait=False, cancel_futures=True)
+    logger.info("✅ Sentiment worker pool started with %s processes", SENTIMENT_WORKERS)
+
+def counted_sentiment_task(function, *args):
+    """Run function(*args) in a pool worker; returns its result with the worker
+    cache's hits and misses during the call (a worker runs one task at a time)"""
+    hits, misses = sentiment_cache.hits, sentiment_cache.misses
+    return function(*args), sentiment_cache.hits - hits, sentiment_cache.misses - misses
+
+def submit_sentiment_task(function, *args):
+    """Submit function(*args) to the pool. The future resolves to (result, hits,
+    misses); the counts are added to this process's sentiment_cache when it
+    completes, whether or not the caller is still waiting."""
+    future = sentiment_pool.submit(counted_sentiment_task, function, *args)
+    future.add_done_callback(_record_worker_cache_counts)
+    return future
+
+def _record_worker_cache_counts(future):
+    if not future.cancelled() and future.exception() is None:
+        _, hits, misses = future.result()
+        sentiment_cache.record(hits, misses)
+
+def analyze_review_sentiment(review_text):
+    """Sentence analysis for a review, in the worker pool when one is configured.
+    
+    Falls back to the neutral 50.0 score when the bounded queue stays full or a
+    worker does not answer within SENTIMENT_TIMEOUT seconds.
+    """
+    if sentiment_batcher is not None:
+        return sentiment_batcher.analyze(review_text)
+    if sentiment_pool is None:
+        return calculate_trust_score_paragraph(review_text)
+    
+    if not sentiment_slots.acquire(timeout=SENTIMENT_TIMEOUT):
+        _count_sentiment("rejected")
+        logger.warning("Sentiment queue full; using neutral score")
+        return [], 50.0
+    
+    try:
+        future = submit_sentiment_task(calculate_trust_score_paragraph, review_text)
+    except Exception as exc:
+        sentiment_slots.release()
+        _count_sentiment("errors")
+        logger.error("Sentiment pool submit failed: %s", exc)
+        return [], 50.0
+    
+    # The slot frees when the worker finishes, even if this caller gave up waiting
+    future.add_done_callback(lambda _: sentiment_slots.release())
+    _count_sentiment("submitted")
+    try:
+        result, _, _ = future.result(timeout=SENTIMENT_TIMEOUT)
+        _count_sentiment("completed")
+        return result
+    except FutureTimeoutError:
+        _count_sentiment("timeouts")
+        logger.warning("Sentiment scoring timed out after %ss; using neutral score", SENTIMENT_TIMEOUT)
+    except Exception as exc:
+        _count_sentiment("errors")
+        logger.error("Sentiment worker failed: %s", exc)
+    return [], 50.0
+
+def sentiment_pool_info():
+    with sentiment_stats_lock:
+        stats = dict(sentiment_pool_stats)
+    return {"workers": SENTIMENT_WORKERS if sentiment_pool else 0, "queue_size": SENTIMENT_QUEUE_SIZE,
+            "timeout_s": SENTIMENT_TIMEOUT, **stats}
+
+if SENTIMENT_WORKERS > 0:
+    start_sentiment_pool()
+elif NLTK_WARMUP == "background":
+    start_sentiment_warmup()
+
+# ==================== SENTIMENT MICRO-BATCHING ====================
+
+# RECIRCLE_SENTIMENT_BATCH_WINDOW_MS > 0 (off by default) makes concurrent
+# reviews share one calculate_trust_scores_batch call: a batch closes when
+# RECIRCLE_SENTIMENT_BATCH_MAX texts are queued or the window, counted from
+# its first text, has passed
+SENTIMENT_BATCH_WINDOW = float(os.environ.get("RECIRCLE_SENTIMENT_BATCH_WINDOW_MS", "0")) / 1000
+SENTIMENT_BATCH_MAX = int(os.environ.get("RECIRCLE_SENTIMENT_BATCH_MAX", "32"))
+
+# Upper bounds of the batch size histogram buckets reported on /health
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64)
+
+class SentimentBatcher:
+    def __init__(self, window, max_items):
+        self.window = window
+        self.max_items = max_items
+        self.pending = queue.SimpleQueue()
+        self.lock = threading.Lock()
+        self.batches = 0
+        self.items = 0
+        self.max_batch = 0
+        self.size_histogram = dict.fromkeys([f"<={bound}" for bound in BATCH_SIZE_BUCKETS] + ["more"], 0)
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.thread = threading.Thread(target=self._run, name="sentiment-batcher", daemon=True)
+        self.thread.start()
+    
+    def analyze(self, review_text):
+        """analyze_review_sentiment through the next batch; neutral 50.0 on timeout"""
+        if not has_review_text(review_text):
+            return [], 50.0
+        future = Future()
+        self.pending.put((time.perf_counter(), review_text, future))
+        try:
+            return future.result(timeout=SENTIMENT_TIMEOUT + self.window)
+        except FutureTimeoutError:
+            logger.warning("Batched sentiment scoring timed out; using neutral score")
+        except Exception as exc:
+            logger.error("Batched sentiment scoring failed: %s", exc)
+        return [], 50.0
+    
+    def _collect(self):
+        batch = [self.pending.get()]
+        deadline = batch[0][0] + self.window
+        while len(batch) < self.max_items:
+            remaining = deadline - time.perf_counter()
+            try:
+                batch.append(self.pending.get(timeout=remaining) if remaining > 0 else self.pending.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+    
+    def _score(self, texts):
+        if sentiment_pool is not None:
+            return submit_sentiment_task(calculate_trust_scores_batch, texts).result(timeout=SENTIMENT_TIMEOUT)[0]
+        return calculate_trust_scores_batch(texts)
+    
+    def _run(self):
+        while True:
+            batch = self._collect()
+            started = time.perf_counter()
+            try:
+                results = self._score([text for _, text, _ in batch])
+            except Exception as exc:
+                for _, _, future in batch:
+                    future.set_exception(exc)
+            else:
+                for (_, _, future), result in zip(batch, results):
+                    future.set_result(result)
+            self._record(batch, started)
+    
+    def _record(self, batch, started):
+        waits = [started - queued_at for queued_at, _, _ in batch]
+        size = len(batch)
+        bucket = next((f"<={bound}" for bound in BATCH_SIZE_BUCKETS if size <= bound), "more")
+        with self.lock:
+            self.batches += 1
+            self.items += size
+            self.max_batch = max(self.max_batch, size)
+            self.size_histogram[bucket] += 1
+            self.wait_seconds_total += sum(waits)
+            self.wait_seconds_max = max(self.wait_seconds_max, max(waits))
+    
+    def info(self):
+        with self.lock:
+            return {
+                "enabled": True,
+                "window_ms": round(self.window * 1000, 3),
+                "max_items": self.max_items,
+                "batches": self.batches,
+                "items": self.items,
+                "avg_batch_size": round(self.items / self.batches, 2) if self.batches else 0.0,
+                "max_batch_size": self.max_batch,
+                "batch_size_histogram": dict(self.size_histogram),
+                "avg_queue_wait_ms": round(self.wait_seconds_total / self.items * 1000, 3) if self.items else 0.0,
+                "max_queue_wait_ms": round(self.wait_seconds_max * 1000, 3)
+            }
+
+sentiment_batcher = SentimentBatcher(SENTIMENT_BATCH_WINDOW, SENTIMENT_BATCH_MAX) if SENTIMENT_BATCH_WINDOW > 0 else None
+
+# ==================== IMPACT STREAM ====================
+
+# Server-Sent Events behind /impact-stream:
+#   RECIRCLE_STREAM_COALESCE_MS   writes within this window go out as one delta (50)
+#   RECIRCLE_STREAM_BUFFER        frames queued per client before it is resynced (64)
+#   RECIRCLE_STREAM_MAX_CLIENTS   concurrent subscribers (1000)
+STREAM_COALESCE_SECONDS = float(os.environ.get("RECIRCLE_STREAM_COALESCE_MS", "50")) / 1000
+STREAM_BUFFER_FRAMES = int(os.environ.get("RECIRCLE_STREAM_BUFFER", "64"))
+STREAM_MAX_CLIENTS = int(os.environ.get("RECIRCLE_STREAM_MAX_CLIENTS", "1000"))
+STREAM_MAX_REPORTS = 50  # newest report summaries carried by one delta
+STREAM_HEARTBEAT_SECONDS = 15
+STREAM_SHARED_POLL_SECONDS = 0.1
+STREAM_SUMMARY_FIELDS = (
+    "total_impacts", "total_co2_saved", "total_co2e_saved", "total_water_saved", "total_waste_diverted",
+    "total_social_value", "total_impact_score", "average_impact_score", "impact_level", "performance_rating"
+)
+STREAM_REPORT_FIELDS = (
+    "transaction_id", "category", "quantity_kg", "impact_score", "co2e_saved_kg",
+    "water_saved_l", "waste_diverted_kg", "created_at"
+)
+
+def sse_frame(event, data, event_id=None):
+    """One encoded SSE event"""
+    prefix = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{prefix}event: {event}\ndata: ".encode("utf-8") + app.json.encode(data, "/impact-stream") + b"\n\n"
+
+def stream_totals():
+    summary = aggregate_snapshot["csr_summary"]
+    return {field: summary[field] for field in STREAM_SUMMARY_FIELDS}
+
+class StreamSubscriber:
+    """One dashboard connection: a bounded queue of encoded frames"""
+    
+    def __init__(self, buffer_frames):
+        self.frames = queue.Queue(buffer_frames)
+    
+    def offer(self, frame, resync_frame):
+        """Queue `frame`; a full buffer is dropped and replaced by `resync_frame`"""
+        try:
+            self.frames.put_nowait(frame)
+            return True
+        except queue.Full:
+            while True:
+                try:
+                    self.frames.get_nowait()
+                except queue.Empty:
+                    break
+            self.frames.put_nowait(resync_frame)
+            return False
+
+class ImpactStreamHub:
+    """Fans impact deltas out to /impact-stream subscribers.
+    
+    Writers only record what changed; one broadcaster thread waits
+    STREAM_COALESCE_SECONDS after the first pending write, folds everything
+    written meanwhile into a single delta (the newest report summaries plus
+    the absolute CSR totals), encodes it once and queues it on every
+    subscriber. A subscriber whose buffer is full has its backlog replaced by
+    a "resync" event, telling the dashboard to refetch full state; totals are
+    absolute and reports carry their transaction_id, so deltas applied on top
+    of a refetch are safe.
+    """
+    
+    def __init__(self):
+        self.subscribers = set()
+        self.pending_reports = deque(maxlen=STREAM_MAX_REPORTS)
+        self.pending_count = 0
+        self.pending_reset = False
+        self.condition = threading.Condition()
+        self.thread = None
+        self.broadcasts = 0
+        self.resyncs = 0
+        self.last_fanout_ms = 0.0
+    
+    # ---------- writers ----------
+    
+    def publish(self, impacts):
+        if not self.subscribers:
+            return
+        summaries = [
+            {field: impact_data.get(field) for field in STREAM_REPORT_FIELDS}
+            for impact_data in impacts[-STREAM_MAX_REPORTS:]
+        ]
+        with self.condition:
+            self.pending_reports.extend(summaries)
+            self.pending_count += len(impacts)
+            self.condition.notify()
+    
+    def publish_reset(self):
+        if not self.subscribers:
+            return
+        with self.condition:
+            self.pending_reports.clear()
+            self.pending_count = 0
+            self.pending_reset = True
+            self.condition.notify()
+    
+    # ---------- subscribers ----------
+    
+    def subscribe(self):
+        with self.condition:
+            if len(self.subscribers) >= STREAM_MAX_CLIENTS:
+                return None
+            subscriber = StreamSubscriber(STREAM_BUFFER_FRAMES)
+            self.subscribers.add(subscriber)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._broadcast_loop, name="impact-stream", daemon=True)
+                self.thread.start()
+        return subscriber
+    
+    def unsubscribe(self, subscriber):
+        with self.condition:
+            self.subscribers.discard(subscriber)
+    
+    # ---------- broadcasting ----------
+    
+    def _broadcast_loop(self):
+        while True:
+            with self.condition:
+                if not (self.pending_count or self.pending_reset):
+                    # With shared storage, other workers' writes only arrive by polling
+                    self.condition.wait(STREAM_SHARED_POLL_SECONDS if shared_log_position is not None else None)
+                ready = self.pending_count or self.pending_reset
+            if not ready:
+                if self.subscribers:
+                    sync_shared_state()
+                continue
+            # Let the rest of a burst land before taking the delta
+            time.sleep(STREAM_COALESCE_SECONDS)
+            with self.condition:
+                reports = list(self.pending_reports)
+                new_reports, reset = self.pending_count, self.pending_reset
+                self.pending_reports.clear()
+                self.pending_count = 0
+                self.pending_reset = False
+                subscribers = list(self.subscribers)
+            try:
+                self._fan_out(subscribers, reports, new_reports, reset)
+            except Exception as exc:
+                logger.error("❌ Impact stream broadcast failed: %s", exc)
+    
+    def _fan_out(self, subscribers, reports, new_reports, reset):
+        started = time.perf_counter()
+        version = state_version
+        totals = stream_totals()
+        resync_frame = sse_frame("resync", {"reason": "slow_consumer", "totals": totals}, version)
+        frames = []
+        if reset:
+            frames.append(sse_frame("reset", {"totals": totals}, version))
+        if new_reports:
+            frames.append(sse_frame("delta", {
+                "new_reports": new_reports,
+                "reports": reports,
+                "totals": totals,
+                "sent_at": time.time()
+            }, version))
+        for frame in frames:
+            for subscriber in subscribers:
+                if not subscriber.offer(frame, resync_frame):
+                    self.resyncs += 1
+        self.broadcasts += 1
+        self.last_fanout_ms = round((time.perf_counter() - started) * 1000, 3)
+    
+    def info(self):
+        return {
+            "subscribers": len(self.subscribers),
+            "broadcasts": self.broadcasts,
+            "resyncs": self.resyncs,
+            "last_fanout_ms": self.last_fanout_ms,
+            "coalesce_ms": STREAM_COALESCE_SECONDS * 1000,
+            "buffer_frames": STREAM_BUFFER_FRAMES
+        }
+
+impact_stream = ImpactStreamHub()
+
+# ==================== RESPONSE CACHE ====================
+
+class ResponseCache:
+    """Bounded LRU of serialised GET responses keyed on (path, query string).
+    
+    An entry is served while the state version it was built at is still
+    current (and, for routes with a max_age, while it is younger than that),
+    so repeated dashboard polls skip rebuilding and re-encoding the JSON.
+    ETags hash the body, which keeps them valid across restarts and between
+    worker processes.
+    """
+    
+    def __init__(self, max_entries=256, max_bytes=32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.route_stats = {}
+        self.lock = threading.Lock()
+    
+    def _count(self, route, outcome):
+        stats = self.route_stats.setdefault(route, {"hits": 0, "misses": 0, "not_modified": 0})
+        stats[outcome] += 1
+    
+    def get(self, key, version, max_age=None):
+        """(etag, body, mimetype) if a current entry exists, else None"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[0] != version or (max_age is not None and time.monotonic() - entry[1] > max_age):
+                self._count(key[0], "misses")
+                return None
+            self.entries.move_to_end(key)
+            self._count(key[0], "hits")
+            return entry[2:]
+    
+    def put(self, key, version, body, mimetype):
+        etag = hashlib.blake2b(body, digest_size=12).hexdigest()
+        with self.lock:
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= len(previous[3])
+            self.entries[key] = (version, time.monotonic(), etag, body, mimetype)
+            self.bytes += len(body)
+            while self.entries and (len(self.entries) > self.max_entries or self.bytes > self.max_bytes):
+                _, evicted = self.entries.popitem(last=False)
+                self.bytes -= len(evicted[3])
+        return etag, body, mimetype
+    
+    def not_modified(self, route):
+        with self.lock:
+            self._count(route, "not_modified")
+    
+    def stats(self):
+        with self.lock:
+            routes = {route: dict(stats) for route, stats in self.route_stats.items()}
+            entries, cached_bytes = len(self.entries), self.bytes
+        for stats in routes.values():
+            lookups = stats["hits"] + stats["misses"]
+            stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        return {"enabled": True, "entries": entries, "bytes": cached_bytes, "routes": routes}
+
+# RECIRCLE_RESPONSE_CACHE_SIZE=0 turns the cache off. /health carries a timestamp
+# and live counters, so its entries also expire after RECIRCLE_HEALTH_CACHE_SECONDS.
+RESPONSE_CACHE_SIZE = int(os.environ.get("RECIRCLE_RESPONSE_CACHE_SIZE", "256"))
+HEALTH_CACHE_SECONDS = float(os.environ.get("RECIRCLE_HEALTH_CACHE_SECONDS", "1.0"))
+response_cache = ResponseCache(
+    max_entries=RESPONSE_CACHE_SIZE,
+    max_bytes=int(os.environ.get("RECIRCLE_RESPONSE_CACHE_BYTES", str(32 * 1024 * 1024)))
+) if RESPONSE_CACHE_SIZE > 0 else None
+
+def cached_response(versioned=True, max_age=None):
+    """Serve a GET route from response_cache with a strong ETag and 304 revalidation.
+    
+    versioned=False is for routes whose output never changes. Only 200
+    responses are cached.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            if response_cache is None:
+                return view(*args, **kwargs)
+            version = state_version if versioned else 0
+            key = (request.path, request.query_string)
+            entry = response_cache.get(key, version, max_age)
+            if entry is None:
+                response = app.make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                entry = response_cache.put(key, version, response.get_data(), response.mimetype)
+            etag, body, mimetype = entry
+            if request.if_none_match.contains(etag):
+                response_cache.not_modified(request.path)
+                response = app.response_class(status=304)
+            else:
+                response = app.response_class(body, mimetype=mimetype)
+            response.set_etag(etag)
+            response.headers["Cache-Control"] = "no-cache"
+            return response
+        return wrapper
+    return decorator
+
+# ==================== RESPONSE PROJECTIONS ====================
+
+# ?view=slim and ?fields=a,b.c on /calculate-impact, /impact-reports and
+# /seller/<id>/review. The requested fields compile to a selection: a dict
+# from key to True (the whole value) or to the selection below that key.
+# Dotted fields select nested keys; a parent selects its whole subtree. The
+# response builders (impact_record, review_response) take the selection and
+# skip the sub-objects it leaves out.
+
+def selected(select, key):
+    """The selection below `key`: True for all of it, a dict for part, None to omit it"""
+    return True if select is True else select.get(key)
+
+def pick(document, select):
+    """`document` restricted to `select`, for values that were built whole"""
+    if select is True:
+        return document
+    return {key: pick(document[key], below) for key, below in select.items() if key in document}
+
+# Per-report values only; the standards text is on /standards-info
+IMPACT_SLIM_FIELDS = (
+    "transaction_id", "category", "quantity_kg", "co2_saved_kg", "co2e_saved_kg", "water_saved_l",
+    "waste_diverted_kg", "social_value", "impact_score", "impact_level", "created_at"
+)
+
+def review_response(review, select=True):
+    """The /seller/<id>/review response from the context add_review assembles"""
+    seller = review["seller"]
+    analysis = review["analysis"]
+    response = {"message": "Review submitted successfully!"}
+    if selected(select, "review") is not None:
+        response["review"] = {
+            "from": review["from_name"],
+            "product": review["product"],
+            "comment": review["review_text"],
+            "rating": str(review["rating"]),
+            "deliveryExperience": review["delivery_experience"],
+            "recommend": review["recommend"],
+            "score": analysis["final_score"],
+            "timestamp": review["timestamp"]
+        }
+    if selected(select, "seller") is not None:
+        response["seller"] = {
+            "id": review["seller_id"],
+            "name": seller["name"],
+            "trustScore": seller["trustScore"],
+            "totalReviews": seller["totalReviews"],
+            "averageRating": seller["averageRating"],
+            "recommendRate": seller["recommendRate"]
+        }
+    if selected(select, "trust_score_change") is not None:
+        response["trust_score_change"] = {
+            "old": review["old_trust_score"],
+            "new": seller["trustScore"],
+            "difference": round(seller["trustScore"] - review["old_trust_score"], 2)
+        }
+    if selected(select, "analysis") is not None:
+        response["analysis"] = {
+            "final_score": analysis["final_score"],
+            "component_scores": analysis["component_scores"],
+            "sentence_analysis": analysis["sentence_analysis"]
+        }
+    response["firebase_ready"] = True
+    response["backend_processed"] = True
+    return response if select is True else pick(response, select)
+
+# Everything but the per-sentence rows and the echoed review text
+REVIEW_SLIM_FIELDS = (
+    "message", "review.score", "seller", "trust_score_change", "analysis.final_score", "analysis.component_scores"
+)
+
+def document_fields(document, prefix=""):
+    """Every dotted field of a document"""
+    fields = []
+    for key, value in document.items():
+        fields.append(prefix + key)
+        if isinstance(value, dict):
+            fields.extend(document_fields(value, f"{prefix}{key}."))
+    return fields
+
+@functools.lru_cache(maxsize=None)
+def projectable_fields(kind):
+    """The dotted fields of a full `kind` document, read off one built from sample data"""
+    if kind == "impact":
+        category = IMPACT_CATEGORIES[0]
+        return tuple(document_fields(impact_record(
+            impact_row(category, 1.0, impact_values(category, 1.0, 0), "", 0), stamped=True
+        )))
+    return tuple(document_fields(review_response({
+        "from_name": "", "product": "", "review_text": "", "rating": 5, "delivery_experience": "average",
+        "recommend": "Yes", "timestamp": "", "seller_id": "", "seller": new_seller_record("", None),
+        "old_trust_score": 50.0, "analysis": combine_trust_components([], 50.0, 5, "average", "Yes")
+    })))
+
+@functools.lru_cache(maxsize=256)
+def compile_projection(kind, fields):
+    """The selection holding `fields` of a `kind` document; ValueError for unknown fields"""
+    valid = projectable_fields(kind)
+    unknown = [field for field in fields if field not in valid]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)} (valid: {', '.join(valid)})")
+    selection = {}
+    for field in fields:
+        *parents, last = field.split(".")
+        target = selection
+        for part in parents:
+            below = target.setdefault(part, {})
+            if below is True:
+                break  # the parent was already selected whole
+            target = below
+        else:
+            target[last] = True
+    return selection
+
+def requested_projection(kind, slim_fields):
+    """Projection for this request's ?fields= or ?view=slim; None for the full document"""
+    fields = request.args.get('fields', '').strip()
+    view = request.args.get('view', 'full')
+    if fields:
+        return compile_projection(kind, tuple(dict.fromkeys(field.strip() for field in fields.split(',') if field.strip())))
+    if view == 'slim':
+        return compile_projection(kind, slim_fields)
+    if view != 'full':
+        raise ValueError(f"view must be 'full' or 'slim', not {view!r}")
+    return None
+
 # ==================== UNIFIED ROUTES ====================
 
 @app.route('/', methods=['GET'])
 def root_status():
     """Unified health endpoint for both CSR analytics and trust engine"""
+    summary = aggregate_snapshot["csr_summary"]
     return jsonify({
         "status": "healthy",
         "service": "Recircle Unified Backend (Impact Analytics + Seller Trust)",
@@ -552,25 +2437,30 @@ def root_status():
         "version": "6.0.0",
         "modules": {
             "impact_analytics": {
-                "total_impacts": len(impact_reports),
-                "total_co2e_saved": csr_summary["total_co2e_saved"],
-                "average_score": csr_summary.get("average_impact_score", 0),
+                "total_impacts": summary["total_impacts"],
+                "total_co2e_saved": summary["total_co2e_saved"],
+                "average_score": summary.get("average_impact_score", 0),
                 "endpoints": [
                     "/calculate-impact", 
+                    "/calculate-impact/batch", 
                     "/csr-summary", 
                     "/impact-reports", 
+                    "/impact-reports/export",
                     "/impact-analytics", 
+                    "/impact-timeseries",
+                    "/impact-stream",
                     "/standards-info",
                     "/test-impact",
                     "/reset-data"
                 ]
             },
             "seller_trust": {
-                "tracked_sellers": len(sellers),
-                "sample_seller_trust": sellers.get("seller1", {}).get("trustScore", 0),
+                "tracked_sellers": storage.seller_count(),
+                "sample_seller_trust": (storage.get_seller("seller1") or {}).get("trustScore", 0),
                 "endpoints": [
                     "/seller/<id>", 
                     "/seller/<id>/review", 
+                    "/reviews/bulk",
                     "/test/review", 
                     "/ping"
                 ]
@@ -580,19 +2470,35 @@ def root_status():
         "carbon_accounting": "CO₂e (Carbon Dioxide Equivalent) - Includes all greenhouse gases"
     })
 
+PONG = JSONFragment({"message": "pong", "status": "ok"})
+
 @app.route('/ping', methods=['GET'])
 def ping():
-    return jsonify({"message": "pong", "status": "ok"})
+    return jsonify(PONG)
 
 @app.route('/health', methods=['GET'])
+@cached_response(max_age=HEALTH_CACHE_SECONDS)
 def health_check():
+    summary = aggregate_snapshot["csr_summary"]
     return jsonify({
         "status": "healthy",
         "service": "Recircle Unified Backend",
         "timestamp": datetime.now().isoformat(),
-        "impact_records": len(impact_reports),
-        "total_impact_score": csr_summary["total_impact_score"],
-        "tracked_sellers": len(sellers),
+        "impact_records": summary["total_impacts"],
+        "total_impact_score": summary["total_impact_score"],
+        "tracked_sellers": storage.seller_count(),
+        "storage": storage.name,
+        "worker_pid": os.getpid(),
+        "shared_log_position": shared_log_position,
+        # Hits and misses include pool workers' lookups; entries are this process's
+        "sentiment_cache": sentiment_cache.stats(),
+        "sentiment_workers": sentiment_pool_info(),
+        "sentiment_batching": sentiment_batcher.info() if sentiment_batcher else {"enabled": False},
+        "impact_memo": impact_values.cache_info()._asdict() if IMPACT_MEMO_SIZE > 0 else {"enabled": False},
+        "response_cache": response_cache.stats() if response_cache else {"enabled": False},
+        "impact_stream": impact_stream.info(),
+        "json": app.json.stats(),
+        "startup": {"import_seconds": IMPORT_SECONDS, "nltk": dict(nltk_status)},
         "compliance_standards": ["GHG Protocol", "ISO 14040", "UNEP Circular Economy"]
     })
 
@@ -605,9 +2511,14 @@ def calculate_impact_api():
         
     start_time = time.time()
     
+    try:
+        projection = requested_projection('impact', IMPACT_SLIM_FIELDS)
+    except ValueError as exc:
+        return jsonify({"status": "error", "message": str(exc)}), 400
+    
     try:
         data = request.get_json()
-        logger.info(f"📥 Received impact calculation request: {data}")
+        logger.debug("📥 Received impact calculation request: %s", data)
         
         if not data or 'category' not in data or 'quantity_kg' not in data:
             return jsonify({
@@ -624,14 +2535,22 @@ def calculate_impact_api():
         
         transaction_id = str(uuid.uuid4())
         
-        # Calculate impact with standards compliance
-        impact_data = calculate_impact(data)
-        impact_data["transaction_id"] = transaction_id
-        impact_data["created_at"] = datetime.now().isoformat()
-        
-        logger.info(f"📊 Final calculated impact: {impact_data}")
-        
-        storage_success = update_impact_data(transaction_id, impact_data)
+        if projection is None:
+            # Calculate impact with standards compliance
+            impact_data = calculate_impact(data)
+            impact_data["transaction_id"] = transaction_id
+            impact_data["created_at"] = datetime.now().isoformat()
+            
+            logger.debug("📊 Final calculated impact: %s", impact_data)
+            
+            storage_success = update_impact_data(transaction_id, impact_data)
+            impact_score = impact_data['impact_score']
+        else:
+            # Only the requested keys are built, straight from the stored row
+            row = calculate_impact_row(data, transaction_id, datetime.now())
+            storage_success = update_impact_row(row)
+            impact_data = impact_record(row, projection, stamped=True)
+            impact_score = row[1]
         processing_time = round(time.time() - start_time, 2)
         
         if storage_success:
@@ -639,9 +2558,9 @@ def calculate_impact_api():
                 "status": "success",
                 "transaction_id": transaction_id,
                 "impact": impact_data,
-                "message": f"Impact calculated successfully! Score: {impact_data['impact_score']}",
+                "message": f"Impact calculated successfully! Score: {impact_score}",
                 "processing_time": processing_time,
-                "storage": "local_memory",
+                "storage": storage.name,
                 "standards_compliant": True
             })
         else:
@@ -649,77 +2568,233 @@ def calculate_impact_api():
                 "status": "partial_success",
                 "transaction_id": transaction_id,
                 "impact": impact_data,
-                "message": f"Impact calculated but storage failed. Score: {impact_data['impact_score']}",
+                "message": f"Impact calculated but storage failed. Score: {impact_score}",
                 "processing_time": processing_time,
                 "storage": "calculation_only"
             })
         
     except Exception as e:
         processing_time = round(time.time() - start_time, 2)
-        logger.error(f"❌ Error in calculate-impact: {e}")
+        logger.error("❌ Error in calculate-impact: %s", e)
         return jsonify({
             "status": "error",
             "message": f"Calculation error: {str(e)}",
             "processing_time": processing_time
         }), 500
 
-@app.route('/csr-summary', methods=['GET'])
-def get_csr_summary():
+@app.route('/calculate-impact/batch', methods=['POST', 'OPTIONS'])
+def calculate_impact_batch_api():
+    """Calculate and store a whole donation manifest in one request"""
+    if request.method == 'OPTIONS':
+        return '', 200
+        
+    start_time = time.time()
+    
     try:
-        # Ensure all required fields
-        if "average_impact_score" not in csr_summary:
-            csr_summary["average_impact_score"] = 0
+        data = request.get_json()
+        
+        if not data or 'category' not in data or 'quantity_kg' not in data:
+            return jsonify({
+                "status": "error",
+                "message": "Missing required fields: category and quantity_kg"
+            }), 400
+        
+        categories = data['category']
+        quantities = data['quantity_kg']
+        distances = data.get('distance_km')
+        if not isinstance(categories, list) or not isinstance(quantities, list) or \
+                (distances is not None and not isinstance(distances, list)):
+            return jsonify({
+                "status": "error",
+                "message": "category, quantity_kg and distance_km must be arrays"
+            }), 400
+        
+        if len(categories) != len(quantities) or (distances is not None and len(distances) != len(quantities)):
+            return jsonify({
+                "status": "error",
+                "message": "category, quantity_kg and distance_km must have the same length"
+            }), 400
+        
+        try:
+            quantity_array = np.asarray(quantities, dtype=np.float64)
+            distance_array = None if distances is None else np.asarray(distances, dtype=np.float64)
+        except (TypeError, ValueError):
+            return jsonify({
+                "status": "error",
+                "message": "quantity_kg and distance_km must be numeric"
+            }), 400
         
-        if "total_impacts" not in csr_summary:
-            csr_summary["total_impacts"] = len(impact_reports)
+        invalid = np.flatnonzero(~(quantity_array > 0))
+        if invalid.size:
+            return jsonify({
+                "status": "error",
+                "message": f"Quantity must be greater than 0 (item {int(invalid[0])})"
+            }), 400
         
-        if "performance_rating" not in csr_summary:
-            csr_summary["performance_rating"] = get_performance_rating(csr_summary["average_impact_score"])
+        impacts = calculate_impact_batch(categories, quantity_array, distance_array)
+        storage_success = update_impact_data_batch(impacts)
+        processing_time = round(time.time() - start_time, 2)
         
-        if "total_co2e_saved" not in csr_summary:
-            csr_summary["total_co2e_saved"] = csr_summary["total_co2_saved"]
+        return jsonify({
+            "status": "success" if storage_success else "partial_success",
+            "count": len(impacts),
+            "transaction_ids": [impact_data["transaction_id"] for impact_data in impacts],
+            "impacts": impacts,
+            "total_impact_score": sum(impact_data["impact_score"] for impact_data in impacts),
+            "processing_time": processing_time,
+            "storage": storage.name if storage_success else "calculation_only",
+            "standards_compliant": True
+        })
         
-        logger.info(f"📋 Enhanced CSR Summary fetched: {csr_summary}")
+    except Exception as e:
+        processing_time = round(time.time() - start_time, 2)
+        logger.error("❌ Error in calculate-impact/batch: %s", e)
+        return jsonify({
+            "status": "error",
+            "message": f"Calculation error: {str(e)}",
+            "processing_time": processing_time
+        }), 500
+
+@app.route('/csr-summary', methods=['GET'])
+@cached_response()
+def get_csr_summary():
+    try:
+        # Published aggregate versions are complete and never mutated
+        summary = aggregate_snapshot["csr_summary"]
+        
+        logger.debug("📋 Enhanced CSR Summary fetched: %s", summary)
         return jsonify({
             "status": "success", 
-            "data": csr_summary,
-            "storage": "local_memory",
+            "data": summary,
+            "storage": storage.name,
             "standards": ["GHG Protocol", "ISO 14040", "UNEP Circular Economy"]
         })
     except Exception as e:
-        logger.error(f"❌ Error fetching CSR summary: {e}")
+        logger.error("❌ Error fetching CSR summary: %s", e)
         return jsonify({
             "status": "error",
             "message": str(e)
         }), 500
 
 @app.route('/impact-reports', methods=['GET'])
+@cached_response()
 def get_impact_reports():
+    try:
+        projection = requested_projection('impact', IMPACT_SLIM_FIELDS)
+    except ValueError as exc:
+        return jsonify({"status": "error", "message": str(exc)}), 400
+    
     try:
         limit = request.args.get('limit', 50, type=int)
-        reports = impact_reports[-limit:] if limit < len(impact_reports) else impact_reports
-        reports.sort(key=lambda x: x.get('impact_score', 0), reverse=True)
+        cursor = request.args.get('cursor', type=int)
+        total_records = aggregate_snapshot["csr_summary"]["total_impacts"]
+        page = {}
+        # Projected responses read raw rows, ordered on the score column, and
+        # build only the requested keys
+        decode = None if projection is None else tuple
         
-        logger.info(f"📊 Fetched {len(reports)} impact reports")
+        if cursor is not None:
+            # Insertion-ordered paging: the cursor is the position of the next report
+            cursor = max(cursor, 0)
+            reports = storage.page_reports(cursor, max(limit, 0), decode)
+            next_cursor = cursor + len(reports)
+            page = {"cursor": cursor, "next_cursor": next_cursor if next_cursor < total_records else None}
+        elif request.args.get('sort') == 'score':
+            reports = storage.top_reports(max(limit, 0), decode)
+        elif projection is None:
+            reports = sorted(storage.recent_reports(limit), key=lambda x: x.get('impact_score', 0), reverse=True)
+        else:
+            reports = sorted(storage.recent_reports(limit, decode), key=operator.itemgetter(1), reverse=True)
+        
+        if projection is not None:
+            reports = [impact_record(row, projection, stamped=True) for row in reports]
+        logger.debug("📊 Fetched %s impact reports", len(reports))
         return jsonify({
             "status": "success", 
             "data": reports,
-            "storage": "local_memory",
-            "total_records": len(impact_reports)
+            "storage": storage.name,
+            "total_records": total_records,
+            **page
         })
     except Exception as e:
-        logger.error(f"❌ Error fetching impact reports: {e}")
+        logger.error("❌ Error fetching impact reports: %s", e)
         return jsonify({
             "status": "error",
             "message": str(e),
             "data": []
         }), 500
 
+EXPORT_CHUNK_ROWS = 250  # ~1MB of NDJSON; reports serialise to ~4.5KB each
+
+@app.route('/impact-reports/export', methods=['GET'])
+def export_impact_reports():
+    """Stream impact reports as NDJSON, oldest first.
+    
+    Query: cursor (resume point, default 0), since/until (ISO timestamps on
+    created_at, until exclusive), category (comma-separated names). Every line
+    is a report plus "cursor", the value to resume after it; X-Export-End is
+    the cursor covering the whole export, since reports stored after the
+    export started are left for the next one. Reports are read and encoded
+    EXPORT_CHUNK_ROWS at a time, gzip'd when the client accepts it.
+    """
+    try:
+        cursor = max(request.args.get('cursor', 0, type=int), 0)
+        since = parse_review_timestamp(request.args.get('since'), None)
+        until = parse_review_timestamp(request.args.get('until'), None)
+        categories = None
+        if request.args.get('category'):
+            names = [name.strip() for name in request.args['category'].split(',') if name.strip()]
+            unknown = [name for name in names if name not in CATEGORY_CODES]
+            if unknown:
+                raise ValueError(f"unknown category {', '.join(unknown)}")
+            categories = {CATEGORY_CODES[name] for name in names}
+    except ValueError as e:
+        return jsonify({
+            "status": "error",
+            "message": f"Invalid export parameters: {e}"
+        }), 400
+    
+    end = storage.export_end()
+    compress = request.args.get('compress') == 'gzip' or 'gzip' in request.accept_encodings
+    chunks = storage.export_rows(
+        cursor, end, categories,
+        None if since is None else _epoch_us(since),
+        None if until is None else _epoch_us(until),
+        EXPORT_CHUNK_ROWS
+    )
+    
+    def generate():
+        # Sync-flushing every chunk keeps gzip from holding back the first bytes
+        encoder = zlib.compressobj(wbits=31) if compress else None
+        for chunk in chunks:
+            lines = []
+            for next_cursor, row in chunk:
+                record = ImpactReportStore.record_from_row(row)
+                record["cursor"] = next_cursor
+                lines.append(app.json.encode(record, "/impact-reports/export"))
+            lines.append(b"")
+            data = b"\n".join(lines)
+            yield encoder.compress(data) + encoder.flush(zlib.Z_SYNC_FLUSH) if encoder else data
+        if encoder:
+            yield encoder.flush()
+    
+    logger.debug("📤 Exporting impact reports %s..%s", cursor, end)
+    response = app.response_class(generate(), mimetype="application/x-ndjson")
+    response.headers["X-Export-End"] = str(end)
+    if compress:
+        response.headers["Content-Encoding"] = "gzip"
+        response.headers["Vary"] = "Accept-Encoding"
+    return response
+
 @app.route('/impact-analytics', methods=['GET'])
+@cached_response()
 def get_impact_analytics():
     """Get enhanced impact analytics with standards compliance"""
     try:
-        if not impact_reports:
+        # One snapshot reference gives a consistent total/average/breakdown triple
+        snapshot = aggregate_snapshot
+        summary = snapshot["csr_summary"]
+        if not summary["total_impacts"]:
             return jsonify({
                 "status": "success",
                 "data": {
@@ -732,72 +2807,30 @@ def get_impact_analytics():
                 }
             })
         
-        # Enhanced category breakdown with CO₂e
+        # Averages come from the running per-category totals, O(categories)
         category_breakdown = {}
-        for report in impact_reports:
-            category = report["category"]
-            if category not in category_breakdown:
-                category_breakdown[category] = {
-                    "count": 0,
-                    "total_score": 0,
-                    "total_co2": 0,
-                    "total_co2e": 0,
-                    "total_water": 0,
-                    "total_waste": 0
-                }
-            
-            category_breakdown[category]["count"] += 1
-            category_breakdown[category]["total_score"] += report["impact_score"]
-            category_breakdown[category]["total_co2"] += report["co2_saved_kg"]
-            category_breakdown[category]["total_co2e"] += report.get("co2e_saved_kg", report["co2_saved_kg"])
-            category_breakdown[category]["total_water"] += report["water_saved_l"]
-            category_breakdown[category]["total_waste"] += report["waste_diverted_kg"]
-        
-        # Calculate averages
-        for category in category_breakdown:
-            data = category_breakdown[category]
+        for category, totals in snapshot["category_breakdown"].items():
+            data = dict(totals)
             data["average_score"] = round(data["total_score"] / data["count"], 2)
             data["average_co2"] = round(data["total_co2"] / data["count"], 2)
             data["average_co2e"] = round(data["total_co2e"] / data["count"], 2)
             data["average_water"] = round(data["total_water"] / data["count"], 2)
             data["average_waste"] = round(data["total_waste"] / data["count"], 2)
+            category_breakdown[category] = data
         
-        # Score distribution
-        score_ranges = {
-            "champion": 0,  # 600-800
-            "warrior": 0,   # 450-599
-            "guardian": 0,  # 300-449
-            "protector": 0, # 200-299
-            "beginner": 0,  # 100-199
-            "starter": 0    # 0-99
-        }
-        
-        for report in impact_reports:
-            score = report["impact_score"]
-            if score >= 600:
-                score_ranges["champion"] += 1
-            elif score >= 450:
-                score_ranges["warrior"] += 1
-            elif score >= 300:
-                score_ranges["guardian"] += 1
-            elif score >= 200:
-                score_ranges["protector"] += 1
-            elif score >= 100:
-                score_ranges["beginner"] += 1
-            else:
-                score_ranges["starter"] += 1
+        score_ranges = snapshot["score_distribution"]
         
         analytics_data = {
-            "total_impacts": len(impact_reports),
-            "average_score": round(csr_summary["total_impact_score"] / len(impact_reports), 2),
-            "impact_level": csr_summary["impact_level"],
+            "total_impacts": summary["total_impacts"],
+            "average_score": round(summary["total_impact_score"] / summary["total_impacts"], 2),
+            "impact_level": summary["impact_level"],
             "category_breakdown": category_breakdown,
             "score_distribution": score_ranges,
-            "total_co2_saved": csr_summary["total_co2_saved"],
-            "total_co2e_saved": csr_summary["total_co2e_saved"],
-            "total_water_saved": csr_summary["total_water_saved"],
-            "total_waste_diverted": csr_summary["total_waste_diverted"],
-            "total_social_value": csr_summary["total_social_value"],
+            "total_co2_saved": summary["total_co2_saved"],
+            "total_co2e_saved": summary["total_co2e_saved"],
+            "total_water_saved": summary["total_water_saved"],
+            "total_waste_diverted": summary["total_waste_diverted"],
+            "total_social_value": summary["total_social_value"],
             "compliance_standards": ["GHG Protocol", "ISO 14040", "UNEP Circular Economy"],
             "carbon_accounting": "CO₂e (Carbon Dioxide Equivalent) - Includes all greenhouse gases"
         }
@@ -808,43 +2841,170 @@ def get_impact_analytics():
         })
         
     except Exception as e:
-        logger.error(f"❌ Error fetching analytics: {e}")
+        logger.error("❌ Error fetching analytics: %s", e)
         return jsonify({
             "status": "error",
             "message": str(e)
         }), 500
 
-@app.route('/standards-info', methods=['GET'])
-def get_standards_info():
-    """Get information about compliance standards"""
+TIMESERIES_DEFAULT_BUCKETS = {"hour": 48, "day": 30, "month": 12}
+TIMESERIES_MAX_BUCKETS = 5000
+
+def rollup_periods(granularity, start, end):
+    """Bucket keys from the bucket holding `start` through the one holding `end`"""
+    if granularity == "month":
+        year, month = start.year, start.month
+        while (year, month) <= (end.year, end.month):
+            yield f"{year:04d}-{month:02d}"
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return
+    moment = start.replace(minute=0, second=0, microsecond=0)
+    step = timedelta(hours=1)
+    if granularity == "day":
+        moment = moment.replace(hour=0)
+        step = timedelta(days=1)
+    while moment <= end:
+        yield moment.isoformat()[:ROLLUP_KEY_LENGTHS[granularity]]
+        moment += step
+
+def default_series_start(granularity, end):
+    """Start of the TIMESERIES_DEFAULT_BUCKETS-long range ending at `end`"""
+    count = TIMESERIES_DEFAULT_BUCKETS[granularity]
+    if granularity == "month":
+        months = end.year * 12 + end.month - count
+        return datetime(months // 12, months % 12 + 1, 1)
+    return end - (timedelta(hours=count - 1) if granularity == "hour" else timedelta(days=count - 1))
+
+def rollup_totals(totals):
+    return {
+        name: round(value, 2) if isinstance(value, float) else value
+        for name, value in zip(ROLLUP_FIELDS, totals)
+    }
+
+@app.route('/impact-timeseries', methods=['GET'])
+@cached_response(max_age=60)  # default ranges end "now"
+def get_impact_timeseries():
+    """Impact totals per hour/day/month bucket, read from the rollups in O(buckets).
+    
+    Query: granularity (hour, day or month; default day), from/to (ISO
+    timestamps; both buckets included, defaulting to the last 48 hours,
+    30 days or 12 months) and category (comma-separated names). Every bucket
+    in the range is listed, zero-filled when empty.
+    """
+    try:
+        granularity = request.args.get('granularity', 'day')
+        if granularity not in ROLLUP_KEY_LENGTHS:
+            raise ValueError("granularity must be hour, day or month")
+        end = parse_review_timestamp(request.args.get('to'), datetime.now())
+        start = parse_review_timestamp(request.args.get('from'), None) or default_series_start(granularity, end)
+        if start > end:
+            raise ValueError("from is after to")
+        categories = None
+        if request.args.get('category'):
+            categories = [name.strip() for name in request.args['category'].split(',') if name.strip()]
+            unknown = [name for name in categories if name not in CATEGORY_CODES]
+            if unknown:
+                raise ValueError(f"unknown category {', '.join(unknown)}")
+        periods = list(itertools.islice(rollup_periods(granularity, start, end), TIMESERIES_MAX_BUCKETS + 1))
+        if len(periods) > TIMESERIES_MAX_BUCKETS:
+            raise ValueError(f"range spans more than {TIMESERIES_MAX_BUCKETS} {granularity} buckets")
+    except ValueError as e:
+        return jsonify({
+            "status": "error",
+            "message": f"Invalid timeseries query: {e}"
+        }), 400
+    
+    buckets = impact_rollups[granularity]
+    series = []
+    overall = [0] * len(ROLLUP_FIELDS)
+    for period in periods:
+        bucket = buckets.get(period, {})
+        period_totals = [0] * len(ROLLUP_FIELDS)
+        by_category = {}
+        for category, totals in bucket.items():
+            if categories is not None and category not in categories:
+                continue
+            by_category[category] = rollup_totals(totals)
+            for index, value in enumerate(totals):
+                period_totals[index] += value
+        for index, value in enumerate(period_totals):
+            overall[index] += value
+        series.append({"period": period, **rollup_totals(period_totals), "by_category": by_category})
+    
     return jsonify({
         "status": "success",
-        "standards": {
-            "ghg_protocol": {
-                "name": "Greenhouse Gas Protocol",
-                "purpose": "Standardized greenhouse gas accounting",
-                "implementation": "Scope 3 avoided emissions calculation",
-                "metrics": ["CO₂", "CO₂e", "Carbon Footprint"]
-            },
-            "iso_14040": {
-                "name": "ISO 14040 Life Cycle Assessment",
-                "purpose": "Environmental impact assessment throughout product lifecycle", 
-                "implementation": "Simplified LCA with cradle-to-grave boundary",
-                "metrics": ["Global Warming Potential", "Water Use", "Resource Depletion"]
-            },
-            "circular_economy": {
-                "name": "UNEP Circular Economy Principles", 
-                "purpose": "Transition from linear to circular economic models",
-                "implementation": "Material circularity and waste prevention metrics",
-                "principles": [
-                    "Design out waste and pollution",
-                    "Keep products and materials in use",
-                    "Regenerate natural systems"
-                ]
-            }
+        "data": {
+            "granularity": granularity,
+            "from": periods[0],
+            "to": periods[-1],
+            "categories": categories or IMPACT_CATEGORIES,
+            "series": series,
+            "totals": rollup_totals(overall)
         }
     })
 
+@app.route('/impact-stream', methods=['GET'])
+def impact_stream_events():
+    """Server-Sent Events: a "totals" event on connect, then "delta" events with
+    new report summaries and CSR totals, "reset" after /reset-data and
+    "resync" when this client fell too far behind (refetch full state)"""
+    subscriber = impact_stream.subscribe()
+    if subscriber is None:
+        return jsonify({
+            "status": "error",
+            "message": "Too many impact stream subscribers"
+        }), 503
+    
+    def generate():
+        try:
+            yield b"retry: 3000\n\n" + sse_frame("totals", {"totals": stream_totals()}, state_version)
+            while True:
+                try:
+                    yield subscriber.frames.get(timeout=STREAM_HEARTBEAT_SECONDS)
+                except queue.Empty:
+                    yield b": keep-alive\n\n"
+        finally:
+            impact_stream.unsubscribe(subscriber)
+    
+    response = app.response_class(generate(), mimetype="text/event-stream")
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
+
+STANDARDS_INFO = JSONFragment({
+    "status": "success",
+    "standards": {
+        "ghg_protocol": {
+            "name": "Greenhouse Gas Protocol",
+            "purpose": "Standardized greenhouse gas accounting",
+            "implementation": "Scope 3 avoided emissions calculation",
+            "metrics": ["CO₂", "CO₂e", "Carbon Footprint"]
+        },
+        "iso_14040": {
+            "name": "ISO 14040 Life Cycle Assessment",
+            "purpose": "Environmental impact assessment throughout product lifecycle", 
+            "implementation": "Simplified LCA with cradle-to-grave boundary",
+            "metrics": ["Global Warming Potential", "Water Use", "Resource Depletion"]
+        },
+        "circular_economy": {
+            "name": "UNEP Circular Economy Principles", 
+            "purpose": "Transition from linear to circular economic models",
+            "implementation": "Material circularity and waste prevention metrics",
+            "principles": [
+                "Design out waste and pollution",
+                "Keep products and materials in use",
+                "Regenerate natural systems"
+            ]
+        }
+    }
+})
+
+@app.route('/standards-info', methods=['GET'])
+@cached_response(versioned=False)
+def get_standards_info():
+    """Get information about compliance standards"""
+    return jsonify(STANDARDS_INFO)
+
 @app.route('/test-impact', methods=['GET'])
 def test_impact_calculation():
     """Test impact calculation with sample data"""
@@ -873,22 +3033,15 @@ def test_impact_calculation():
 @app.route('/reset-data', methods=['POST'])
 def reset_data():
     """Reset all data"""
-    global impact_reports, csr_summary
-    impact_reports = []
-    csr_summary = {
-        "total_co2_saved": 0,
-        "total_co2e_saved": 0,
-        "total_water_saved": 0,
-        "total_waste_diverted": 0,
-        "total_social_value": 0,
-        "total_impact_score": 0,
-        "last_updated": datetime.now().strftime("%Y-%m-%d"),
-        "impact_level": "Getting Started 🚀",
-        "total_impacts": 0,
-        "average_impact_score": 0,
-        "performance_rating": "Developing 📈",
-        "compliance_standards": ["GHG Protocol", "ISO 14040", "UNEP Circular Economy"]
-    }
+    global shared_log_position
+    with impact_write_lock:
+        reset_impact_state()
+        generation = storage.reset()
+        if shared_log_position is not None:
+            # Reports other workers store from now on belong to the new generation
+            shared_log_position = (generation, 0)
+        bump_state_version()
+    impact_stream.publish_reset()
     return jsonify({
         "status": "success",
         "message": "All impact data reset successfully"
@@ -898,7 +3051,7 @@ def reset_data():
 
 @app.route('/seller/<seller_id>', methods=['GET'])
 def get_seller(seller_id):
-    seller_data = sellers.get(seller_id)
+    seller_data = storage.get_seller(seller_id)
     if seller_data:
         return jsonify({
             "id": seller_id,
@@ -920,6 +3073,11 @@ def add_review(seller_id):
     if request.method == 'OPTIONS':
         return jsonify({"status": "ok"}), 200
 
+    try:
+        projection = requested_projection('review', REVIEW_SLIM_FIELDS)
+    except ValueError as exc:
+        return jsonify({"status": "error", "message": str(exc)}), 400
+
     try:
         data = request.get_json() or {}
         review_text = str(data.get("review", "")).strip()
@@ -934,67 +3092,31 @@ def add_review(seller_id):
         if not review_text and data.get("allowEmptyReview", False) is False:
             logger.warning("Review text missing for seller %s", seller_id)
 
-        if seller_id not in sellers:
-            sellers[seller_id] = {
-                "name": data.get("sellerName", f"Seller {seller_id}"),
-                "trustScore": 50.0,
-                "totalReviews": 0,
-                "totalRating": 0,
-                "averageRating": 0.0,
-                "recommendedCount": 0,
-                "recommendRate": 0,
-                "createdAt": datetime.now().isoformat(),
-                "updatedAt": datetime.now().isoformat()
-            }
-
+        # Sentiment scoring is the slow part and needs no seller state, so it runs unlocked
         enhanced_analysis = calculate_enhanced_trust_score(review_text, rating, delivery_experience, recommend)
         final_score = enhanced_analysis["final_score"]
 
-        old_trust_score = sellers[seller_id]["trustScore"]
-        sellers[seller_id]["trustScore"] = update_seller_trust(sellers[seller_id], final_score)
-
-        sellers[seller_id]["totalReviews"] = sellers[seller_id].get("totalReviews", 0) + 1
-        sellers[seller_id]["totalRating"] = sellers[seller_id].get("totalRating", 0) + float(rating)
-        if recommend.lower() == "yes":
-            sellers[seller_id]["recommendedCount"] = sellers[seller_id].get("recommendedCount", 0) + 1
-
-        total_reviews = sellers[seller_id]["totalReviews"]
-        total_rating = sellers[seller_id]["totalRating"]
-        recommended_count = sellers[seller_id].get("recommendedCount", 0)
-
-        sellers[seller_id]["averageRating"] = round(total_rating / total_reviews, 1)
-        sellers[seller_id]["recommendRate"] = round((recommended_count / total_reviews) * 100) if total_reviews else 0
-        sellers[seller_id]["updatedAt"] = datetime.now().isoformat()
-
-        response_data = {
-            "message": "Review submitted successfully!",
-            "review": {
-                "from": from_name,
-                "product": product,
-                "comment": review_text,
-                "rating": str(rating),
-                "deliveryExperience": delivery_experience,
-                "recommend": recommend,
-                "score": final_score,
-                "timestamp": timestamp
-            },
-            "seller": {
-                "id": seller_id,
-                "name": sellers[seller_id]["name"],
-                "trustScore": sellers[seller_id]["trustScore"],
-                "totalReviews": total_reviews,
-                "averageRating": sellers[seller_id]["averageRating"],
-                "recommendRate": sellers[seller_id]["recommendRate"]
-            },
-            "trust_score_change": {
-                "old": old_trust_score,
-                "new": sellers[seller_id]["trustScore"],
-                "difference": round(sellers[seller_id]["trustScore"] - old_trust_score, 2)
-            },
-            "analysis": enhanced_analysis,
-            "firebase_ready": True,
-            "backend_processed": True
-        }
+        with seller_lock(seller_id), storage.seller_transaction():
+            # Copy-on-write: readers always see either the old or the new seller record
+            seller = dict(storage.get_seller(seller_id) or new_seller_record(seller_id, data.get("sellerName")))
+            old_trust_score = seller["trustScore"]
+            apply_review(seller, final_score, rating, recommend)
+            storage.save_seller(seller_id, seller)
+            bump_state_version()
+
+        response_data = review_response({
+            "from_name": from_name,
+            "product": product,
+            "review_text": review_text,
+            "rating": rating,
+            "delivery_experience": delivery_experience,
+            "recommend": recommend,
+            "timestamp": timestamp,
+            "seller_id": seller_id,
+            "seller": seller,
+            "old_trust_score": old_trust_score,
+            "analysis": enhanced_analysis
+        }, projection or True)
 
         return jsonify(response_data), 200
 
@@ -1005,6 +3127,123 @@ def add_review(seller_id):
             "firebase_project": "sellerreviewapp1"
         }), 500
 
+# Reviews are scored this many at a time through calculate_trust_scores_batch
+BULK_REVIEW_BATCH_SIZE = int(os.environ.get("RECIRCLE_BULK_REVIEW_BATCH", "2000"))
+BULK_REVIEW_MAX_ERRORS = 20
+
+def _bulk_review_items():
+    """Reviews from an NDJSON body (one per line) or JSON ({"reviews": [...]} or a bare list)"""
+    if request.mimetype in ("application/x-ndjson", "application/jsonl"):
+        for line in request.get_data().splitlines():
+            if line.strip():
+                yield json.loads(line)
+        return
+    data = request.get_json(silent=True)
+    items = data.get("reviews") if isinstance(data, dict) else data
+    if not isinstance(items, list):
+        raise ValueError('Body must be NDJSON, a JSON list of reviews or {"reviews": [...]}')
+    yield from items
+
+def parse_review_timestamp(value, default):
+    if value in (None, ""):
+        return default
+    moment = datetime.fromisoformat(str(value))
+    if moment.tzinfo is not None:
+        moment = moment.astimezone().replace(tzinfo=None)
+    return moment
+
+@app.route('/reviews/bulk', methods=['POST', 'OPTIONS'])
+def add_reviews_bulk():
+    """Ingest reviews for many sellers in one call.
+    
+    Each review takes the add_review fields plus "seller_id". Sentiment is
+    scored in batches, then every seller's reviews are applied in timestamp
+    order (input order for ties or missing timestamps) under that seller's
+    lock. Invalid reviews are skipped and reported; the response summarises
+    each seller instead of returning a full analysis per review.
+    """
+    if request.method == 'OPTIONS':
+        return jsonify({"status": "ok"}), 200
+
+    start_time = time.time()
+    received_at = datetime.now()
+    reviews = []
+    errors = []
+    rejected = 0
+
+    try:
+        for index, item in enumerate(_bulk_review_items()):
+            try:
+                if not isinstance(item, dict):
+                    raise ValueError("review must be an object")
+                seller_id = str(item.get("seller_id") or item.get("sellerId") or "").strip()
+                if not seller_id:
+                    raise ValueError("seller_id is required")
+                rating = float(item.get("rating", 5))
+                timestamp = parse_review_timestamp(item.get("timestamp"), received_at)
+            except (TypeError, ValueError) as exc:
+                rejected += 1
+                if len(errors) < BULK_REVIEW_MAX_ERRORS:
+                    errors.append({"index": index, "error": str(exc)})
+                continue
+            delivery_source = item.get("delivery", item.get("deliveryExperience", "average"))
+            reviews.append((
+                timestamp, index, seller_id, str(item.get("review", "")).strip(), rating,
+                str(delivery_source or "average").strip(), str(item.get("recommend", "Yes")).strip(),
+                item.get("sellerName")
+            ))
+    except ValueError as exc:
+        return jsonify({"status": "error", "message": f"Invalid bulk review body: {exc}"}), 400
+
+    try:
+        final_scores = []
+        for batch_start in range(0, len(reviews), BULK_REVIEW_BATCH_SIZE):
+            batch = reviews[batch_start:batch_start + BULK_REVIEW_BATCH_SIZE]
+            sentiments = calculate_trust_scores_batch([review[3] for review in batch])
+            for review, (sentence_analysis, sentiment_score) in zip(batch, sentiments):
+                final_scores.append(combine_trust_components(
+                    sentence_analysis, sentiment_score, review[4], review[5], review[6]
+                )["final_score"])
+
+        by_seller = {}
+        for review, final_score in zip(reviews, final_scores):
+            by_seller.setdefault(review[2], []).append((review, final_score))
+
+        summary = {}
+        for seller_id, seller_reviews in by_seller.items():
+            seller_reviews.sort(key=lambda entry: (entry[0][0], entry[0][1]))
+            with seller_lock(seller_id), storage.seller_transaction():
+                seller = dict(storage.get_seller(seller_id) or new_seller_record(seller_id, seller_reviews[0][0][7]))
+                old_trust_score = seller["trustScore"]
+                for review, final_score in seller_reviews:
+                    apply_review(seller, final_score, review[4], review[6])
+                storage.save_seller(seller_id, seller)
+                bump_state_version()
+            summary[seller_id] = {
+                "reviews": len(seller_reviews),
+                "trustScore": seller["trustScore"],
+                "trust_score_change": round(seller["trustScore"] - old_trust_score, 2),
+                "totalReviews": seller["totalReviews"],
+                "averageRating": seller["averageRating"],
+                "recommendRate": seller["recommendRate"]
+            }
+
+        elapsed = time.time() - start_time
+        logger.info("✅ Bulk ingested %s reviews for %s sellers in %.2fs", len(reviews), len(summary), elapsed)
+        return jsonify({
+            "status": "success",
+            "received": len(reviews) + rejected,
+            "applied": len(reviews),
+            "rejected": rejected,
+            "errors": errors,
+            "sellers": summary,
+            "processing_time_ms": round(elapsed * 1000, 2)
+        }), 200
+
+    except Exception as exc:
+        logger.exception("Error processing bulk reviews")
+        return jsonify({"status": "error", "message": f"Failed to ingest reviews: {exc}"}), 500
+
 @app.route('/test/review', methods=['POST'])
 def test_review():
     test_data = {
@@ -1042,13 +3281,32 @@ def setup_ngrok():
     try:
         ngrok.set_auth_token("33OsHeqH8e4mh8586xKsMXOppWA_42E2C5a6KhToQ88wKVkGU")
         public_url = ngrok.connect(5000, bind_tls=True)
-        logger.info(f"✅ Ngrok tunnel created: {public_url}")
+        logger.info("✅ Ngrok tunnel created: %s", public_url)
         atexit.register(lambda: ngrok.disconnect(public_url.public_url))
         return public_url
     except Exception as e:
-        logger.error(f"❌ Ngrok setup failed: {e}")
+        logger.error("❌ Ngrok setup failed: %s", e)
         return None
 
+def after_fork():
+    """Reinitialise per-process state in a pre-forked worker (see wsgi.py).
+    
+    Threads and SQLite handles do not survive fork: logging writes directly,
+    the storage reopens its connections, and the micro-batcher and stream hub
+    are recreated. A sentiment pool forked by the parent is dropped; the
+    workers themselves are the process parallelism.
+    """
+    global sentiment_pool, sentiment_batcher, impact_stream
+    use_sync_logging()
+    if hasattr(storage, "after_fork"):
+        storage.after_fork()
+    sentiment_pool = None
+    if sentiment_batcher is not None:
+        sentiment_batcher = SentimentBatcher(SENTIMENT_BATCH_WINDOW, SENTIMENT_BATCH_MAX)
+    impact_stream = ImpactStreamHub()
+
+IMPORT_SECONDS = round(time.perf_counter() - _import_started, 3)
+
 if __name__ == '__main__':
     ngrok_tunnel = setup_ngrok()
     
@@ -1056,7 +3314,8 @@ if __name__ == '__main__':
     print("🚀 Starting Recircle UNIFIED Backend Server")
     print("="*60)
     print("🔧 Port: 5000")
-    print("💾 Storage: Local Memory")
+    print(f"💾 Storage: {storage.name}")
+    print(f"🧠 NLTK: {NLTK_WARMUP} warmup{' (offline)' if NLTK_OFFLINE else ''}")
     print("📊 MODULES:")
     print("   ✅ Impact Analytics - GHG Protocol + ISO 14040 + Circular Economy")
     print("   ✅ Seller Trust - NLTK VADER sentiment + delivery heuristics")
@@ -1070,13 +3329,19 @@ if __name__ == '__main__':
     print("="*60)
     print("📈 IMPACT ANALYTICS ENDPOINTS:")
     print("   POST /calculate-impact - Calculate environmental impact")
+    print("   POST /calculate-impact/batch - Calculate a batch of impacts")
     print("   GET  /csr-summary - Get CSR summary")
     print("   GET  /impact-reports - Get all impact reports") 
+    print("        ?sort=score for top N by score, ?cursor=&limit= to page in insertion order")
+    print("        /impact-reports/export - Stream reports as NDJSON (?cursor=&since=&until=&category=)")
     print("   GET  /impact-analytics - Get analytics dashboard")
+    print("   GET  /impact-timeseries - Hourly/daily/monthly totals (?granularity=&from=&to=&category=)")
+    print("   GET  /impact-stream - Live report deltas and CSR totals (Server-Sent Events)")
     print("   GET  /standards-info - Get compliance standards info")
     print("🤖 SELLER TRUST ENDPOINTS:")
     print("   GET  /seller/<id> - Get seller info")
     print("   POST /seller/<id>/review - Submit seller review")
+    print("   POST /reviews/bulk - Ingest reviews for many sellers (JSON or NDJSON)")
     print("   POST /test/review - Test review system")
     print("🔄 COMMON ENDPOINTS:")
     print("   GET  / - Health & status")
@@ -0,0 +1,124 @@
+"""Review ingestion throughput through POST /reviews/bulk and the single-review route.
+
+Builds ``--reviews`` reviews for ``--sellers`` sellers from the synthetic
+corpus of sentiment_cache_benchmark (ratings, delivery, recommendation and
+timestamps drawn at random), then sends them through Flask's test client as
+one JSON body and as one NDJSON body, and ``--single`` of them one at a
+time to POST /seller/<id>/review. Each run writes to its own sellers.
+Afterwards the seller records left by the bulk runs are checked against the
+single-review route fed the same reviews in timestamp order (``--verify``
+reviews across a tenth of the sellers). Logging is off unless
+``--log-level`` is given; records then go to stdout as in production::
+
+    python bulk_review_benchmark.py --reviews 100000 --sellers 2000
+    python bulk_review_benchmark.py --reviews 100000 --sellers 2000 --log-level INFO > /dev/null
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+os.environ.setdefault("RECIRCLE_STORAGE", "local_memory")
+os.environ.setdefault("RECIRCLE_NLTK_WARMUP", "lazy")
+os.environ["RECIRCLE_SENTIMENT_WORKERS"] = "0"
+
+DELIVERIES = ("fast", "average", "slow", "very fast", "late")
+
+
+def build_reviews(count, sellers, seed=15):
+    from sentiment_cache_benchmark import build_corpus
+
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1)
+    return [
+        {
+            "seller": index % sellers, "review": text, "rating": rng.randint(1, 5),
+            "delivery": rng.choice(DELIVERIES), "recommend": rng.choice(("Yes", "Yes", "No")),
+            # Shuffled timestamps, so each seller's reviews arrive out of order
+            "timestamp": (start + timedelta(seconds=rng.randrange(count * 10))).isoformat()
+        }
+        for index, text in enumerate(build_corpus(count, seed))
+    ]
+
+
+def for_run(reviews, prefix):
+    return [
+        {**{key: value for key, value in review.items() if key != "seller"}, "seller_id": f"{prefix}-{review['seller']}"}
+        for review in reviews
+    ]
+
+
+def post_bulk(client, reviews, ndjson):
+    if ndjson:
+        body = "\n".join(json.dumps(review) for review in reviews)
+        response = client.post("/reviews/bulk", data=body, content_type="application/x-ndjson")
+    else:
+        response = client.post("/reviews/bulk", json={"reviews": reviews})
+    result = response.get_json()
+    assert response.status_code == 200 and result["applied"] == len(reviews), result
+    return result
+
+
+def post_single(client, reviews):
+    for review in reviews:
+        response = client.post(f"/seller/{review['seller_id']}/review", json=review)
+        assert response.status_code == 200, response.get_data(as_text=True)
+
+
+def seller_state(app2, seller_id):
+    """The seller record without the fields that differ between runs (id, name, wall-clock stamps)"""
+    seller = app2.storage.get_seller(seller_id)
+    return {key: value for key, value in seller.items() if key not in ("id", "name", "createdAt", "updatedAt")}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--reviews", type=int, default=100000)
+    parser.add_argument("--sellers", type=int, default=2000)
+    parser.add_argument("--single", type=int, default=5000)
+    parser.add_argument("--verify", type=int, default=5000)
+    parser.add_argument("--log-level")
+    args = parser.parse_args()
+    if args.log_level:
+        os.environ["RECIRCLE_LOG_LEVEL"] = args.log_level
+    import app2
+    if not args.log_level:
+        logging.disable(logging.CRITICAL)
+
+    reviews = build_reviews(args.reviews, args.sellers)
+    client = app2.app.test_client()
+    client.post("/seller/bench-warmup/review", json={"review": "Great seller!", "rating": 5})
+
+    print(f"{args.reviews:,} reviews for {args.sellers:,} sellers, logging {args.log_level or 'off'}", file=sys.stderr)
+    for label, ndjson in (("bulk JSON", False), ("bulk NDJSON", True)):
+        started = time.perf_counter()
+        post_bulk(client, for_run(reviews, label.replace(" ", "-")), ndjson)
+        elapsed = time.perf_counter() - started
+        print(f"  {label:<14} {elapsed:6.2f}s  {args.reviews / elapsed:>8,.0f} reviews/s", file=sys.stderr)
+
+    single = for_run(reviews[:args.single], "single")
+    started = time.perf_counter()
+    post_single(client, single)
+    elapsed = time.perf_counter() - started
+    print(f"  {'single':<14} {elapsed:6.2f}s  {len(single) / elapsed:>8,.0f} reviews/s ({len(single):,} reviews)",
+          file=sys.stderr)
+
+    # Parity: the bulk runs against one review at a time, in timestamp order
+    checked = max(args.sellers // 10, 1)
+    sample = [review for review in reviews if review["seller"] < checked][:args.verify]
+    post_bulk(client, for_run(sample, "verify-bulk"), ndjson=True)
+    post_single(client, sorted(for_run(sample, "verify-single"), key=lambda review: review["timestamp"]))
+    differing = sum(
+        seller_state(app2, f"verify-bulk-{seller}") != seller_state(app2, f"verify-single-{seller}")
+        for seller in {review["seller"] for review in sample}
+    )
+    print(f"  parity: {len(sample):,} reviews, {differing} differing sellers", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""Concurrency stress test for impact and seller writes under threaded serving.
+
+Fires ``--impacts`` POST /calculate-impact and ``--reviews`` POST
+/seller/<id>/review requests from ``--threads`` threads through Flask's
+test client, optionally while one more thread calls
+``verify_impact_analytics(repair=True)`` every ``--repair-interval``
+seconds. Afterwards it checks that no update was lost:
+
+- the report count, CSR totals and analytics agree with the stored reports;
+- every seller's totalReviews and totalRating match the reviews sent to it.
+
+``--unsafe`` swaps the writer lock and the seller lock stripes for no-op
+locks, which is the unsynchronised baseline, so its throughput can be compared
+and its lost updates counted. A repair scans every report under the writer
+lock, so leave it off when comparing throughput. With ``RECIRCLE_DATA_DIR``
+set, writes are journaled and snapshotted while the stress runs::
+
+    python concurrency_stress.py --threads 32 --impacts 4000 --reviews 4000
+    python concurrency_stress.py --threads 32 --impacts 4000 --reviews 4000 --unsafe
+    python concurrency_stress.py --repair-interval 0.05
+"""
+
+import argparse
+import logging
+import math
+import os
+import random
+import sys
+import threading
+import time
+
+os.environ.setdefault("RECIRCLE_NLTK_WARMUP", "lazy")
+
+import app2
+
+REVIEW_TEXTS = (
+    "Great seller!",
+    "Fast delivery. Item exactly as described.",
+    "no comment",
+    "The jacket was not as described, but support fixed it quickly!",
+    "Terrible packaging... box arrived crushed. Would NOT buy again!!",
+    "ok",
+    "Really good quality for the price. Slow shipping though.",
+)
+DELIVERIES = ("fast", "good", "slow", "excellent", "delayed")
+
+
+class NoLock:
+    """Stands in for a lock in the --unsafe baseline"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+def remove_locks():
+    app2.impact_write_lock = NoLock()
+    app2.seller_locks = [NoLock() for _ in app2.seller_locks]
+
+
+def stress(threads=32, impacts=4000, reviews=4000, sellers=50, repair_interval=0):
+    """Run the request mix; returns (requests per second, list of invariant violations)"""
+    app2.warm_sentiment()
+    jobs = [("impact", i) for i in range(impacts)] + [("review", i) for i in range(reviews)]
+    random.Random(0).shuffle(jobs)  # interleave impacts and reviews
+    seller_ids = [f"stress-{i}" for i in range(sellers)]
+    before_sellers = {seller_id: dict(app2.storage.get_seller(seller_id) or {}) for seller_id in seller_ids}
+    before_impacts = app2.csr_summary["total_impacts"]
+    sent = {seller_id: [0, 0.0] for seller_id in seller_ids}
+    sent_lock = threading.Lock()
+    failures = []
+    done = threading.Event()
+
+    def worker(chunk):
+        client = app2.app.test_client()
+        for kind, i in chunk:
+            if kind == "impact":
+                response = client.post("/calculate-impact", json={
+                    "category": app2.IMPACT_CATEGORIES[i % len(app2.IMPACT_CATEGORIES)],
+                    "quantity_kg": 0.5 + i % 41 * 0.37, "distance_km": i % 13 * 10
+                })
+            else:
+                seller_id = seller_ids[i % sellers]
+                rating = 1 + i % 5
+                response = client.post(f"/seller/{seller_id}/review", json={
+                    "review": REVIEW_TEXTS[i % len(REVIEW_TEXTS)], "rating": rating,
+                    "delivery": DELIVERIES[i % len(DELIVERIES)], "recommend": "Yes" if i % 3 else "No"
+                })
+                with sent_lock:
+                    sent[seller_id][0] += 1
+                    sent[seller_id][1] += rating
+            if response.status_code != 200:
+                failures.append(f"{kind} {i}: HTTP {response.status_code}")
+
+    def repairer():
+        while not done.wait(repair_interval):
+            app2.verify_impact_analytics(repair=True)
+
+    workers = [threading.Thread(target=worker, args=(jobs[n::threads],)) for n in range(threads)]
+    if repair_interval:
+        workers.append(threading.Thread(target=repairer))
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers[:threads]:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    done.set()
+    for thread in workers[threads:]:
+        thread.join()
+
+    violations = list(failures)
+    rows = list(app2.storage.iter_rows())
+    summary = app2.csr_summary
+    if summary["total_impacts"] - before_impacts != impacts:
+        violations.append(f"total_impacts grew by {summary['total_impacts'] - before_impacts}, expected {impacts}")
+    if summary["total_impacts"] != len(rows):
+        violations.append(f"total_impacts {summary['total_impacts']} != {len(rows)} stored reports")
+    for total, column in (("total_co2e_saved", 7), ("total_water_saved", 8), ("total_impact_score", 1)):
+        stored = math.fsum(row[column] for row in rows)
+        if not math.isclose(summary[total], stored, rel_tol=1e-9, abs_tol=1e-6):
+            violations.append(f"{total} {summary[total]} != {stored} summed from reports")
+    if not app2.verify_impact_analytics():
+        violations.append("impact analytics do not match the stored reports")
+    for seller_id, (count, rating_total) in sent.items():
+        before = before_sellers[seller_id]
+        seller = app2.storage.get_seller(seller_id) or {}
+        if seller.get("totalReviews", 0) - before.get("totalReviews", 0) != count:
+            violations.append(f"{seller_id}: totalReviews {seller.get('totalReviews')}, expected {before.get('totalReviews', 0) + count}")
+        if not math.isclose(seller.get("totalRating", 0) - before.get("totalRating", 0), rating_total):
+            violations.append(f"{seller_id}: totalRating {seller.get('totalRating')}, expected {before.get('totalRating', 0) + rating_total}")
+    return len(jobs) / elapsed, violations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--impacts", type=int, default=4000)
+    parser.add_argument("--reviews", type=int, default=4000)
+    parser.add_argument("--sellers", type=int, default=50)
+    parser.add_argument("--repair-interval", type=float, default=0,
+                        help="seconds between concurrent analytics repairs (0 = none)")
+    parser.add_argument("--unsafe", action="store_true", help="run without the writer and seller locks")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    if args.unsafe:
+        remove_locks()
+    throughput, violations = stress(args.threads, args.impacts, args.reviews, args.sellers, args.repair_interval)
+    print(f"{'unsafe' if args.unsafe else 'locked'}: {args.impacts + args.reviews} requests from "
+          f"{args.threads} threads, {throughput:,.0f} requests/s, {len(violations)} invariant violations")
+    for violation in violations[:20]:
+        print(f"  {violation}")
+    if violations and not args.unsafe:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
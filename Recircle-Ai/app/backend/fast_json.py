@@ -0,0 +1,168 @@
+"""Pluggable JSON encoding for Flask responses.
+
+``FastJSONProvider`` replaces Flask's default provider (``app.json``), so
+every ``jsonify`` goes through it. It encodes with orjson when that package
+is installed and with the standard library otherwise. Either way documents
+keep Flask's shape (compact, sorted keys, RFC 822 dates, trailing newline),
+so clients and ETags see the same JSON; orjson only writes non-ASCII text as
+UTF-8 instead of ``\\uXXXX`` escapes. Objects orjson rejects (integers
+beyond 64 bits, for instance) are retried with the standard library.
+
+``JSONFragment`` wraps a constant document (/standards-info, /ping) that is
+encoded once per provider; ``jsonify(fragment)`` then only copies bytes. A
+fragment nested inside another document is encoded like its value: splicing
+pre-encoded bytes into a dynamic document goes through the encoder's
+``default`` hook and a rescan of the output, which measured slower than
+encoding the short constant lists this backend embeds.
+
+Encoding time and output size are counted per route (``stats()``, shown on
+/health). ``python json_benchmark.py`` compares the backends route by route.
+"""
+
+import json
+import numbers
+import threading
+import time
+
+from flask import has_request_context, request
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional; the standard library encoder is used instead
+    orjson = None
+
+BACKENDS = ("auto", "orjson", "stdlib")
+
+
+class JSONFragment:
+    """A constant JSON document, encoded once per provider"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __repr__(self):
+        return f"JSONFragment({self.value!r})"
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider encoding with orjson or the standard library"""
+
+    def __init__(self, app, backend="auto"):
+        super().__init__(app)
+        if backend not in BACKENDS:
+            raise ValueError(f"JSON backend must be one of {', '.join(BACKENDS)}, not {backend!r}")
+        self.requested_backend = backend
+        self.backend = "orjson" if orjson is not None and backend != "stdlib" else "stdlib"
+        if self.backend == "orjson":
+            self._options = (
+                orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                # Flask's default() formats these; orjson's native forms differ
+                | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+            )
+        self._encoder = json.JSONEncoder(
+            default=self.default, ensure_ascii=self.ensure_ascii, sort_keys=self.sort_keys, separators=(",", ":")
+        )
+        self._encoded_fragments = {}
+        self.fallbacks = 0
+        self.route_stats = {}
+        self.lock = threading.Lock()
+
+    # ---------- encoding ----------
+
+    def default(self, o):
+        if isinstance(o, JSONFragment):
+            return o.value
+        # Numeric subclasses such as NumPy scalars
+        if isinstance(o, numbers.Integral):
+            return int(o)
+        if isinstance(o, numbers.Real):
+            return float(o)
+        if isinstance(o, tuple):
+            return list(o)
+        return super().default(o)
+
+    def encode(self, obj, route=None):
+        """Compact UTF-8 JSON for ``obj``; timed under ``route`` when one is given"""
+        if route is None:
+            return self._encode(obj)
+        started = time.perf_counter()
+        encoded = self._encode(obj)
+        self.record(route, time.perf_counter() - started, len(encoded))
+        return encoded
+
+    def _encode(self, obj, indent=False):
+        if isinstance(obj, JSONFragment) and not indent:
+            encoded = self._encoded_fragments.get(obj)
+            if encoded is None:
+                encoded = self._encoded_fragments[obj] = self._encode(obj.value)
+            return encoded
+        if self.backend == "orjson":
+            try:
+                return orjson.dumps(
+                    obj, default=self.default, option=self._options | (orjson.OPT_INDENT_2 if indent else 0)
+                )
+            except orjson.JSONEncodeError:
+                with self.lock:
+                    self.fallbacks += 1
+        if indent:
+            return json.dumps(obj, default=self.default, ensure_ascii=self.ensure_ascii,
+                              sort_keys=self.sort_keys, indent=2).encode("utf-8")
+        return self._encoder.encode(obj).encode("utf-8")
+
+    def dumps(self, obj, **kwargs):
+        """JSON text for ``obj``; keyword arguments go to ``json.dumps`` as with
+        Flask's provider. Separators default to compact, as in responses,
+        unless the caller passes ``separators`` or ``indent``."""
+        if not kwargs or kwargs == {"separators": (",", ":")}:
+            return self._encode(obj).decode("utf-8")
+        if "indent" not in kwargs:
+            kwargs.setdefault("separators", (",", ":"))
+        return super().dumps(obj, **kwargs)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        route = request.url_rule.rule if has_request_context() and request.url_rule else "<unrouted>"
+        started = time.perf_counter()
+        body = self._encode(obj, indent=(self.compact is None and self._app.debug) or self.compact is False)
+        self.record(route, time.perf_counter() - started, len(body))
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
+
+    # ---------- stats ----------
+
+    def record(self, route, seconds, size):
+        with self.lock:
+            stats = self.route_stats.get(route)
+            if stats is None:
+                stats = self.route_stats[route] = [0, 0.0, 0, 0.0]
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] += size
+            stats[3] = max(stats[3], seconds)
+
+    def stats(self):
+        with self.lock:
+            routes = {route: list(stats) for route, stats in self.route_stats.items()}
+            fallbacks = self.fallbacks
+        return {
+            "backend": self.backend,
+            "requested_backend": self.requested_backend,
+            "encoded_fragments": len(self._encoded_fragments),
+            "stdlib_fallbacks": fallbacks,
+            "routes": {
+                route: {
+                    "documents": count,
+                    "avg_encode_us": round(seconds / count * 1e6, 2),
+                    "max_encode_us": round(longest * 1e6, 2),
+                    "avg_bytes": round(size / count)
+                }
+                for route, (count, seconds, size, longest) in routes.items()
+            }
+        }
+
+    def reset_stats(self):
+        with self.lock:
+            self.route_stats = {}
+            self.fallbacks = 0
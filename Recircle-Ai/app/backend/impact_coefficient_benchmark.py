@@ -0,0 +1,128 @@
+"""Per-call cost of calculate_impact, optionally against an earlier revision.
+
+Times ``--calls`` calls of ``calculate_impact`` (best of ``--rounds``) on
+random inputs (every category plus an unknown one, int and float
+quantities, with and without a distance) and on a pool of 50 inputs
+repeated, each in a fresh process with the (category, quantity, distance)
+memo off and with ``--memo`` entries (``RECIRCLE_IMPACT_MEMO``).
+``--baseline REF`` extracts this directory at a git revision (for example
+the commit before the coefficient records) and times its calculate_impact
+the same way. Every run prints a digest of the JSON output for the random
+inputs, so equal digests mean identical responses::
+
+    python impact_coefficient_benchmark.py --calls 50000
+    python impact_coefficient_benchmark.py --calls 50000 --baseline 4fc18f4^
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def inputs(categories, count, seed):
+    rng = random.Random(seed)
+    categories = categories + ["Toys"]  # unknown categories fall back to Food
+    transactions = []
+    for _ in range(count):
+        transaction = {
+            "category": rng.choice(categories),
+            "quantity_kg": rng.randint(1, 40) if rng.random() < 0.5 else round(rng.uniform(0.1, 40), 2)
+        }
+        if rng.random() < 0.7:
+            transaction["distance_km"] = round(rng.uniform(0, 800), 1)
+        transactions.append(transaction)
+    return transactions
+
+
+def time_calls(calculate, transactions, rounds):
+    """Fastest of `rounds` passes, in microseconds per call"""
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for transaction in transactions:
+            calculate(transaction)
+        best = min(best, time.perf_counter() - started)
+    return best / len(transactions) * 1e6
+
+
+def child(source, calls, rounds):
+    sys.path.insert(0, source)
+    logging.disable(logging.CRITICAL)
+    import app2
+
+    categories = list(app2.EMISSION_FACTORS)
+    random_inputs = inputs(categories, calls, seed=18)
+    pool = inputs(categories, 50, seed=19)
+    repeated = [pool[index % len(pool)] for index in range(calls)]
+    digest = hashlib.sha256()
+    for transaction in random_inputs:
+        digest.update(json.dumps(app2.calculate_impact(transaction), sort_keys=True).encode())
+
+    print(json.dumps({
+        "random_us": time_calls(app2.calculate_impact, random_inputs, rounds),
+        "repeated_us": time_calls(app2.calculate_impact, repeated, rounds),
+        "digest": digest.hexdigest()[:12]
+    }), flush=True)
+
+
+def run(source, calls, rounds, memo):
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", source, "--calls", str(calls), "--rounds", str(rounds)],
+        cwd=source,
+        env={**os.environ, "RECIRCLE_IMPACT_MEMO": str(memo), "RECIRCLE_STORAGE": "local_memory",
+             "RECIRCLE_NLTK_WARMUP": "lazy"},
+        capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def extract(revision, directory):
+    """This directory's files at `revision`, written under `directory`"""
+    def git(*command):
+        return subprocess.run(["git", *command], cwd=HERE, capture_output=True, check=True).stdout
+
+    # git archive resolves the tree path from the top of the work tree
+    top, prefix = git("rev-parse", "--show-toplevel", "--show-prefix").decode().splitlines()
+    archive = subprocess.run(["git", "archive", "--format=tar", f"{revision}:{prefix.rstrip('/')}"], cwd=top,
+                             capture_output=True, check=True).stdout
+    subprocess.run(["tar", "-x", "-C", directory], input=archive, check=True)
+    return directory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=50000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--memo", type=int, default=4096)
+    parser.add_argument("--baseline")
+    parser.add_argument("--child", metavar="SOURCE", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(args.child, args.calls, args.rounds)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        runs = [
+            ("current", run(HERE, args.calls, args.rounds, 0)),
+            (f"current, memo {args.memo}", run(HERE, args.calls, args.rounds, args.memo))
+        ]
+        if args.baseline:
+            runs.insert(0, (args.baseline, run(extract(args.baseline, directory), args.calls, args.rounds, 0)))
+
+    print(f"{os.cpu_count()} CPU(s), {args.calls:,} calls per input set (us per call, best of {args.rounds})")
+    print(f"  {'':<22} {'random':>8} {'repeated':>9}  output digest")
+    for label, result in runs:
+        print(f"  {label:<22} {result['random_us']:>8.1f} {result['repeated_us']:>9.1f}  {result['digest']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Fan-out latency client for the /impact-stream Server-Sent Events endpoint.
+
+Opens ``--subscribers`` concurrent SSE connections to a running backend,
+posts ``--posts`` impacts to /calculate-impact, and measures for every
+(subscriber, report) pair the time from the POST returning to the report
+summary arriving on that stream. Latency therefore includes the server's
+coalescing window (RECIRCLE_STREAM_COALESCE_MS). Only the standard library
+is used::
+
+    python impact_stream_client.py --url http://localhost:5000 --subscribers 300 --posts 100
+"""
+
+import argparse
+import http.client
+import json
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+class StreamListener(threading.Thread):
+    """One SSE subscriber recording when each report summary arrives"""
+
+    def __init__(self, host, port, ready):
+        super().__init__(daemon=True)
+        self.host = host
+        self.port = port
+        self.ready = ready
+        self.arrivals = {}
+        self.events = {}
+        self.error = None
+
+    def run(self):
+        try:
+            conn = http.client.HTTPConnection(self.host, self.port, timeout=60)
+            conn.request("GET", "/impact-stream", headers={"Accept": "text/event-stream"})
+            response = conn.getresponse()
+            if response.status != 200:
+                raise RuntimeError(f"HTTP {response.status}")
+            event, data = None, []
+            while True:
+                line = response.readline()
+                if not line:
+                    return
+                line = line.decode("utf-8").rstrip("\n")
+                if line.startswith("event:"):
+                    event = line[6:].strip()
+                elif line.startswith("data:"):
+                    data.append(line[5:].strip())
+                elif not line and event:
+                    self._handle(event, json.loads("\n".join(data)), time.perf_counter())
+                    event, data = None, []
+        except Exception as exc:
+            self.error = exc
+        finally:
+            self.ready.release()
+
+    def _handle(self, event, payload, received):
+        self.events[event] = self.events.get(event, 0) + 1
+        if event == "totals":
+            self.ready.release()
+        elif event == "delta":
+            for report in payload["reports"]:
+                self.arrivals.setdefault(report["transaction_id"], received)
+
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default="http://localhost:5000")
+    parser.add_argument("--subscribers", type=int, default=200)
+    parser.add_argument("--posts", type=int, default=50)
+    parser.add_argument("--interval", type=float, default=0.1, help="seconds between posts (0 for a burst)")
+    parser.add_argument("--grace", type=float, default=2.0, help="seconds to wait for stragglers")
+    args = parser.parse_args()
+
+    url = urlsplit(args.url)
+    ready = threading.Semaphore(0)
+    listeners = [StreamListener(url.hostname, url.port or 80, ready) for _ in range(args.subscribers)]
+    for listener in listeners:
+        listener.start()
+    for _ in listeners:
+        ready.acquire()
+    failed = [listener for listener in listeners if listener.error]
+    print(f"{len(listeners) - len(failed)} subscribers connected ({len(failed)} failed)")
+
+    committed = {}
+    conn = http.client.HTTPConnection(url.hostname, url.port or 80, timeout=60)
+    for i in range(args.posts):
+        body = json.dumps({"category": "Electronics", "quantity_kg": 1 + i % 5})
+        conn.request("POST", "/calculate-impact", body, {"Content-Type": "application/json"})
+        result = json.loads(conn.getresponse().read())
+        committed[result["transaction_id"]] = time.perf_counter()
+        if args.interval:
+            time.sleep(args.interval)
+    time.sleep(args.grace)
+
+    latencies = []
+    missing = 0
+    resyncs = 0
+    for listener in listeners:
+        if listener.error:
+            continue
+        resyncs += listener.events.get("resync", 0)
+        for transaction_id, posted in committed.items():
+            received = listener.arrivals.get(transaction_id)
+            if received is None:
+                missing += 1
+            else:
+                latencies.append((received - posted) * 1000)
+    latencies.sort()
+    print(f"{len(latencies)} deliveries, {missing} missing, {resyncs} resyncs")
+    if latencies:
+        print("fan-out latency ms: p50 %.1f  p95 %.1f  p99 %.1f  max %.1f" % (
+            percentile(latencies, 0.5), percentile(latencies, 0.95),
+            percentile(latencies, 0.99), latencies[-1]
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Append-only NDJSON journal with group-commit fsync and atomic snapshots.
+
+Each line is a compact JSON array ``[seq, kind, payload]``. Writers append
+without waiting for the disk; a background thread flushes and fsyncs every
+``fsync_interval`` seconds (or as soon as ``fsync_batch`` records are
+pending), so at most one interval of writes is exposed to a crash.
+
+A snapshot is a pickled state dict tagged with the sequence number it
+covers. On startup the snapshot is loaded and only journal records with a
+higher sequence number are replayed, so a crash between writing the
+snapshot and truncating the log never applies a record twice.
+"""
+
+import json
+import logging
+import os
+import pickle
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class Journal:
+    def __init__(self, directory, fsync_interval=0.05, fsync_batch=1000):
+        os.makedirs(directory, exist_ok=True)
+        self.log_path = os.path.join(directory, "journal.ndjson")
+        self.snapshot_path = os.path.join(directory, "snapshot.pickle")
+        self.fsync_interval = fsync_interval
+        self.fsync_batch = fsync_batch
+        self.seq = 0
+        self.records_since_snapshot = 0
+        self._file = None
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._flusher = None
+
+    # ---------- recovery ----------
+
+    def load(self):
+        """Return ``(snapshot_state, tail_records)`` and position the log for appending.
+
+        ``snapshot_state`` is None when no snapshot exists. ``tail_records`` is a
+        list of ``(kind, payload)`` newer than the snapshot. A torn final line
+        left by a crash is discarded and cut off the log.
+        """
+        state = None
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, "rb") as f:
+                state = pickle.load(f)
+            self.seq = state["seq"]
+
+        tail = []
+        if os.path.exists(self.log_path):
+            good_offset = 0
+            with open(self.log_path, "rb") as f:
+                for line in f:
+                    try:
+                        seq, kind, payload = json.loads(line)
+                    except ValueError:
+                        logger.warning("Discarding torn journal record at byte %d", good_offset)
+                        break
+                    good_offset += len(line)
+                    if seq > self.seq:
+                        tail.append((kind, payload))
+                        self.seq = seq
+            if good_offset != os.path.getsize(self.log_path):
+                with open(self.log_path, "r+b") as f:
+                    f.truncate(good_offset)
+
+        self.records_since_snapshot = len(tail)
+        return state, tail
+
+    # ---------- writing ----------
+
+    def open(self):
+        self._file = open(self.log_path, "a", encoding="utf-8")
+        self._stop.clear()
+        self._flusher = threading.Thread(target=self._flush_loop, name="journal-fsync", daemon=True)
+        self._flusher.start()
+
+    def append(self, kind, payload):
+        self.append_many(kind, [payload])
+
+    def append_many(self, kind, payloads):
+        # Payloads are encoded outside the lock; only the seq stamp is serialised
+        encoded = [json.dumps(payload, separators=(",", ":")) for payload in payloads]
+        with self._lock:
+            lines = []
+            for payload_json in encoded:
+                self.seq += 1
+                lines.append(f'[{self.seq},"{kind}",{payload_json}]\n')
+            self._file.write("".join(lines))
+            self._pending += len(payloads)
+            self.records_since_snapshot += len(payloads)
+            if self._pending >= self.fsync_batch:
+                self._sync_locked()
+
+    def sync(self):
+        with self._lock:
+            self._sync_locked()
+
+    def _sync_locked(self):
+        if self._file is None or not self._pending:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = 0
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.fsync_interval):
+            try:
+                self.sync()
+            except (OSError, ValueError) as exc:
+                logger.error("Journal fsync failed: %s", exc)
+
+    # ---------- snapshots ----------
+
+    def snapshot(self, build_state):
+        """Atomically persist ``build_state()`` as of the current sequence and truncate the log.
+
+        ``build_state`` runs under the append lock, so no record can be logged
+        between capturing the state and tagging it with its sequence number. The
+        caller must hold whatever lock keeps the state consistent with the
+        records appended so far.
+        """
+        with self._lock:
+            self._sync_locked()
+            state = dict(build_state(), seq=self.seq)
+            tmp_path = self.snapshot_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+            if self._file is not None:
+                self._file.truncate(0)
+            self.records_since_snapshot = 0
+
+    def close(self):
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        with self._lock:
+            self._sync_locked()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
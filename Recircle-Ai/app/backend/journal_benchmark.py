@@ -0,0 +1,102 @@
+"""Journal write throughput and recovery time for the journal storage mode.
+
+Runs the backend in three fresh processes against one scratch
+RECIRCLE_DATA_DIR:
+
+1. write: stores ``--records`` impacts through update_impact_data_batch in
+   batches of ``--batch`` with snapshots off, then stops without the
+   shutdown snapshot, as a crash after the last fsync would;
+2. replay: starts from the journal alone, then exits cleanly, which writes
+   a snapshot;
+3. snapshot: starts from that snapshot.
+
+Each restart checks that every record came back and that
+verify_impact_analytics() passes::
+
+    python journal_benchmark.py --records 1000000
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def child(phase, records, batch):
+    os.environ["RECIRCLE_STORAGE"] = "journal"
+    os.environ["RECIRCLE_NLTK_WARMUP"] = "lazy"
+    os.environ["RECIRCLE_SNAPSHOT_EVERY"] = str(10 ** 12)
+    logging.disable(logging.CRITICAL)
+    started = time.perf_counter()
+    import app2
+    result = {"startup_s": time.perf_counter() - started}
+
+    if phase == "write":
+        write_seconds = 0.0
+        for start in range(0, records, batch):
+            size = min(batch, records - start)
+            categories = [app2.IMPACT_CATEGORIES[(start + i) % len(app2.IMPACT_CATEGORIES)] for i in range(size)]
+            impacts = app2.calculate_impact_batch(categories, [0.5 + (start + i) % 97 * 0.37 for i in range(size)])
+            started = time.perf_counter()
+            app2.update_impact_data_batch(impacts)
+            write_seconds += time.perf_counter() - started
+        started = time.perf_counter()
+        app2.journal.sync()
+        result["write_s"] = write_seconds + time.perf_counter() - started
+    result["reports"] = len(app2.impact_reports)
+    result["total_impacts"] = app2.csr_summary["total_impacts"]
+    result["analytics_ok"] = app2.verify_impact_analytics()
+    print(json.dumps(result), flush=True)
+    if phase == "write":
+        os._exit(0)
+
+
+def run_phase(phase, data_dir, records, batch):
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--phase", phase, "--records", str(records), "--batch", str(batch)],
+        cwd=os.path.dirname(os.path.abspath(__file__)), env={**os.environ, "RECIRCLE_DATA_DIR": data_dir},
+        capture_output=True, text=True, check=True
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    if result["reports"] != records or result["total_impacts"] != records or not result["analytics_ok"]:
+        sys.exit(f"{phase}: state mismatch {result}")
+    return result
+
+
+def file_mb(path):
+    return os.path.getsize(path) / 1e6 if os.path.exists(path) else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--records", type=int, default=1000000)
+    parser.add_argument("--batch", type=int, default=1000, help="impacts per update_impact_data_batch call")
+    parser.add_argument("--phase", choices=("write", "replay", "snapshot"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.phase:
+        child(args.phase, args.records, args.batch)
+        return
+
+    data_dir = tempfile.mkdtemp(prefix="recircle-journal-")
+    try:
+        write = run_phase("write", data_dir, args.records, args.batch)
+        journal_mb = file_mb(os.path.join(data_dir, "journal.ndjson"))
+        replay = run_phase("replay", data_dir, args.records, args.batch)
+        snapshot_mb = file_mb(os.path.join(data_dir, "snapshot.pickle"))
+        snapshot = run_phase("snapshot", data_dir, args.records, args.batch)
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+    print(f"{args.records} impacts in batches of {args.batch}")
+    print(f"  write throughput      {args.records / write['write_s']:>10,.0f} records/s  (journal {journal_mb:.0f} MB)")
+    print(f"  recovery, journal     {replay['startup_s']:>10.2f} s import")
+    print(f"  recovery, snapshot    {snapshot['startup_s']:>10.2f} s import  (snapshot {snapshot_mb:.0f} MB)")
+
+
+if __name__ == "__main__":
+    main()
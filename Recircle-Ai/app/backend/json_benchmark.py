@@ -0,0 +1,106 @@
+"""Per-route JSON serialization benchmark for the backend.
+
+Seeds in-memory impact reports, then replays a request mix against every
+JSON route once per encoder (Flask's stock ``json.dumps`` path, this
+backend's stdlib path, and orjson when installed) through Flask's test
+client and prints the average encode time and body size per route, as
+counted by ``FastJSONProvider``. The response cache is off so
+every GET is encoded. Only encoding is timed; the route logic around it is
+not::
+
+    python json_benchmark.py --requests 300 --reports 2000
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+os.environ["RECIRCLE_RESPONSE_CACHE_SIZE"] = "0"
+os.environ.setdefault("RECIRCLE_STORAGE", "local_memory")
+os.environ.setdefault("RECIRCLE_NLTK_WARMUP", "lazy")
+
+from flask.json.provider import DefaultJSONProvider
+
+import app2
+from fast_json import FastJSONProvider, orjson
+
+REVIEW = {
+    "review": "Great seller, fast delivery. The jacket was not as described but support fixed it quickly!",
+    "rating": 4, "delivery": "fast", "recommend": "Yes", "from": "Bench", "product": "Jacket"
+}
+BATCH = {
+    "category": list(app2.IMPACT_CATEGORIES) * 10,
+    "quantity_kg": [1 + i % 7 for i in range(len(app2.IMPACT_CATEGORIES) * 10)]
+}
+
+
+class FlaskBaseline(FastJSONProvider):
+    """Flask's stock DefaultJSONProvider encoding, timed like the others"""
+
+    def _encode(self, obj, indent=False):
+        return DefaultJSONProvider.dumps(self, obj, separators=(",", ":")).encode("utf-8")
+
+
+def request_mix(reviews):
+    mix = [
+        ("GET", "/", None),
+        ("GET", "/ping", None),
+        ("GET", "/health", None),
+        ("GET", "/csr-summary", None),
+        ("GET", "/impact-reports", None),
+        ("GET", "/impact-analytics", None),
+        ("GET", "/impact-timeseries?granularity=day", None),
+        ("GET", "/standards-info", None),
+        ("GET", "/test-impact", None),
+        ("GET", "/seller/seller1", None),
+        ("POST", "/calculate-impact", {"category": "Electronics", "quantity_kg": 3.5}),
+        ("POST", "/calculate-impact/batch", BATCH),
+    ]
+    if reviews:
+        mix.append(("POST", "/seller/seller1/review", REVIEW))
+    return mix
+
+
+def run(backend, requests, reviews):
+    if backend == "flask":
+        provider = FlaskBaseline(app2.app, "stdlib")
+    else:
+        provider = FastJSONProvider(app2.app, backend)
+    app2.app.json = provider
+    client = app2.app.test_client()
+    for _ in range(requests):
+        for method, path, body in request_mix(reviews):
+            response = client.open(path, method=method, json=body)
+            if response.status_code != 200:
+                sys.exit(f"{method} {path} returned {response.status_code}: {response.get_data(as_text=True)[:200]}")
+    client.get("/impact-reports/export").get_data()
+    return provider.stats()["routes"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=200, help="rounds of the request mix per backend")
+    parser.add_argument("--reports", type=int, default=1000, help="impact reports seeded before timing")
+    parser.add_argument("--no-reviews", action="store_true", help="skip the review route (needs NLTK data)")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    seed = [app2.IMPACT_CATEGORIES[i % len(app2.IMPACT_CATEGORIES)] for i in range(args.reports)]
+    app2.update_impact_data_batch(app2.calculate_impact_batch(seed, [1 + i % 9 for i in range(args.reports)]))
+
+    backends = ["flask", "stdlib"] + (["orjson"] if orjson is not None else [])
+    results = {backend: run(backend, args.requests, not args.no_reviews) for backend in backends}
+    baseline = results["flask"]
+    fastest = results[backends[-1]]
+
+    print(f"{'route':<28}{'bytes':>9}" + "".join(f"{backend + ' us':>13}" for backend in backends) + "    speedup")
+    for route in sorted(baseline):
+        row = f"{route:<28}{baseline[route]['avg_bytes']:>9}"
+        row += "".join(f"{results[backend][route]['avg_encode_us']:>13.1f}" for backend in backends)
+        row += f"{baseline[route]['avg_encode_us'] / fastest[route]['avg_encode_us']:>10.1f}x"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
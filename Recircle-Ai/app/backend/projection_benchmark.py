@@ -0,0 +1,91 @@
+"""Payload size and latency of full, ?view=slim and ?fields= responses.
+
+Seeds ``--reports`` impact reports, then sends ``--requests`` of each
+request through Flask's test client with the full document, the slim view
+and a short field list, and prints the mean body size and the mean time
+per request (routing, storage and encoding included). The response cache
+is off so every GET is built::
+
+    python projection_benchmark.py --reports 1000 --requests 300
+    RECIRCLE_STORAGE=sqlite python projection_benchmark.py
+"""
+
+import argparse
+import logging
+import os
+import random
+import tempfile
+import time
+
+os.environ["RECIRCLE_RESPONSE_CACHE_SIZE"] = "0"
+os.environ.setdefault("RECIRCLE_STORAGE", "local_memory")
+os.environ.setdefault("RECIRCLE_NLTK_WARMUP", "lazy")
+if os.environ["RECIRCLE_STORAGE"] == "sqlite":
+    os.environ.setdefault("RECIRCLE_SQLITE_PATH", os.path.join(tempfile.mkdtemp(), "projection_benchmark.db"))
+
+import app2
+
+VIEWS = (
+    ("full", ""),
+    ("slim", "view=slim"),
+)
+ROUTES = (
+    ("POST /calculate-impact", "post", "/calculate-impact", "fields=impact_score,impact_level,co2e_saved_kg"),
+    ("GET /impact-reports?limit=50", "get", "/impact-reports?limit=50", "fields=transaction_id,impact_score"),
+    ("POST /seller/<id>/review", "post", "/seller/bench-seller/review", "fields=seller.trustScore"),
+)
+REVIEW = {
+    "review": "Great seller, fast delivery. The jacket was not as described but support fixed it quickly!",
+    "rating": 4, "delivery": "fast", "recommend": "Yes", "from": "Bench", "product": "Jacket"
+}
+
+
+def body(path, rng):
+    if "review" in path:
+        return REVIEW
+    return {"category": rng.choice(app2.IMPACT_CATEGORIES), "quantity_kg": rng.randint(1, 20)}
+
+
+def measure(client, method, path, query, requests, rng):
+    """(mean body bytes, mean microseconds per request)"""
+    separator = "&" if "?" in path else "?"
+    url = f"{path}{separator}{query}" if query else path
+    size = 0
+    started = time.perf_counter()
+    for _ in range(requests):
+        if method == "post":
+            response = client.post(url, json=body(path, rng))
+        else:
+            response = client.get(url)
+        assert response.status_code == 200, response.get_data(as_text=True)
+        size += len(response.get_data())
+    return size / requests, (time.perf_counter() - started) / requests * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--reports", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=300)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    rng = random.Random(25)
+    app2.update_impact_data_batch(app2.calculate_impact_batch(
+        [rng.choice(app2.IMPACT_CATEGORIES) for _ in range(args.reports)],
+        [round(rng.uniform(0.5, 40), 2) for _ in range(args.reports)]
+    ))
+    client = app2.app.test_client()
+    client.post("/seller/bench-seller/review", json=REVIEW)  # warm the sentiment analyzer
+
+    print(f"{app2.storage.name}, {args.reports} seeded reports, {args.requests} requests each (bytes / mean us)")
+    print(f"{'':<30}" + "".join(f"{name:>18}" for name in ("full", "slim", "fields")))
+    for label, method, path, fields in ROUTES:
+        cells = []
+        for query in [query for _, query in VIEWS] + [fields]:
+            size, micros = measure(client, method, path, query, args.requests, rng)
+            cells.append(f"{size:.0f} / {micros:.0f}")
+        print(f"{label:<30}" + "".join(f"{cell:>18}" for cell in cells))
+
+
+if __name__ == "__main__":
+    main()
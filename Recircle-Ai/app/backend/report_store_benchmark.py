@@ -0,0 +1,86 @@
+"""Memory per stored impact report: nested dicts versus ImpactReportStore.
+
+Builds ``--reports`` impacts, then measures with tracemalloc what keeping
+them costs as the list of nested ``calculate_impact`` dicts the backend used
+to hold (fresh lists and timestamp/id strings per record, as before) and as
+the columnar ``ImpactReportStore``. It also times materialising the JSON
+shape back out of the store, which every served report pays::
+
+    python report_store_benchmark.py --reports 100000
+"""
+
+import argparse
+import copy
+import gc
+import logging
+import os
+import time
+import tracemalloc
+import uuid
+from datetime import datetime
+
+os.environ.setdefault("RECIRCLE_STORAGE", "local_memory")
+os.environ.setdefault("RECIRCLE_NLTK_WARMUP", "lazy")
+
+import app2
+
+
+def traced_bytes(build):
+    """Bytes still allocated by build() once it returns (the result is kept alive)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--reports", type=int, default=100000)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    count = args.reports
+    categories = [app2.IMPACT_CATEGORIES[i % len(app2.IMPACT_CATEGORIES)] for i in range(count)]
+    impacts = app2.calculate_impact_batch(categories, [0.5 + (i % 97) * 0.37 for i in range(count)])
+    now = datetime.now()
+    for impact_data in impacts:
+        impact_data["transaction_id"] = str(uuid.uuid4())
+
+    def nested_dicts():
+        records = []
+        for impact_data in impacts:
+            record = copy.deepcopy(impact_data)
+            record["calculated_at"] = now.isoformat()
+            record["transaction_id"] = str(uuid.UUID(impact_data["transaction_id"]))
+            record["created_at"] = now.isoformat()
+            records.append(record)
+        return records
+
+    def columnar_store():
+        store = app2.ImpactReportStore()
+        store.extend(impacts, now)
+        return store
+
+    records, dict_bytes = traced_bytes(nested_dicts)
+    del records
+    store, store_bytes = traced_bytes(columnar_store)
+
+    started = time.perf_counter()
+    for report in store:
+        pass
+    materialize_us = (time.perf_counter() - started) / count * 1e6
+    assert store[count - 1]["transaction_id"] == impacts[-1]["transaction_id"]
+
+    print(f"{count} reports")
+    print(f"  nested dicts      {dict_bytes / count:>8.0f} bytes/record")
+    print(f"  columnar store    {store_bytes / count:>8.0f} bytes/record  ({dict_bytes / store_bytes:.1f}x smaller)")
+    print(f"  materialise       {materialize_us:>8.1f} us/record")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Review request throughput and latency with sentiment micro-batching.
+
+For each window (0 leaves batching off) a fresh process imports app2 with
+``RECIRCLE_SENTIMENT_BATCH_WINDOW_MS`` set, and ``--threads`` client threads
+post ``--reviews`` reviews from the synthetic corpus of
+sentiment_cache_benchmark to POST /seller/<id>/review through Flask's test
+client. Reported per window: requests per second, p50 and p99 request
+latency, the batcher's average batch size and average added queueing delay,
+and how many of 300 reviews scored concurrently through the batcher differ
+from calculate_trust_score_paragraph::
+
+    python sentiment_batch_benchmark.py --windows 0,2,5 --reviews 4000 --threads 16
+"""
+
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+
+
+def child(reviews, threads):
+    logging.disable(logging.CRITICAL)
+    import app2
+    from sentiment_cache_benchmark import build_corpus
+
+    corpus = build_corpus(reviews)
+    client = app2.app.test_client()
+    client.post("/seller/bench-warmup/review", json={"review": "Great seller!", "rating": 5})
+    chunks = [corpus[index::threads] for index in range(threads)]
+    latencies = [[] for _ in range(threads)]
+
+    def post(index):
+        for number, review in enumerate(chunks[index]):
+            started = time.perf_counter()
+            response = client.post(f"/seller/bench-{index}-{number % 20}/review", json={"review": review, "rating": 4})
+            latencies[index].append(time.perf_counter() - started)
+            assert response.status_code == 200, response.get_data(as_text=True)
+
+    workers = [threading.Thread(target=post, args=(index,)) for index in range(threads)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+    batching = app2.sentiment_batcher.info() if app2.sentiment_batcher else None
+
+    # Parity: concurrent calls through the batcher against scoring each review alone
+    sample = corpus[:300]
+    results = [None] * len(sample)
+
+    def score(index):
+        for position in range(index, len(sample), 8):
+            results[position] = app2.analyze_review_sentiment(sample[position])
+
+    scorers = [threading.Thread(target=score, args=(index,)) for index in range(8)]
+    for scorer in scorers:
+        scorer.start()
+    for scorer in scorers:
+        scorer.join()
+    mismatches = sum(result != app2.calculate_trust_score_paragraph(review) for review, result in zip(sample, results))
+
+    ordered = sorted(latency for chunk in latencies for latency in chunk)
+    print(json.dumps({
+        "requests_per_s": len(ordered) / elapsed,
+        "p50_ms": ordered[len(ordered) // 2] * 1000,
+        "p99_ms": ordered[int(len(ordered) * 0.99)] * 1000,
+        "batching": batching, "mismatches": mismatches
+    }), flush=True)
+
+
+def run(window, reviews, threads):
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", "--reviews", str(reviews), "--threads", str(threads)],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env={
+            **os.environ, "RECIRCLE_SENTIMENT_BATCH_WINDOW_MS": str(window), "RECIRCLE_SENTIMENT_WORKERS": "0",
+            "RECIRCLE_STORAGE": "local_memory", "RECIRCLE_NLTK_WARMUP": "eager"
+        },
+        capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--windows", default="0,2,5")
+    parser.add_argument("--reviews", type=int, default=4000)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(args.reviews, args.threads)
+        return
+
+    print(f"{os.cpu_count()} CPU(s), {args.reviews} reviews from {args.threads} threads")
+    print(f"  {'window':<8} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'avg batch':>10} {'avg wait ms':>12}  mismatches")
+    for window in args.windows.split(","):
+        result = run(float(window), args.reviews, args.threads)
+        batching = result["batching"]
+        batch, wait = (f"{batching['avg_batch_size']:.1f}", f"{batching['avg_queue_wait_ms']:.1f}") if batching else ("-", "-")
+        label = f"{window}ms" if batching else "off"
+        print(f"  {label:<8} {result['requests_per_s']:>8,.0f} {result['p50_ms']:>8.1f} {result['p99_ms']:>8.1f} "
+              f"{batch:>10} {wait:>12}  {result['mismatches']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Review scoring latency with and without the sentence sentiment cache.
+
+Generates a synthetic mobile review corpus (short stock phrases drawn with a
+Zipf-like skew, plus about 15% order-specific sentences that never repeat)
+and times ``calculate_trust_score_paragraph`` per review with the cache
+disabled, with a cold cache, and after the cache was saved and reloaded as
+on a restart. Every cached compound is checked against the analyzer::
+
+    python sentiment_cache_benchmark.py --reviews 20000
+"""
+
+import argparse
+import logging
+import os
+import random
+import tempfile
+import time
+
+os.environ.setdefault("RECIRCLE_NLTK_WARMUP", "lazy")
+
+import app2
+
+PHRASES = (
+    "Great seller!", "Fast delivery.", "no comment", "Good product.", "As described.",
+    "Would buy again!", "Thank you!", "Excellent quality.", "Item arrived damaged.", "Slow shipping.",
+    "Very happy with the purchase.", "Not as described.", "Great communication.", "Highly recommended!",
+    "Packaging could be better.", "Good value for money.", "Never received the item.", "ok",
+    "Perfect!", "Seller was very helpful.", "Took too long to arrive.", "Exactly what I needed.",
+    "Terrible experience.", "Works fine.", "Five stars.", "Arrived early, thanks!",
+    "The size was wrong.", "Decent.", "Love it!!", "Cheap material, broke in a week.",
+)
+ITEMS = ("jacket", "phone case", "chair", "novel", "laptop", "lamp", "sneakers", "blender")
+DETAILS = ("scratch on the left side", "missing charger", "colour slightly darker", "smells new",
+           "fits perfectly", "box was open", "extra gift inside", "manual in German")
+
+
+def build_corpus(count, seed=7):
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(len(PHRASES))]
+    corpus = []
+    for n in range(count):
+        sentences = rng.choices(PHRASES, weights, k=rng.choice((1, 1, 1, 2, 2, 3)))
+        if rng.random() < 0.15:
+            sentences.append(f"Order #{n}: the {rng.choice(ITEMS)} had a {rng.choice(DETAILS)}.")
+        corpus.append(" ".join(sentences))
+    return corpus
+
+
+def time_reviews(corpus):
+    started = time.perf_counter()
+    for review in corpus:
+        app2.calculate_trust_score_paragraph(review)
+    return (time.perf_counter() - started) / len(corpus) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--reviews", type=int, default=20000)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    corpus = build_corpus(args.reviews)
+    analyzer = app2.warm_sentiment()
+    app2.calculate_trust_score_paragraph("Warm up. Both paths.")
+
+    app2.sentiment_cache = app2.SentimentCache(max_entries=0)
+    uncached_us = time_reviews(corpus)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "sentiment_cache.json")
+        app2.sentiment_cache = app2.SentimentCache(path=path)
+        cached_us = time_reviews(corpus)
+        cold = app2.sentiment_cache.stats()
+        app2.sentiment_cache.save()
+        disk_kb = os.path.getsize(path) / 1024
+
+        app2.sentiment_cache = app2.SentimentCache(path=path)
+        started = time.perf_counter()
+        app2.sentiment_cache.load()
+        load_ms = (time.perf_counter() - started) * 1000
+        reloaded_us = time_reviews(corpus)
+        reloaded = app2.sentiment_cache.stats()
+
+    mismatches = sum(
+        analyzer.polarity_scores(sentence)["compound"] != compound
+        for sentence, compound in app2.sentiment_cache.entries.items()
+    )
+    print(f"{args.reviews} reviews, {cold['entries']} distinct sentences")
+    print(f"  uncached              {uncached_us:>7.1f} us/review")
+    print(f"  cold cache            {cached_us:>7.1f} us/review  "
+          f"({cold['hit_rate']:.0%} hits, ~{cold['approx_bytes'] / 1024:.0f} KB)")
+    print(f"  reloaded from disk    {reloaded_us:>7.1f} us/review  "
+          f"({reloaded['hit_rate']:.0%} hits; {disk_kb:.0f} KB file loaded in {load_ms:.1f} ms)")
+    print(f"  cached compounds differing from polarity_scores: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
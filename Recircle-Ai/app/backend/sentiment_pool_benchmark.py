@@ -0,0 +1,96 @@
+"""Review scoring throughput inline and in the sentiment worker pool.
+
+For each worker count (0 scores inline on the request threads) a fresh
+process imports app2 with ``RECIRCLE_SENTIMENT_WORKERS`` set, so the pool
+forks at import as in production. ``--threads`` request threads then score
+the synthetic corpus of sentiment_cache_benchmark through
+``analyze_review_sentiment``. Reported per run: reviews per second, the
+pool's fallback counts, and the sentiment cache hit rate, which in pool mode
+counts the workers' lookups::
+
+    python sentiment_pool_benchmark.py --workers 0,1,2,4,8 --reviews 3000
+"""
+
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+
+
+def child(reviews, threads):
+    os.environ.setdefault("RECIRCLE_NLTK_WARMUP", "eager")
+    logging.disable(logging.CRITICAL)
+    import app2
+    from sentiment_cache_benchmark import build_corpus
+
+    corpus = build_corpus(reviews)
+    app2.warm_sentiment()
+    chunks = [corpus[index::threads] for index in range(threads)]
+    results = [None] * threads
+
+    def score(index):
+        results[index] = [app2.analyze_review_sentiment(review) for review in chunks[index]]
+
+    workers = [threading.Thread(target=score, args=(index,)) for index in range(threads)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+    pool = app2.sentiment_pool_info()
+    cache = app2.sentiment_cache.stats()
+
+    expected = {review: app2.calculate_trust_score_paragraph(review) for review in corpus[:500]}
+    mismatches = sum(
+        result != expected[review]
+        for chunk, chunk_results in zip(chunks, results)
+        for review, result in zip(chunk, chunk_results) if review in expected
+    )
+    print(json.dumps({
+        "reviews_per_s": reviews / elapsed, "mismatches": mismatches,
+        "fallbacks": pool["timeouts"] + pool["rejected"] + pool["errors"],
+        "cache": cache
+    }), flush=True)
+    if app2.sentiment_pool is not None:
+        # The forked workers hold the output pipe open until they exit
+        app2.sentiment_pool.shutdown()
+    os._exit(0)
+
+
+def run(workers, reviews, threads):
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", "--reviews", str(reviews), "--threads", str(threads)],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env={**os.environ, "RECIRCLE_SENTIMENT_WORKERS": str(workers), "RECIRCLE_STORAGE": "local_memory"},
+        capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--workers", default="0,1,2,4,8")
+    parser.add_argument("--reviews", type=int, default=3000)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(args.reviews, args.threads)
+        return
+
+    print(f"{os.cpu_count()} CPU(s), {args.reviews} reviews from {args.threads} threads")
+    for workers in (int(count) for count in args.workers.split(",")):
+        result = run(workers, args.reviews, args.threads)
+        cache = result["cache"]
+        print(f"  {'inline' if workers == 0 else f'{workers} worker(s)':<12} {result['reviews_per_s']:>8,.0f} reviews/s  "
+              f"cache hits {cache['hits']:,}/{cache['hits'] + cache['misses']:,}  "
+              f"fallbacks {result['fallbacks']}  mismatches {result['mismatches']}")
+
+
+if __name__ == "__main__":
+    main()
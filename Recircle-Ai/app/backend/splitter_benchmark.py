@@ -0,0 +1,123 @@
+"""Accuracy and latency of split_sentences against punkt's sent_tokenize.
+
+Builds synthetic reviews plus fuzzed strings of abbreviations, initials,
+decimals, ellipses, quotes, brackets, mixed marks and unicode whitespace,
+then reports
+
+- how many split exactly as ``nltk.sent_tokenize`` splits them, and how many
+  took the fast path (never reached punkt);
+- the latency of splitting a fast-path text, with punkt versus split_sentences;
+- ``calculate_trust_score_paragraph`` per review with a warm sentiment
+  cache, splitting with split_sentences versus sent_tokenize::
+
+    python splitter_benchmark.py --reviews 50000 --fuzz 200000
+"""
+
+import argparse
+import logging
+import os
+import random
+import time
+
+os.environ.setdefault("RECIRCLE_NLTK_WARMUP", "lazy")
+
+from nltk.tokenize import sent_tokenize
+
+import app2
+
+SENTENCES = (
+    "Great seller!", "Fast delivery.", "no comment", "Good product", "As described.",
+    "Would buy again!!", "Item arrived damaged...", "Slow shipping.", "Not as described?!",
+    "Highly recommended!", "ok", "Love it!!!", "Why so slow??", "Works fine.",
+    "The jacket was not as described, but support fixed it quickly!",
+)
+FUZZ_TOKENS = (
+    "Mr.", "Dr.", "e.g.", "i.e.", "U.S.", "etc.", "No.", "vs.", "J.", "K.", "Rowling", "4.5", "3.",
+    "stars", "great", "item", "seller", "...", "..", "!", "?", "?!", "!!", "!?", ".", ",", ";", "(",
+    ")", '"', "'", "“", "”", "«", "»", " ", "\t", "\n", " ", ":)", "5/5", "$19.99", "A.",
+)
+
+
+def synthetic_reviews(count, seed):
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(len(SENTENCES))]
+    return [" ".join(rng.choices(SENTENCES, weights, k=rng.choice((1, 1, 1, 2, 3)))) for _ in range(count)]
+
+
+def fuzzed_texts(count, seed):
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(count):
+        tokens = rng.choices(FUZZ_TOKENS, k=rng.randint(1, 10))
+        texts.append("".join(token + rng.choice(("", " ", " ", "  ")) for token in tokens))
+    return texts
+
+
+def per_call_us(function, texts, repeat=3):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            function(text)
+    return (time.perf_counter() - started) / (repeat * len(texts)) * 1e6
+
+
+def check_accuracy(texts):
+    """(texts split as sent_tokenize does, texts that needed punkt)"""
+    app2.warm_sentiment()
+    punkt = app2.sentence_tokenize
+    punkt_calls = 0
+
+    def counting_punkt(text):
+        nonlocal punkt_calls
+        punkt_calls += 1
+        return punkt(text)
+
+    app2.sentence_tokenize = counting_punkt
+    try:
+        identical = sum(app2.split_sentences(text) == sent_tokenize(text) for text in texts)
+    finally:
+        app2.sentence_tokenize = punkt
+    return identical, punkt_calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--reviews", type=int, default=50000)
+    parser.add_argument("--fuzz", type=int, default=200000)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    reviews = synthetic_reviews(args.reviews, seed=14)
+    fuzzed = fuzzed_texts(args.fuzz, seed=15)
+    review_identical, review_punkt = check_accuracy(reviews)
+    fuzz_identical, _ = check_accuracy(fuzzed)
+    print(f"identical to sent_tokenize: {review_identical + fuzz_identical:,}/{len(reviews) + len(fuzzed):,}  "
+          f"(reviews {review_identical:,}/{len(reviews):,}, fuzzed {fuzz_identical:,}/{len(fuzzed):,})")
+    print(f"synthetic reviews on the fast path: {1 - review_punkt / len(reviews):.0%}")
+
+    fast = {
+        text for text in reviews
+        if app2._ONE_SENTENCE.fullmatch(text.rstrip()) or app2._TRAILING_MARKS.fullmatch(text.rstrip())
+    }
+    punkt = app2.sentence_tokenize
+    print(f"fast-path split            punkt {per_call_us(punkt, list(fast)):6.1f} us   "
+          f"split_sentences {per_call_us(app2.split_sentences, list(fast)):6.1f} us")
+
+    sample = reviews[:20000]
+    for review in sample:
+        app2.calculate_trust_score_paragraph(review)  # warm the sentiment cache
+    split = app2.split_sentences
+    timings = {}
+    for name, splitter in (("sent_tokenize", sent_tokenize), ("split_sentences", split)):
+        app2.split_sentences = splitter
+        timings[name] = (
+            per_call_us(app2.calculate_trust_score_paragraph, [review for review in sample if review in fast]),
+            per_call_us(app2.calculate_trust_score_paragraph, sample)
+        )
+    app2.split_sentences = split
+    for name, (fast_path, mix) in timings.items():
+        print(f"trust score, {name:<15} fast-path reviews {fast_path:6.1f} us   full mix {mix:6.1f} us")
+
+
+if __name__ == "__main__":
+    main()
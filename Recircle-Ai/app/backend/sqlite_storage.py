@@ -0,0 +1,247 @@
+"""SQLite storage engine for impact reports and seller trust state.
+
+Runs the database in WAL mode so dashboard reads never block writers, keeps
+one connection per thread, and serves report reads from indexes on
+category, created_at and impact_score. Impact rows use the same flat layout
+as ImpactReportStore rows; the caller supplies ``encode``/``decode`` to turn
+records into rows and back.
+
+One database can be shared by several worker processes: ``log_position``
+lets each process follow the impact table as an append-only log (ids only
+grow until a reset, which bumps ``generation``), and seller updates run in
+``seller_transaction`` so read-modify-writes are atomic across processes.
+"""
+
+import contextlib
+import sqlite3
+import threading
+
+IMPACT_COLUMNS = (
+    "category_code", "impact_score", "calculated_at", "created_at", "transaction_id",
+    "quantity_kg", "co2_saved_kg", "co2e_saved_kg", "water_saved_l", "waste_diverted_kg",
+    "social_value", "avoided_production", "avoided_methane_co2e", "avoided_processing",
+    "avoided_transport", "material_circularity"
+)
+
+SELLER_COLUMNS = (
+    "name", "trustScore", "totalReviews", "totalRating", "averageRating",
+    "recommendedCount", "recommendRate", "createdAt", "updatedAt"
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS impact_reports (
+    id INTEGER PRIMARY KEY,
+    category_code INTEGER NOT NULL,
+    impact_score INTEGER NOT NULL,
+    calculated_at INTEGER NOT NULL,
+    created_at INTEGER NOT NULL,
+    transaction_id TEXT NOT NULL,
+    quantity_kg REAL, co2_saved_kg REAL, co2e_saved_kg REAL, water_saved_l REAL,
+    waste_diverted_kg REAL, social_value REAL, avoided_production REAL,
+    avoided_methane_co2e REAL, avoided_processing REAL, avoided_transport REAL,
+    material_circularity REAL
+);
+CREATE INDEX IF NOT EXISTS idx_impact_category ON impact_reports (category_code);
+CREATE INDEX IF NOT EXISTS idx_impact_created_at ON impact_reports (created_at);
+CREATE INDEX IF NOT EXISTS idx_impact_score ON impact_reports (impact_score DESC, id);
+CREATE TABLE IF NOT EXISTS meta (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    generation INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (id, generation) VALUES (1, 0);
+CREATE TABLE IF NOT EXISTS sellers (
+    id TEXT PRIMARY KEY,
+    name TEXT, trustScore REAL, totalReviews INTEGER, totalRating REAL,
+    averageRating REAL, recommendedCount INTEGER, recommendRate INTEGER,
+    createdAt TEXT, updatedAt TEXT
+);
+"""
+
+_SELECT_IMPACTS = "SELECT id, " + ", ".join(IMPACT_COLUMNS) + " FROM impact_reports"
+_INSERT_IMPACT = (
+    "INSERT INTO impact_reports (" + ", ".join(IMPACT_COLUMNS) + ") VALUES ("
+    + ", ".join("?" * len(IMPACT_COLUMNS)) + ")"
+)
+_UPSERT_SELLER = (
+    "INSERT OR REPLACE INTO sellers (id, " + ", ".join(SELLER_COLUMNS) + ") VALUES ("
+    + ", ".join("?" * (len(SELLER_COLUMNS) + 1)) + ")"
+)
+_SELECT_SELLER = "SELECT " + ", ".join(SELLER_COLUMNS) + " FROM sellers WHERE id = ?"
+
+
+class _Lease:
+    """A connection held by one thread, handed back to the idle list when that thread exits"""
+
+    __slots__ = ("conn", "idle")
+
+    def __init__(self, conn, idle):
+        self.conn = conn
+        self.idle = idle
+
+    def __del__(self):
+        self.idle.append(self.conn)
+
+
+class SQLiteStorage:
+    name = "sqlite"
+
+    def __init__(self, path, encode, decode):
+        self.path = path
+        self.encode = encode
+        self.decode = decode
+        self._local = threading.local()
+        self._idle = []
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        self._connection().executescript(SCHEMA)
+
+    def _connection(self):
+        """Per-thread connection; sqlite3 caches the prepared statements on each one.
+        
+        The threaded server starts a thread per request, so a finished thread's
+        connection is reused by the next one instead of opening a new one.
+        """
+        lease = getattr(self._local, "lease", None)
+        if lease is None:
+            try:
+                conn = self._idle.pop()
+            except IndexError:
+                conn = sqlite3.connect(self.path, check_same_thread=False, cached_statements=64)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                with self._connections_lock:
+                    self._connections.append(conn)
+            lease = self._local.lease = _Lease(conn, self._idle)
+        return lease.conn
+
+    def after_fork(self):
+        """Forget connections inherited from the parent; SQLite handles must not cross a fork"""
+        with self._connections_lock:
+            self._connections = []
+        self._idle = []
+        self._local = threading.local()
+    
+    def close(self):
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections = []
+        self._idle = []
+        self._local = threading.local()
+
+    # ---------- impact reports ----------
+
+    def count(self):
+        return self._connection().execute("SELECT COUNT(*) FROM impact_reports").fetchone()[0]
+
+    def add_impacts(self, impacts, recorded_at):
+        rows = [self.encode(impact_data, recorded_at) for impact_data in impacts]
+        self.add_impact_rows(rows)
+        return rows
+
+    def add_impact_rows(self, rows):
+        conn = self._connection()
+        with conn:
+            conn.executemany(_INSERT_IMPACT, rows)
+
+    def _reports(self, sql, params, decode=None):
+        decode = decode or self.decode
+        return [decode(row[1:]) for row in self._connection().execute(sql, params)]
+
+    def recent_reports(self, limit, decode=None):
+        """Latest `limit` reports (all when limit <= 0), in insertion order;
+        ``decode`` replaces the caller-supplied row decoder for this read"""
+        if limit <= 0:
+            return self._reports(_SELECT_IMPACTS + " ORDER BY id", (), decode)
+        reports = self._reports(_SELECT_IMPACTS + " ORDER BY id DESC LIMIT ?", (limit,), decode)
+        reports.reverse()
+        return reports
+
+    def top_reports(self, limit, decode=None):
+        return self._reports(_SELECT_IMPACTS + " ORDER BY impact_score DESC, id LIMIT ?", (limit,), decode)
+
+    def page_reports(self, cursor, limit, decode=None):
+        # Row ids are contiguous from 1, so id > cursor is "position >= cursor"
+        return self._reports(_SELECT_IMPACTS + " WHERE id > ? ORDER BY id LIMIT ?", (cursor, limit), decode)
+
+    def iter_rows(self):
+        for row in self._connection().execute(_SELECT_IMPACTS + " ORDER BY id"):
+            yield list(row[1:])
+
+    def log_position(self):
+        """(generation, highest id): changes whenever any process stores or resets reports"""
+        return self._connection().execute(
+            "SELECT generation, (SELECT COALESCE(MAX(id), 0) FROM impact_reports) FROM meta"
+        ).fetchone()
+    
+    def export_end(self):
+        return self._connection().execute("SELECT COALESCE(MAX(id), 0) FROM impact_reports").fetchone()[0]
+    
+    def export_rows(self, cursor, end, categories=None, since_us=None, until_us=None, chunk_size=1000):
+        """Chunks of (id, row) for cursor < id <= end passing the filters.
+        
+        Each chunk is its own keyset query on id, so a slow consumer never holds
+        a read transaction open.
+        """
+        where = ["id > ?", "id <= ?"]
+        filters = []
+        if categories is not None:
+            where.append("category_code IN (" + ", ".join("?" * len(categories)) + ")")
+            filters.extend(sorted(categories))
+        if since_us is not None:
+            where.append("created_at >= ?")
+            filters.append(since_us)
+        if until_us is not None:
+            where.append("created_at < ?")
+            filters.append(until_us)
+        sql = _SELECT_IMPACTS + " WHERE " + " AND ".join(where) + " ORDER BY id LIMIT ?"
+        while True:
+            rows = self._connection().execute(sql, (cursor, end, *filters, chunk_size)).fetchall()
+            if not rows:
+                return
+            cursor = rows[-1][0]
+            yield [(row[0], list(row[1:])) for row in rows]
+    
+    def reset(self):
+        """Delete every report and return the new generation"""
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM impact_reports")
+            conn.execute("UPDATE meta SET generation = generation + 1")
+            return conn.execute("SELECT generation FROM meta").fetchone()[0]
+
+    # ---------- sellers ----------
+
+    def seller_count(self):
+        return self._connection().execute("SELECT COUNT(*) FROM sellers").fetchone()[0]
+
+    @contextlib.contextmanager
+    def seller_transaction(self):
+        """Hold the database write lock around a seller read-modify-write"""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+        if conn.in_transaction:
+            conn.commit()
+    
+    def get_seller(self, seller_id):
+        row = self._connection().execute(_SELECT_SELLER, (seller_id,)).fetchone()
+        if row is None:
+            return None
+        return dict(zip(SELLER_COLUMNS, row))
+
+    def save_seller(self, seller_id, seller_data):
+        self.save_sellers([(seller_id, seller_data)])
+
+    def save_sellers(self, items):
+        conn = self._connection()
+        with conn:
+            conn.executemany(_UPSERT_SELLER, [
+                (seller_id, *(seller_data.get(column) for column in SELLER_COLUMNS))
+                for seller_id, seller_data in items
+            ])
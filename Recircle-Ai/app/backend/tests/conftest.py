@@ -0,0 +1,52 @@
+"""Shared setup for the backend tests.
+
+app2 reads its configuration from the environment at import, so the tests
+pin an in-memory, lazily warmed backend before anything imports it. Tests
+that need another configuration (journal, SQLite) run the backend in a
+subprocess through ``run_backend``.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+for name in ("RECIRCLE_DATA_DIR", "RECIRCLE_SQLITE_PATH", "RECIRCLE_SENTIMENT_CACHE_PATH", "RECIRCLE_VADER_IMAGE"):
+    os.environ.pop(name, None)
+os.environ.update(
+    RECIRCLE_STORAGE="local_memory",
+    RECIRCLE_NLTK_WARMUP="lazy",
+    RECIRCLE_LOG_LEVEL="WARNING",
+    RECIRCLE_SENTIMENT_WORKERS="0",
+    RECIRCLE_SENTIMENT_BATCH_WINDOW_MS="0",
+)
+
+
+@pytest.fixture
+def client():
+    import app2
+    return app2.app.test_client()
+
+
+@pytest.fixture
+def run_backend():
+    """Run a script in a fresh process configured by ``env``; returns the JSON it printed last.
+
+    app2 logs to stdout too, so the result is read from the final line.
+    """
+
+    def run(script, timeout=300, **env):
+        result = subprocess.run(
+            [sys.executable, "-c", textwrap.dedent(script)],
+            cwd=BACKEND_DIR, env={**os.environ, **env}, capture_output=True, text=True, timeout=timeout
+        )
+        assert result.returncode == 0, result.stderr[-4000:]
+        return json.loads(result.stdout.strip().splitlines()[-1])
+
+    return run
@@ -0,0 +1,51 @@
+"""FastJSONProvider keeps Flask's JSON output and honours json.dumps options."""
+
+import json
+from datetime import datetime
+
+import numpy as np
+import pytest
+from flask.json.provider import DefaultJSONProvider
+
+import app2
+from fast_json import FastJSONProvider, JSONFragment, orjson
+
+BACKENDS = ["stdlib"] + (["orjson"] if orjson is not None else [])
+DOCUMENT = {
+    "b": [1, 2.5, None, True], "a": {"nested": "ascii"}, "when": datetime(2026, 10, 18, 13, 5),
+    "count": np.int64(3), "ratio": np.float64(0.25), "pair": (1, 2)
+}
+PLAIN = {"b": [1, 2.5, None, True], "a": {"nested": "ascii", "emoji": "🌱"}, "n": 10 ** 30}
+
+
+@pytest.fixture(params=BACKENDS)
+def provider(request):
+    return FastJSONProvider(app2.app, request.param)
+
+
+def test_dumps_defaults_to_compact_documents(provider):
+    assert provider.dumps(DOCUMENT) == DefaultJSONProvider(app2.app).dumps(
+        {**DOCUMENT, "count": 3, "ratio": 0.25, "pair": [1, 2]}, separators=(",", ":")
+    )
+
+
+def test_dumps_passes_options_through(provider):
+    assert provider.dumps(PLAIN, indent=2) == json.dumps(PLAIN, indent=2, sort_keys=True)
+    assert provider.dumps(PLAIN, ensure_ascii=False) == json.dumps(
+        PLAIN, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+    )
+    assert provider.dumps(PLAIN, separators=(", ", ": ")) == json.dumps(PLAIN, sort_keys=True)
+    assert provider.dumps(PLAIN, sort_keys=False) == json.dumps(PLAIN, separators=(",", ":"))
+
+
+def test_dumps_with_options_unwraps_fragments(provider):
+    fragment = JSONFragment({"ok": True})
+    assert provider.dumps(fragment, indent=2) == json.dumps({"ok": True}, indent=2)
+    assert json.loads(provider.dumps({"inner": fragment}, ensure_ascii=False)) == {"inner": {"ok": True}}
+
+
+def test_responses_match_flask_provider(provider):
+    with app2.app.test_request_context():
+        body = provider.response(PLAIN).get_data(as_text=True)
+        assert json.loads(body) == json.loads(DefaultJSONProvider(app2.app).response(PLAIN).get_data(as_text=True))
+        assert body.endswith("\n") and "\n" not in body[:-1]
@@ -0,0 +1,77 @@
+"""The vectorised batch impact engine must reproduce calculate_impact exactly."""
+
+import random
+
+import app2
+
+# Unknown categories fall back to Food on both paths
+CATEGORIES = app2.IMPACT_CATEGORIES + ["Toys", ""]
+
+
+def random_manifest(count, seed):
+    rng = random.Random(seed)
+    categories, quantities, distances = [], [], []
+    for _ in range(count):
+        categories.append(rng.choice(CATEGORIES))
+        kind = rng.random()
+        if kind < 0.2:
+            quantities.append(rng.randint(1, 40))
+        elif kind < 0.4:
+            # Few decimals put many products on the .5 ties _round2 has to resolve
+            quantities.append(round(rng.uniform(0.01, 25), rng.choice((1, 2, 3))))
+        else:
+            quantities.append(rng.uniform(0.001, 2000))
+        distances.append(0 if rng.random() < 0.5 else round(rng.uniform(0, 1500), rng.choice((0, 1, 2))))
+    return categories, quantities, distances
+
+
+def scalar_impacts(categories, quantities, distances=None):
+    impacts = []
+    for index, (category, quantity) in enumerate(zip(categories, quantities)):
+        transaction = {"category": category, "quantity_kg": quantity}
+        if distances is not None:
+            transaction["distance_km"] = distances[index]
+        impacts.append(app2.calculate_impact(transaction))
+    return impacts
+
+
+def assert_same_impacts(batch, scalar, inputs):
+    assert len(batch) == len(scalar)
+    mismatches = [index for index, (got, expected) in enumerate(zip(batch, scalar)) if got != expected]
+    assert not mismatches, (
+        f"{len(mismatches)} mismatches, first for input {inputs[mismatches[0]]}: "
+        f"{batch[mismatches[0]]} != {scalar[mismatches[0]]}"
+    )
+
+
+def test_batch_matches_scalar_path():
+    categories, quantities, distances = random_manifest(20000, seed=1)
+    batch = app2.calculate_impact_batch(categories, quantities, distances)
+    scalar = scalar_impacts(categories, quantities, distances)
+    assert_same_impacts(batch, scalar, list(zip(categories, quantities, distances)))
+
+
+def test_batch_without_distances_matches_scalar_default():
+    categories, quantities, _ = random_manifest(2000, seed=2)
+    batch = app2.calculate_impact_batch(categories, quantities)
+    scalar = scalar_impacts(categories, quantities)
+    assert_same_impacts(batch, scalar, list(zip(categories, quantities)))
+
+
+def test_batch_endpoint_stores_manifest_in_one_update(client):
+    categories, quantities, distances = random_manifest(500, seed=3)
+    before_impacts = app2.csr_summary["total_impacts"]
+    before_version = app2.aggregate_snapshot["version"]
+
+    response = client.post("/calculate-impact/batch", json={
+        "category": categories, "quantity_kg": quantities, "distance_km": distances
+    })
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["count"] == 500
+    stored_fields = ("calculated_at", "transaction_id", "created_at")
+    returned = [{k: v for k, v in impact.items() if k not in stored_fields} for impact in body["impacts"]]
+    assert returned == scalar_impacts(categories, quantities, distances)
+    assert app2.csr_summary["total_impacts"] == before_impacts + 500
+    assert app2.aggregate_snapshot["version"] == before_version + 1
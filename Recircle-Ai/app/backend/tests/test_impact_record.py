@@ -0,0 +1,135 @@
+"""Full and projected impact records come from one builder, impact_record."""
+
+import random
+
+import app2
+from test_impact_batch import random_manifest
+
+BOOKS_3KG = {
+    "co2_saved_kg": 18.45, "co2e_saved_kg": 21.45, "water_saved_l": 36, "waste_diverted_kg": 2.4,
+    "social_value": 750.75, "category": "Books", "quantity_kg": 3, "carbon_footprint_reduction": 21.45,
+    "compliance_standards": {
+        "ghg_protocol": {
+            "total_co2_saved_kg": 18.45, "total_co2e_saved_kg": 21.45,
+            "ghg_breakdown": {
+                "avoided_production": 18.0, "avoided_methane_co2e": 3.0,
+                "avoided_processing": 0.45, "avoided_transport": 0.0
+            },
+            "compliance": "GHG Protocol Scope 3", "carbon_footprint_reduction": 21.45
+        },
+        "circular_economy": {
+            "material_circularity": 2.85, "lifetime_extension_years": 10.0, "value_retention_rate": 0.8,
+            "circular_economy_principles": [
+                "Design out waste and pollution", "Keep products and materials in use", "Regenerate natural systems"
+            ],
+            "unep_alignment": "Circularity Gap Reporting Framework"
+        },
+        "iso_14040": {
+            "lca_boundary": "cradle-to-grave",
+            "impact_categories": ["climate_change", "water_use", "resource_depletion"],
+            "data_quality": "industry_average"
+        }
+    },
+    "impact_score": 403, "impact_level": "Green Guardian 🌿"
+}
+
+
+def dotted_fields(document, prefix=""):
+    fields = []
+    for key, value in document.items():
+        fields.append(prefix + key)
+        if isinstance(value, dict):
+            fields.extend(dotted_fields(value, f"{prefix}{key}."))
+    return fields
+
+
+def stored_rows(count, seed):
+    categories, quantities, distances = random_manifest(count, seed)
+    return [
+        app2.calculate_impact_row(
+            {"category": category, "quantity_kg": quantity, "distance_km": distance},
+            f"txn-{index}", app2.datetime(2026, 1, 1) + app2.timedelta(seconds=index)
+        )
+        for index, (category, quantity, distance) in enumerate(zip(categories, quantities, distances))
+    ]
+
+
+def test_calculate_impact_keeps_its_shape():
+    assert app2.calculate_impact({"category": "Books", "quantity_kg": 3}) == BOOKS_3KG
+
+
+def test_projectable_fields_cover_the_stored_record():
+    for row in stored_rows(50, seed=25):
+        assert list(app2.projectable_fields("impact")) == dotted_fields(app2.ImpactReportStore.record_from_row(row))
+
+
+def test_projections_select_from_the_full_record():
+    slim = app2.compile_projection("impact", app2.IMPACT_SLIM_FIELDS)
+    nested = app2.compile_projection("impact", ("compliance_standards.circular_economy.value_retention_rate",))
+    for row in stored_rows(200, seed=26):
+        record = app2.ImpactReportStore.record_from_row(row)
+        assert app2.impact_record(row, slim, stamped=True) == {field: record[field] for field in app2.IMPACT_SLIM_FIELDS}
+        assert app2.impact_record(row, nested, stamped=True) == {"compliance_standards": {"circular_economy": {
+            "value_retention_rate": record["compliance_standards"]["circular_economy"]["value_retention_rate"]
+        }}}
+
+
+def test_projections_skip_omitted_sub_objects(monkeypatch):
+    def unwanted(*args):
+        raise AssertionError("built an omitted sub-object")
+
+    row = stored_rows(1, seed=28)[0]
+    for name in ("ghg_protocol_record", "circular_economy_record"):
+        monkeypatch.setattr(app2, name, unwanted)
+    app2.impact_record(row, app2.compile_projection("impact", app2.IMPACT_SLIM_FIELDS), stamped=True)
+    app2.impact_record(row, app2.compile_projection("impact", ("compliance_standards.iso_14040",)))
+
+
+def test_compile_projection_merges_and_rejects_fields():
+    assert app2.compile_projection("impact", ("compliance_standards.iso_14040.lca_boundary", "compliance_standards")) \
+        == {"compliance_standards": True}
+    assert app2.compile_projection("impact", ("compliance_standards", "compliance_standards.iso_14040")) \
+        == {"compliance_standards": True}
+    try:
+        app2.compile_projection("impact", ("category", "nope.field"))
+    except ValueError as exc:
+        assert "nope.field" in str(exc)
+    else:
+        raise AssertionError("unknown field accepted")
+
+
+def test_views_report_the_same_quantity(client):
+    for quantity in (3, 2.5):
+        responses = [
+            client.post(f"/calculate-impact{query}", json={"category": "Books", "quantity_kg": quantity}).get_json()
+            for query in ("", "?view=slim", "?fields=quantity_kg,compliance_standards.ghg_protocol")
+        ]
+        assert [response["impact"]["quantity_kg"] for response in responses] == [quantity] * 3
+        assert [type(response["impact"]["quantity_kg"]) for response in responses] == [type(quantity)] * 3
+        full, slim, fields = (response["impact"] for response in responses)
+        assert slim.keys() == set(app2.IMPACT_SLIM_FIELDS)
+        assert fields["compliance_standards"] == {"ghg_protocol": full["compliance_standards"]["ghg_protocol"]}
+
+
+def test_review_projections_select_from_the_full_response(client):
+    full = client.post("/seller/proj-1/review", json={"review": "Great seller! Fast delivery.", "rating": 5}).get_json()
+    slim = client.post("/seller/proj-2/review?view=slim", json={"review": "Great seller! Fast delivery.", "rating": 5}).get_json()
+    assert slim.keys() == {"message", "review", "seller", "trust_score_change", "analysis"}
+    assert slim["review"] == {"score": full["review"]["score"]}
+    assert slim["analysis"] == {key: full["analysis"][key] for key in ("final_score", "component_scores")}
+    # Different sellers, same history
+    assert {key: value for key, value in slim["seller"].items() if key not in ("id", "name")} \
+        == {key: value for key, value in full["seller"].items() if key not in ("id", "name")}
+
+
+def test_standalone_metrics_match_the_record():
+    rng = random.Random(27)
+    for category in app2.IMPACT_CATEGORIES:
+        quantity, distance = round(rng.uniform(0.1, 50), 2), round(rng.uniform(0, 500), 1)
+        standards = app2.calculate_impact(
+            {"category": category, "quantity_kg": quantity, "distance_km": distance}
+        )["compliance_standards"]
+        assert app2.calculate_ghg_compliant_impact(category, quantity, distance) == standards["ghg_protocol"]
+        assert app2.calculate_circular_economy_metrics(category, quantity) == standards["circular_economy"]
+    unknown = app2.calculate_circular_economy_metrics("Toys", 4)
+    assert (unknown["material_circularity"], unknown["lifetime_extension_years"], unknown["value_retention_rate"]) == (0, 0, 0)
@@ -0,0 +1,34 @@
+"""App records go through the queue and request sampling even when the host configured logging first."""
+
+PRECONFIGURED_ROOT = """
+    import io, json, logging
+
+    host = io.StringIO()
+    # As gunicorn and pytest do before the app is imported
+    logging.basicConfig(level=logging.WARNING, handlers=[logging.StreamHandler(host)])
+
+    import app2
+
+    written = io.StringIO()
+    app2.log_writer.setStream(written)
+    client = app2.app.test_client()
+    client.get("/ping")
+    client.get("/health")
+    app2.logger.warning("outside a request")
+    app2.log_listener.stop()
+    print(json.dumps({
+        "queued": isinstance(app2.logger.handlers[0], logging.handlers.QueueHandler),
+        "written": written.getvalue().splitlines(),
+        "host": host.getvalue().splitlines()
+    }), flush=True)
+"""
+
+
+def test_app_logger_is_wired_under_a_configured_root(run_backend):
+    result = run_backend(PRECONFIGURED_ROOT, RECIRCLE_LOG_LEVEL="INFO", RECIRCLE_LOG_SAMPLE_ROUTES="/ping=0")
+    assert result["queued"]
+    assert not any("/ping" in line for line in result["written"])
+    assert any("GET /health -> 200" in line for line in result["written"])
+    assert result["written"][-1].endswith("outside a request")
+    # Records are not written a second time by the host's handlers
+    assert result["host"] == []
@@ -0,0 +1,42 @@
+"""split_sentences agrees with punkt and keeps simple, cached reviews off NLTK."""
+
+import json
+
+from nltk.tokenize import sent_tokenize
+
+import app2
+from splitter_benchmark import fuzzed_texts, synthetic_reviews
+
+CACHED_REVIEWS = """
+    import json, sys
+    import app2
+
+    single = app2.calculate_trust_score_paragraph("Great seller!")
+    batch = app2.calculate_trust_scores_batch(["Fast delivery.", "Love it!!!", "no comment"])
+    print(json.dumps({
+        "single": single[1], "batch": [score for _, score in batch],
+        "nltk_state": app2.nltk_status["state"], "nltk_imported": "nltk" in sys.modules
+    }), flush=True)
+"""
+
+
+def test_split_sentences_matches_sent_tokenize():
+    texts = synthetic_reviews(5000, seed=1) + fuzzed_texts(20000, seed=2)
+    mismatches = [text for text in texts if app2.split_sentences(text) != sent_tokenize(text)]
+    assert not mismatches, f"{len(mismatches)} of {len(texts)} differ, e.g. {mismatches[0]!r}"
+
+
+def test_cached_fast_path_reviews_do_not_load_nltk(tmp_path, run_backend):
+    sentences = ("Great seller!", "Fast delivery.", "Love it!!", "!")
+    expected = {
+        "single": app2.calculate_trust_score_paragraph("Great seller!")[1],
+        "batch": [score for _, score in app2.calculate_trust_scores_batch(["Fast delivery.", "Love it!!!", "no comment"])]
+    }
+    cache_path = tmp_path / "sentiment_cache.json"
+    cache_path.write_text(json.dumps([[sentence, app2.sentiment_cache.compound(sentence)] for sentence in sentences]))
+
+    result = run_backend(CACHED_REVIEWS, RECIRCLE_SENTIMENT_CACHE_PATH=str(cache_path))
+
+    assert {"single": result["single"], "batch": result["batch"]} == expected
+    assert result["nltk_state"] == "cold"
+    assert not result["nltk_imported"]
@@ -0,0 +1,21 @@
+"""Pool-scored reviews match inline scoring, and the workers' cache lookups are counted."""
+
+POOL_SCORING = """
+    import json
+    import app2
+    from sentiment_cache_benchmark import build_corpus
+
+    corpus = build_corpus(300)
+    results = [app2.analyze_review_sentiment(review) for review in corpus]
+    cache = app2.sentiment_cache.stats()
+    app2.sentiment_pool.shutdown()
+    print(json.dumps({"results": results, "lookups": cache["hits"] + cache["misses"], "hits": cache["hits"]}), flush=True)
+"""
+
+
+def test_pool_scores_and_counts_like_inline(run_backend):
+    inline = run_backend(POOL_SCORING.replace("app2.sentiment_pool.shutdown()", ""))
+    pooled = run_backend(POOL_SCORING, RECIRCLE_SENTIMENT_WORKERS="2", RECIRCLE_SENTIMENT_TIMEOUT="30")
+    assert pooled["results"] == inline["results"]
+    assert pooled["lookups"] == inline["lookups"] > 0
+    assert pooled["hits"] > 0
@@ -0,0 +1,50 @@
+"""The vectorised VADER scorer reproduces stock compounds and review trust scores."""
+
+import app2
+from vader_batch import BatchSentimentScorer
+from vader_batch_benchmark import corpus, stock_compounds
+
+
+def test_batch_compounds_match_stock_vader():
+    sentences = corpus(reviews=2000, mixes=6000)
+    expected = stock_compounds(sentences)
+    actual = BatchSentimentScorer(app2.warm_sentiment()).compounds(sentences)
+    # Bit-identical on CPython 3.11; newer versions may differ by a few ulp (see vader_batch)
+    deviations = [abs(a - b) for a, b in zip(actual, expected)]
+    assert len(actual) == len(sentences)
+    assert max(deviations) < 1e-12
+    assert [round(a, 4) for a in actual] == [round(b, 4) for b in expected]
+
+
+def test_batch_trust_scores_match_per_review_path():
+    reviews = [" ".join(pair) for pair in zip(corpus(reviews=300, mixes=0), corpus(reviews=0, mixes=300))]
+    reviews += ["", "no comment", "   "]
+    assert app2.calculate_trust_scores_batch(reviews) == [
+        app2.calculate_trust_score_paragraph(review) for review in reviews
+    ]
+
+
+def test_batch_scores_only_uncached_sentences(monkeypatch):
+    monkeypatch.setattr(app2, "sentiment_cache", app2.SentimentCache())
+    reviews = [" ".join(pair) for pair in zip(corpus(reviews=120, mixes=0), corpus(reviews=0, mixes=120))]
+    expected = [app2.calculate_trust_score_paragraph(review) for review in reviews[:60]]
+    scorer = app2.get_batch_sentiment_scorer()
+    scored = []
+    monkeypatch.setattr(scorer, "compounds", lambda sentences: scored.extend(sentences) or type(scorer).compounds(scorer, sentences))
+
+    before = app2.sentiment_cache.stats()
+    assert app2.calculate_trust_scores_batch(reviews[:60]) == expected
+    assert scored == []
+    assert app2.sentiment_cache.stats()["hits"] > before["hits"]
+
+    fresh = app2.calculate_trust_scores_batch(reviews)
+    cached = {app2.sentiment_cache.normalize(sentence) for review in reviews[:60] for sentence in app2.split_sentences(review)}
+    assert scored and not cached & {app2.sentiment_cache.normalize(sentence) for sentence in scored}
+    assert app2.calculate_trust_scores_batch(reviews) == fresh
+    assert len(scored) == len(set(scored))
+
+
+def test_batch_outputs_are_separate_lists():
+    outputs = app2.calculate_trust_scores_batch(["", "   "])
+    outputs[0][0].append("changed")
+    assert outputs[1] == ([], 50.0)
@@ -0,0 +1,67 @@
+"""An analyzer served from a lexicon image scores exactly like the stock analyzer."""
+
+import random
+
+import pytest
+from nltk.sentiment.vader import SentimentIntensityAnalyzer, VaderConstants
+
+from vader_image import LexiconImage, build_from_nltk, image_analyzer
+
+REVIEWS = [
+    "Great seller!", "no comment", "ok", "Fast delivery. Item exactly as described.",
+    "The jacket was not as described, but support fixed it quickly!",
+    "Terrible packaging... box arrived crushed. Would NOT buy again!!",
+    "It isn't bad at all", "Never had such a GREAT experience!!!", "kind of ok I guess :)",
+    "The product is extremely good but the shipping was incredibly slow",
+    "not very happy, not unhappy either", "Sort of works?? barely...", "😀 love it 😀",
+    "Seller was helpful; without doubt the best price.", "Don't buy. Waste of money!",
+    "The least I can say: it's the shit", "yeah right, as if", "Best. Seller. Ever.",
+]
+
+
+@pytest.fixture(scope="module")
+def analyzers(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("vader") / "vader_lexicon.img")
+    build_from_nltk(path)
+    image = LexiconImage(path)
+    yield image, image_analyzer(image), SentimentIntensityAnalyzer()
+    image.close()
+
+
+def random_reviews(stock, count, seed):
+    """Sentences mixing lexicon words with negations, boosters, caps, contrast and emphasis"""
+    rng = random.Random(seed)
+    lexicon_words = sorted(stock.lexicon)
+    boosters = sorted(VaderConstants.BOOSTER_DICT)
+    negations = sorted(VaderConstants.NEGATE)
+    fillers = ["the", "item", "seller", "was", "and", "but", "kind of", "at all", "without doubt", "least"]
+    reviews = []
+    for _ in range(count):
+        words = []
+        for _ in range(rng.randint(1, 14)):
+            pool = rng.choices((lexicon_words, boosters, negations, fillers), (5, 2, 1, 3))[0]
+            word = rng.choice(pool)
+            words.append(word.upper() if rng.random() < 0.1 else word)
+        reviews.append(" ".join(words) + rng.choice(("", ".", "!", "!!", "?", "?!", "...")))
+    return reviews
+
+
+def test_image_tables_match_nltk(analyzers):
+    image, _, stock = analyzers
+    assert dict(image.lexicon.items()) == {word: value for word, value in stock.lexicon.items() if word}
+    assert dict(image.booster.items()) == VaderConstants.BOOSTER_DICT
+    assert set(image.negate) == set(VaderConstants.NEGATE)
+
+
+def test_image_scores_match_stock_analyzer(analyzers):
+    _, from_image, stock = analyzers
+    corpus = REVIEWS + random_reviews(stock, 5000, seed=12)
+    mismatches = [text for text in corpus if from_image.polarity_scores(text) != stock.polarity_scores(text)]
+    assert not mismatches, f"{len(mismatches)} of {len(corpus)} differ, e.g. {mismatches[0]!r}"
+
+
+def test_rejects_files_that_are_not_images(tmp_path):
+    path = tmp_path / "not_an_image.img"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        LexiconImage(str(path))
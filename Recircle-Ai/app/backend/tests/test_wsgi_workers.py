@@ -0,0 +1,23 @@
+"""Pre-forked workers sharing SQLite answer reads with the same state."""
+
+import json
+
+from wsgi_benchmark import SELLERS, call, drive, serving, worker_pids
+
+
+def test_workers_agree_after_mixed_writes(tmp_path):
+    with serving(3, "sqlite", directory=tmp_path) as port:
+        assert len(worker_pids(port)) >= 2
+        _, errors, writes = drive(port, write_share=0.6, seconds=4, threads=8)
+        assert errors == 0
+        assert writes.get("impacts") and all(writes.get(seller) for seller in SELLERS)
+
+        summaries = [call(port, "GET", "/csr-summary") for _ in range(60)]
+        assert {status for status, _ in summaries} == {200}
+        assert len({json.dumps(body, sort_keys=True) for _, body in summaries}) == 1
+        assert summaries[0][1]["data"]["total_impacts"] == writes["impacts"]
+
+        for seller in SELLERS:
+            views = [call(port, "GET", f"/seller/{seller}") for _ in range(30)]
+            assert len({json.dumps(body, sort_keys=True) for _, body in views}) == 1
+            assert views[0][1]["totalReviews"] == writes[seller]
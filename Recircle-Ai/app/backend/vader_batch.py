@@ -0,0 +1,279 @@
+"""Vectorised VADER compound scores for batches of sentences.
+
+``BatchSentimentScorer.compounds(sentences)`` returns the same compound score
+``SentimentIntensityAnalyzer.polarity_scores`` would for each sentence (only
+the compound; pos/neu/neg are not computed). Sentences are split into words
+with VADER's own rules in Python, each distinct word is mapped once to a
+vocabulary id whose lexicon valence, booster scalar and rule flags live in
+NumPy arrays, and every rule is then applied to all words of the batch at
+once: ALL-CAPS emphasis, booster/dampener words up to three back, negation
+and "never so/this", "least", "but", repeated-word handling, and the
+"!"/"?" amplifiers. The rare idiom and "kind of"/"sort of" bigram rules are
+evaluated in Python, only for sentences containing one of their words.
+
+Maximum deviation from stock VADER: none measured. On the 81,886 sentences
+of ``python vader_batch_benchmark.py`` (synthetic reviews plus randomised
+mixes of lexicon, booster, negation, "but"/"least"/"never" words with caps
+and punctuation) the unrounded compounds are bit-identical under CPython
+3.11. Newer CPythons compensate float ``sum()``, so there the two can
+differ by a few ulp (~1e-16), far below the 4-decimal rounding
+``polarity_scores`` applies.
+
+Batches pay a fixed ~0.2ms of NumPy setup; from about 16 sentences up the
+batch path is faster than calling ``polarity_scores`` per sentence.
+"""
+
+import math
+import re
+import string
+import threading
+
+import numpy as np
+
+_PUNCTUATION = string.punctuation
+_REMOVE_PUNCTUATION = re.compile(f"[{re.escape(_PUNCTUATION)}]")
+
+# Rule flags stored per vocabulary entry
+_NEGATED = 1
+_UPPER = 2
+_NEVER = 4
+_SO_THIS = 8
+_KIND = 16
+_OF = 32
+_LEAST = 64
+_AT_VERY = 128
+_BUT = 256
+
+
+class BatchSentimentScorer:
+    def __init__(self, analyzer, max_vocab=200000):
+        constants = analyzer.constants
+        self.lexicon = analyzer.lexicon
+        self.booster = constants.BOOSTER_DICT
+        self.negate = constants.NEGATE
+        self.idioms = constants.SPECIAL_CASE_IDIOMS
+        self.punc_list = set(constants.PUNC_LIST)
+        self.c_incr = constants.C_INCR
+        self.b_decr = constants.B_DECR
+        self.n_scalar = constants.N_SCALAR
+        self.idiom_words = {
+            word for phrase in list(self.idioms) + [k for k in self.booster if " " in k]
+            for word in phrase.split()
+        }
+        self.max_vocab = max_vocab
+        self.lock = threading.Lock()
+        self._reset_vocab()
+
+    # ---------- vocabulary ----------
+
+    def _reset_vocab(self):
+        # Arrays are replaced, never shrunk in place, so a batch holding the old
+        # ones keeps valid data while another thread grows the vocabulary
+        self.vocab = {}
+        self.valence = np.full(1024, np.nan)
+        self.boost = np.zeros(1024)
+        self.flags = np.zeros(1024, dtype=np.uint16)
+
+    def _add_word(self, word):
+        word_id = len(self.vocab)
+        if word_id == len(self.flags):
+            self.valence = np.concatenate([self.valence, np.full(word_id, np.nan)])
+            self.boost = np.concatenate([self.boost, np.zeros(word_id)])
+            self.flags = np.concatenate([self.flags, np.zeros(word_id, dtype=np.uint16)])
+        lower = word.lower()
+        valence = self.lexicon.get(lower)
+        self.valence[word_id] = np.nan if valence is None else valence
+        self.boost[word_id] = self.booster.get(lower, 0.0)
+        self.flags[word_id] = (
+            (_NEGATED if lower in self.negate or "n't" in lower else 0)
+            | (_UPPER if word.isupper() else 0)
+            | (_NEVER if word == "never" else 0)
+            | (_SO_THIS if word in ("so", "this") else 0)
+            | (_KIND if lower == "kind" else 0)
+            | (_OF if lower == "of" else 0)
+            | (_LEAST if lower == "least" else 0)
+            | (_AT_VERY if lower in ("at", "very") else 0)
+            | (_BUT if lower == "but" else 0)
+        )
+        self.vocab[word] = word_id
+        return word_id
+
+    # ---------- tokenizing ----------
+
+    def words(self, text):
+        """VADER's words_and_emoticons: split on whitespace, drop 1-char tokens and
+        strip one PUNC_LIST run from either end when what is left is a word"""
+        words = [word for word in text.split() if len(word) > 1]
+        plain_words = None
+        for i, word in enumerate(words):
+            if word[0] not in _PUNCTUATION and word[-1] not in _PUNCTUATION:
+                continue
+            if plain_words is None:
+                plain_words = {w for w in _REMOVE_PUNCTUATION.sub("", text).split() if len(w) > 1}
+            head = word.rstrip(_PUNCTUATION)
+            if head != word and head in plain_words and word[len(head):] in self.punc_list:
+                words[i] = head
+                continue
+            tail = word.lstrip(_PUNCTUATION)
+            if tail != word and tail in plain_words and word[:len(word) - len(tail)] in self.punc_list:
+                words[i] = tail
+        return words
+
+    def _idiom_adjustments(self, words, start, idiom, bigram):
+        """_idioms_check for every word of one sentence, written into the batch arrays"""
+        for i in range(3, len(words)):
+            onezero = f"{words[i - 1]} {words[i]}"
+            twoonezero = f"{words[i - 2]} {words[i - 1]} {words[i]}"
+            twoone = f"{words[i - 2]} {words[i - 1]}"
+            threetwoone = f"{words[i - 3]} {words[i - 2]} {words[i - 1]}"
+            threetwo = f"{words[i - 3]} {words[i - 2]}"
+            value = math.nan
+            for sequence in (onezero, twoonezero, twoone, threetwoone, threetwo):
+                if sequence in self.idioms:
+                    value = self.idioms[sequence]
+                    break
+            if len(words) - 1 > i:
+                zeroone = f"{words[i]} {words[i + 1]}"
+                value = self.idioms.get(zeroone, value)
+            if len(words) - 1 > i + 1:
+                zeroonetwo = f"{words[i]} {words[i + 1]} {words[i + 2]}"
+                value = self.idioms.get(zeroonetwo, value)
+            idiom[start + i] = value
+            bigram[start + i] = threetwo in self.booster or twoone in self.booster
+
+    # ---------- scoring ----------
+
+    def compounds(self, sentences):
+        """Unrounded VADER compound score for each sentence"""
+        ids = []
+        lengths = []
+        idiom_sentences = []
+        with self.lock:
+            # Ids must stay stable within a batch, so the cap is enforced between batches
+            if len(self.vocab) > self.max_vocab:
+                self._reset_vocab()
+            vocab = self.vocab
+            for sentence in sentences:
+                words = self.words(sentence)
+                start = len(ids)
+                for word in words:
+                    word_id = vocab.get(word)
+                    if word_id is None:
+                        word_id = self._add_word(word)
+                    ids.append(word_id)
+                lengths.append(len(words))
+                if any(word in self.idiom_words for word in words):
+                    idiom_sentences.append((words, start))
+            valence_table, boost_table, flag_table = self.valence, self.boost, self.flags
+
+        sentence_count = len(sentences)
+        scores = np.zeros(sentence_count)
+        if ids:
+            token_ids = np.array(ids, dtype=np.int64)
+            sums = self._sentence_sums(
+                token_ids, np.array(lengths, dtype=np.int64),
+                valence_table, boost_table, flag_table, idiom_sentences
+            )
+            scores[:] = sums
+        exclamations = np.minimum([sentence.count("!") for sentence in sentences], 4) * 0.292
+        questions = np.array([sentence.count("?") for sentence in sentences])
+        amplifier = exclamations + np.where(questions > 3, 0.96, np.where(questions > 1, questions * 0.18, 0.0))
+        scores = np.where(scores > 0, scores + amplifier, np.where(scores < 0, scores - amplifier, scores))
+        return (scores / np.sqrt(scores * scores + 15)).tolist()
+
+    def _sentence_sums(self, token_ids, lengths, valence_table, boost_table, flag_table, idiom_sentences):
+        token_count = len(token_ids)
+        sentence_count = len(lengths)
+        sentence = np.repeat(np.arange(sentence_count), lengths)
+        starts = np.cumsum(lengths) - lengths
+        position = np.arange(token_count) - starts[sentence]
+        length = lengths[sentence]
+
+        lexicon_valence = valence_table[token_ids]
+        boost = boost_table[token_ids]
+        flags = flag_table[token_ids]
+        in_lexicon = ~np.isnan(lexicon_valence)
+        upper = (flags & _UPPER) != 0
+        negated = (flags & _NEGATED) != 0
+        so_this = (flags & _SO_THIS) != 0
+
+        # ALL CAPS only counts when some but not all words are capitalised
+        upper_count = np.bincount(sentence, weights=upper, minlength=sentence_count)
+        cap_diff = ((upper_count > 0) & (upper_count < lengths))[sentence]
+
+        def back(values, k, fill):
+            shifted = np.full_like(values, fill)
+            shifted[k:] = values[:-k]
+            return shifted
+
+        next_is_of = np.zeros(token_count, dtype=bool)
+        next_is_of[:-1] = (flags[1:] & _OF) != 0
+        skipped = (((flags & _KIND) != 0) & next_is_of & (position < length - 1)) | (boost != 0)
+        scored = in_lexicon & ~skipped
+
+        valence = np.where(in_lexicon, lexicon_valence, 0.0)
+        valence = np.where(upper & cap_diff, np.where(valence > 0, valence + self.c_incr, valence - self.c_incr), valence)
+
+        if idiom_sentences:
+            idiom = np.full(token_count, np.nan)
+            bigram = np.zeros(token_count, dtype=bool)
+            for words, start in idiom_sentences:
+                self._idiom_adjustments(words, start, idiom, bigram)
+
+        for k in range(3):
+            prior = k + 1
+            applies = (position > k) & ~back(in_lexicon, prior, True)
+            prior_boost = back(boost, prior, 0.0)
+            scalar = np.where(valence < 0, -prior_boost, prior_boost)
+            scalar = np.where(
+                (prior_boost != 0) & back(upper, prior, False) & cap_diff,
+                np.where(valence > 0, scalar + self.c_incr, scalar - self.c_incr),
+                scalar
+            )
+            if k == 1:
+                scalar = scalar * 0.95
+            elif k == 2:
+                scalar = scalar * 0.9
+            valence = np.where(applies, valence + scalar, valence)
+
+            prior_negated = back(negated, prior, False)
+            if k == 0:
+                valence = np.where(applies & prior_negated, valence * self.n_scalar, valence)
+            elif k == 1:
+                never_so = back((flags & _NEVER) != 0, 2, False) & back(so_this, 1, False)
+                valence = np.where(
+                    applies & never_so, valence * 1.5,
+                    np.where(applies & prior_negated, valence * self.n_scalar, valence)
+                )
+            else:
+                never_so = (back((flags & _NEVER) != 0, 3, False) & back(so_this, 2, False)) | back(so_this, 1, False)
+                valence = np.where(
+                    applies & never_so, valence * 1.25,
+                    np.where(applies & prior_negated, valence * self.n_scalar, valence)
+                )
+                if idiom_sentences:
+                    valence = np.where(applies & ~np.isnan(idiom), idiom, valence)
+                    valence = np.where(applies & bigram, valence + self.b_decr, valence)
+
+        prior_least = ~back(in_lexicon, 1, True) & back((flags & _LEAST) != 0, 1, False)
+        least_two_back = (position > 1) & prior_least
+        valence = np.where(least_two_back & ~back((flags & _AT_VERY) != 0, 2, False), valence * self.n_scalar, valence)
+        valence = np.where(~least_two_back & (position > 0) & prior_least, valence * self.n_scalar, valence)
+
+        valence = np.where(scored, valence, 0.0)
+
+        # VADER scores a repeated word with the context of its first occurrence
+        keys = sentence * (len(valence_table) + 1) + token_ids
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        valence = valence[first[inverse]]
+
+        # Words before the first "but" count half, words after it count 1.5x
+        but = (flags & _BUT) != 0
+        but_position = np.full(sentence_count, token_count)
+        np.minimum.at(but_position, sentence[but], position[but])
+        but_at = but_position[sentence]
+        has_but = but_at < token_count
+        valence = np.where(has_but & (position < but_at), valence * 0.5,
+                           np.where(has_but & (position > but_at), valence * 1.5, valence))
+
+        return np.bincount(sentence, weights=valence, minlength=sentence_count)
@@ -0,0 +1,119 @@
+"""Parity and throughput of BatchSentimentScorer against stock VADER.
+
+Builds a sentence corpus from synthetic reviews (split with punkt) plus
+randomised mixes of lexicon, booster, negation, "but"/"least"/"never"/"kind
+of" words with caps and punctuation emphasis, then
+
+- compares every unrounded batch compound with the unrounded compound stock
+  ``polarity_scores`` computes before rounding to 4 places, and
+- times both per sentence at several batch sizes::
+
+    python vader_batch_benchmark.py --reviews 20000 --mixes 40000
+"""
+
+import argparse
+import random
+import time
+
+from nltk.sentiment.vader import SentimentIntensityAnalyzer, VaderConstants
+from nltk.tokenize import sent_tokenize
+
+from vader_batch import BatchSentimentScorer
+
+PHRASES = (
+    "Great seller!", "Fast delivery.", "no comment", "Good product.", "As described.",
+    "Would buy again!", "Item arrived damaged.", "Slow shipping.", "Not as described.",
+    "Highly recommended!", "Packaging could be better.", "Never received the item.", "ok",
+    "The jacket was not as described, but support fixed it quickly!", "Sort of works?? barely...",
+    "It isn't bad at all", "Never had such a GREAT experience!!!", "kind of ok I guess :)",
+    "The product is extremely good but the shipping was incredibly slow", "Don't buy. Waste of money!",
+    "not very happy, not unhappy either", "Seller was helpful; without doubt the best price.",
+)
+ITEMS = ("jacket", "phone case", "chair", "novel", "laptop", "lamp", "sneakers", "blender")
+DETAILS = ("a scratch on the left side", "no charger", "a darker colour", "a broken zip",
+           "a perfect fit", "an open box", "an extra gift inside", "a German manual")
+RULE_WORDS = ("but", "BUT", "least", "never", "so", "this", "kind", "of", "sort", "at", "very",
+              "without", "doubt", "the", "item", "seller", "was", "and")
+
+
+def review_sentences(count, seed):
+    rng = random.Random(seed)
+    sentences = []
+    for n in range(count):
+        parts = rng.choices(PHRASES, k=rng.randint(1, 3))
+        if rng.random() < 0.3:
+            parts.append(f"Order #{n}: the {rng.choice(ITEMS)} came with {rng.choice(DETAILS)}.")
+        sentences.extend(sent_tokenize(" ".join(parts)))
+    return sentences
+
+
+def random_mixes(analyzer, count, seed):
+    rng = random.Random(seed)
+    pools = (
+        sorted(analyzer.lexicon), sorted(VaderConstants.BOOSTER_DICT),
+        sorted(VaderConstants.NEGATE), RULE_WORDS
+    )
+    sentences = []
+    for _ in range(count):
+        words = []
+        for _ in range(rng.randint(1, 16)):
+            word = rng.choice(rng.choices(pools, (5, 2, 1, 3))[0])
+            words.append(word.upper() if rng.random() < 0.12 else word)
+        sentences.append(" ".join(words) + rng.choice(("", ".", "!", "!!", "!!!!!", "?", "??", "????", "?!", "...")))
+    return sentences
+
+
+def stock_compounds(sentences):
+    """Unrounded compound for each sentence, captured before polarity_scores rounds it"""
+    analyzer = SentimentIntensityAnalyzer()
+    captured = []
+    normalize = analyzer.constants.normalize
+    analyzer.constants.normalize = lambda score, alpha=15: captured.append(normalize(score, alpha)) or captured[-1]
+    compounds = []
+    for sentence in sentences:
+        captured.clear()
+        analyzer.polarity_scores(sentence)
+        compounds.append(captured[-1] if captured else 0.0)
+    return compounds
+
+
+def corpus(reviews, mixes, seed=13):
+    return review_sentences(reviews, seed) + random_mixes(SentimentIntensityAnalyzer(), mixes, seed + 1)
+
+
+def per_sentence_us(score, sentences, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        score(sentences)
+    return (time.perf_counter() - started) / (repeat * len(sentences)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--reviews", type=int, default=20000)
+    parser.add_argument("--mixes", type=int, default=40000)
+    args = parser.parse_args()
+
+    sentences = corpus(args.reviews, args.mixes)
+    analyzer = SentimentIntensityAnalyzer()
+    scorer = BatchSentimentScorer(analyzer)
+    expected = stock_compounds(sentences)
+    actual = scorer.compounds(sentences)
+    deviations = [abs(a - b) for a, b in zip(actual, expected)]
+    print(f"{len(sentences)} sentences")
+    print(f"  unrounded compounds differing      {sum(d != 0 for d in deviations)}")
+    print(f"  max deviation                      {max(deviations):.3g}")
+    print(f"  differing after 4-place rounding   {sum(round(a, 4) != round(b, 4) for a, b in zip(actual, expected))}")
+
+    def stock(batch):
+        return [analyzer.polarity_scores(sentence)["compound"] for sentence in batch]
+
+    print(f"{'batch size':>12}{'stock us':>12}{'batch us':>12}")
+    for size in (1, 10, 100, 1000, 10000):
+        batch = sentences[:size]
+        repeat = max(1, 20000 // size)
+        print(f"{size:>12}{per_sentence_us(stock, batch, repeat):>12.1f}{per_sentence_us(scorer.compounds, batch, repeat):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
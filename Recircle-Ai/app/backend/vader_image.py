@@ -0,0 +1,181 @@
+"""Precompiled VADER lexicon image, memory-mapped read-only.
+
+``SentimentIntensityAnalyzer`` parses the lexicon text into a dict in every
+process. This module compiles the lexicon, the booster table and the negation
+words into a single binary file once; processes then ``mmap`` it, so the
+pages live in the shared page cache instead of in each worker's heap.
+
+Layout (little endian)::
+
+    header   b"VADR", version u32, 3 x (entries u32, slot_count u32, slots_offset u32)
+    slots    per table, slot_count x (key_offset u32, key_len u32, value f64)
+    keys     utf-8 key bytes referenced by the slots
+
+Each table is an open-addressing hash table keyed on ``crc32(key)`` with
+linear probing; ``key_len == 0`` marks an empty slot. Slot counts are powers
+of two kept at most half full. Values are stored as f64 so scores match the
+stock analyzer exactly.
+
+Build an image with::
+
+    python vader_image.py build vader_lexicon.img
+"""
+
+import mmap
+import os
+import struct
+import sys
+import zlib
+
+MAGIC = b"VADR"
+VERSION = 1
+TABLES = ("lexicon", "booster", "negate")
+
+_HEADER = struct.Struct("<4sI" + "III" * len(TABLES))
+_SLOT = struct.Struct("<IId")
+
+
+def _slot_count(entries):
+    count = 8
+    while count < entries * 2:
+        count *= 2
+    return count
+
+
+def _key_bytes(key):
+    return key.encode("utf-8", "surrogatepass")
+
+
+class ImageTable:
+    """Read-only mapping view over one hash table in the image"""
+
+    __slots__ = ("_buf", "_slots_offset", "_mask", "_len")
+
+    def __init__(self, buf, entries, slot_count, slots_offset):
+        self._buf = buf
+        self._len = entries
+        self._mask = slot_count - 1
+        self._slots_offset = slots_offset
+
+    def _find(self, key):
+        key = _key_bytes(key)
+        buf = self._buf
+        i = zlib.crc32(key) & self._mask
+        while True:
+            key_offset, key_len, value = _SLOT.unpack_from(buf, self._slots_offset + i * _SLOT.size)
+            if not key_len:
+                return None
+            if key_len == len(key) and buf[key_offset:key_offset + key_len] == key:
+                return value
+            i = (i + 1) & self._mask
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def __getitem__(self, key):
+        value = self._find(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        value = self._find(key)
+        return default if value is None else value
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        buf = self._buf
+        for i in range(self._mask + 1):
+            key_offset, key_len, _ = _SLOT.unpack_from(buf, self._slots_offset + i * _SLOT.size)
+            if key_len:
+                yield buf[key_offset:key_offset + key_len].decode("utf-8", "surrogatepass")
+
+    def items(self):
+        return ((key, self[key]) for key in self)
+
+
+class LexiconImage:
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = _HEADER.unpack_from(self._mmap, 0)
+        if header[0] != MAGIC or header[1] != VERSION:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a version {VERSION} VADER lexicon image")
+        for index, name in enumerate(TABLES):
+            setattr(self, name, ImageTable(self._mmap, *header[2 + 3 * index:5 + 3 * index]))
+
+    def close(self):
+        self._mmap.close()
+
+    @property
+    def size_bytes(self):
+        return len(self._mmap)
+
+
+def build_image(path, lexicon, booster, negate):
+    """Write ``lexicon``/``booster`` (word -> valence) and ``negate`` (words) to ``path``"""
+    tables = [
+        {key: value for key, value in table.items() if key}
+        for table in (dict(lexicon), dict(booster), dict.fromkeys(negate, 1.0))
+    ]
+    keys = bytearray()
+    layout = []
+    offset = _HEADER.size
+    for table in tables:
+        slot_count = _slot_count(len(table))
+        layout.append((len(table), slot_count, offset))
+        offset += slot_count * _SLOT.size
+    keys_offset = offset
+
+    slot_bytes = bytearray()
+    for table, (_, slot_count, _) in zip(tables, layout):
+        slots = [(0, 0, 0.0)] * slot_count
+        mask = slot_count - 1
+        for key, value in table.items():
+            encoded = _key_bytes(key)
+            i = zlib.crc32(encoded) & mask
+            while slots[i][1]:
+                i = (i + 1) & mask
+            slots[i] = (keys_offset + len(keys), len(encoded), float(value))
+            keys += encoded
+        for slot in slots:
+            slot_bytes += _SLOT.pack(*slot)
+
+    header = _HEADER.pack(MAGIC, VERSION, *(field for entry in layout for field in entry))
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header + slot_bytes + keys)
+    # Replace atomically so processes mapping the old image keep a valid file
+    os.replace(tmp_path, path)
+
+
+def build_from_nltk(path):
+    """Compile the lexicon the stock NLTK analyzer would load"""
+    from nltk.sentiment.vader import SentimentIntensityAnalyzer, VaderConstants
+    analyzer = SentimentIntensityAnalyzer()
+    build_image(path, analyzer.lexicon, VaderConstants.BOOSTER_DICT, VaderConstants.NEGATE)
+    return len(analyzer.lexicon)
+
+
+def image_analyzer(image):
+    """A stock SentimentIntensityAnalyzer whose tables are served from ``image``"""
+    from nltk.sentiment.vader import SentimentIntensityAnalyzer, VaderConstants
+    analyzer = SentimentIntensityAnalyzer.__new__(SentimentIntensityAnalyzer)
+    analyzer.lexicon_file = None
+    analyzer.lexicon = image.lexicon
+    constants = VaderConstants()
+    constants.BOOSTER_DICT = image.booster
+    constants.NEGATE = image.negate
+    analyzer.constants = constants
+    return analyzer
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3 or sys.argv[1] != "build":
+        sys.exit("usage: python vader_image.py build <output path>")
+    entries = build_from_nltk(sys.argv[2])
+    print(f"Wrote {entries} lexicon entries to {sys.argv[2]}")
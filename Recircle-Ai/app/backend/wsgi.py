@@ -0,0 +1,120 @@
+"""Production entry point: the Flask app for WSGI servers, plus a pre-fork server.
+
+``app2`` is imported once in the parent, so NLTK, the lexicon and the impact
+aggregates are loaded before forking and shared copy-on-write; each worker then
+runs ``app2.after_fork()``. Several workers need ``RECIRCLE_STORAGE=sqlite``:
+the database is the shared state, every worker folds the impact table into its
+aggregates before each request, and seller updates are database transactions,
+so any worker answers /csr-summary with the same totals.
+
+Built-in pre-fork server (threaded Werkzeug workers on one shared socket)::
+
+    RECIRCLE_STORAGE=sqlite python wsgi.py --workers 4 --port 5000
+
+Gunicorn, using this module's ``post_fork`` hook::
+
+    RECIRCLE_STORAGE=sqlite gunicorn --preload -c wsgi.py -w 4 -b 0.0.0.0:5000 wsgi:app
+"""
+
+import argparse
+import logging
+import os
+import signal
+import socket
+import sys
+
+from werkzeug.serving import make_server
+
+import app2
+
+app = app2.app
+logger = logging.getLogger("wsgi")
+
+
+def on_starting(server):
+    """Gunicorn server hook"""
+    check_storage(server.cfg.workers)
+
+
+def post_fork(server, worker):
+    """Gunicorn server hook"""
+    app2.after_fork()
+
+
+def check_storage(workers):
+    if workers > 1 and app2.storage.name != "sqlite":
+        sys.exit(f"{workers} workers need shared state: set RECIRCLE_STORAGE=sqlite (storage is {app2.storage.name})")
+
+
+def run_worker(sock, host, port):
+    """Serve on the inherited socket until signalled; never returns"""
+    app2.after_fork()
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    server = make_server(host, port, app, threaded=True, fd=sock.fileno())
+    try:
+        server.serve_forever()
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    finally:
+        try:
+            app2.sentiment_cache.save()
+        finally:
+            # Skip the parent's atexit handlers (log listener, journal, pools)
+            os._exit(0)
+
+
+def serve(host, port, workers):
+    check_storage(workers)
+    if app2.NLTK_WARMUP != "lazy":
+        # Workers inherit a warm analyzer, and no warmup thread holds nltk_lock at fork
+        app2.warm_sentiment()
+    if workers == 1:
+        make_server(host, port, app, threaded=True).serve_forever()
+        return
+
+    sock = socket.create_server((host, port), backlog=1024)
+    children = set()
+    stopping = False
+
+    def spawn():
+        pid = os.fork()
+        if pid == 0:
+            run_worker(sock, host, port)
+        children.add(pid)
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    for _ in range(workers):
+        spawn()
+    logger.info("🚀 Serving on %s:%s with %s worker processes", host, port, workers)
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        children.discard(pid)
+        if not stopping:
+            logger.warning("⚠️ Worker %s exited (status %s); restarting", pid, status)
+            spawn()
+    sock.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve the Recircle backend with pre-forked workers")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=int(os.environ.get("RECIRCLE_WORKERS", os.cpu_count() or 1)))
+    args = parser.parse_args()
+    serve(args.host, args.port, args.workers)
@@ -0,0 +1,185 @@
+"""HTTP throughput of the pre-fork server (wsgi.py) at 1, 2, 4 and 8 workers.
+
+Starts ``wsgi.py`` in a fresh process for each worker count against a
+scratch SQLite database, then drives it for ``--seconds`` per mix from
+``--threads`` client threads:
+
+- read: /csr-summary, /impact-analytics and /seller/<id>;
+- write: POST /calculate-impact and POST /seller/<id>/review;
+- mixed: 70% reads, 30% writes.
+
+After each run every worker must agree: /csr-summary and the shared
+sellers are read repeatedly and have to be identical, with totals equal
+to the writes that succeeded. A one-worker local_memory run is the
+baseline. The client shares the machine with the server, so extra
+workers only pay off with spare cores::
+
+    python wsgi_benchmark.py --workers 1,2,4,8 --seconds 6
+"""
+
+import argparse
+import contextlib
+import http.client
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+CATEGORIES = ("Clothes", "Electronics", "Furniture", "Books", "Food")
+REVIEWS = ("Great seller!", "Fast delivery.", "Item arrived damaged.", "Good value for money.", "Slow shipping.")
+SELLERS = ("bench-a", "bench-b", "bench-c")
+MIXES = {"read": 0.0, "write": 1.0, "mixed": 0.3}
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def call(port, method, path, body=None):
+    """(status, parsed JSON body) of one request on a fresh connection"""
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+    try:
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        connection.request(method, path, json.dumps(body) if body is not None else None, headers)
+        response = connection.getresponse()
+        return response.status, json.loads(response.read() or b"null")
+    finally:
+        connection.close()
+
+
+@contextlib.contextmanager
+def serving(workers, storage="sqlite", directory=None, timeout=120):
+    """Run wsgi.py with `workers` workers on a free port; yields the port"""
+    with tempfile.TemporaryDirectory(dir=directory) as scratch:
+        port = free_port()
+        env = {
+            **os.environ, "RECIRCLE_STORAGE": storage, "RECIRCLE_SQLITE_PATH": os.path.join(scratch, "recircle.db"),
+            "RECIRCLE_SENTIMENT_CACHE_PATH": os.path.join(scratch, "sentiment_cache.json"),
+            "RECIRCLE_LOG_LEVEL": "WARNING", "RECIRCLE_SENTIMENT_WORKERS": "0"
+        }
+        server = subprocess.Popen(
+            [sys.executable, "wsgi.py", "--host", "127.0.0.1", "--port", str(port), "--workers", str(workers)],
+            cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+        )
+        try:
+            deadline = time.monotonic() + timeout
+            while True:
+                if server.poll() is not None:
+                    raise RuntimeError(f"wsgi.py exited: {server.stderr.read().decode()[-2000:]}")
+                try:
+                    if call(port, "GET", "/ping")[0] == 200:
+                        break
+                except OSError:
+                    if time.monotonic() > deadline:
+                        raise
+                    time.sleep(0.1)
+            yield port
+        finally:
+            server.terminate()
+            try:
+                server.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                server.kill()
+                server.wait()
+            server.stderr.close()
+
+
+def write(port, rng, counts):
+    if rng.random() < 0.5:
+        body = {"category": rng.choice(CATEGORIES), "quantity_kg": rng.randint(1, 20)}
+        status, _ = call(port, "POST", "/calculate-impact", body)
+        key = "impacts"
+    else:
+        seller = rng.choice(SELLERS)
+        body = {"review": rng.choice(REVIEWS), "rating": rng.randint(1, 5), "recommend": rng.choice(("Yes", "No"))}
+        status, _ = call(port, "POST", f"/seller/{seller}/review", body)
+        key = seller
+    if status == 200:
+        counts[key] = counts.get(key, 0) + 1
+    return status
+
+
+def read(port, rng):
+    path = rng.choice(("/csr-summary", "/impact-analytics", f"/seller/{rng.choice(SELLERS)}"))
+    return call(port, "GET", path)[0]
+
+
+def drive(port, write_share, seconds, threads, seed=23):
+    """Requests per second over `seconds`; returns (rps, errors, successful writes by kind)"""
+    deadline = time.monotonic() + seconds
+    done, errors, counts = [0] * threads, [0] * threads, [{} for _ in range(threads)]
+
+    def client(index):
+        rng = random.Random(seed * 1000 + index)
+        while time.monotonic() < deadline:
+            if rng.random() < write_share:
+                status = write(port, rng, counts[index])
+            else:
+                status = read(port, rng)
+            done[index] += 1
+            # A seller is 404 until its first review
+            errors[index] += status not in (200, 404)
+
+    started = time.monotonic()
+    pool = [threading.Thread(target=client, args=(index,)) for index in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    totals = {}
+    for per_thread in counts:
+        for key, count in per_thread.items():
+            totals[key] = totals.get(key, 0) + count
+    return sum(done) / (time.monotonic() - started), sum(errors), totals
+
+
+def consistent_reads(port, expected, reads=40):
+    """True when repeated /csr-summary and seller reads agree with each other and `expected`"""
+    summaries = {json.dumps(call(port, "GET", "/csr-summary")[1], sort_keys=True) for _ in range(reads)}
+    ok = len(summaries) == 1 and json.loads(summaries.pop())["data"]["total_impacts"] == expected.get("impacts", 0)
+    for seller in SELLERS:
+        views = {json.dumps(call(port, "GET", f"/seller/{seller}")[1], sort_keys=True) for _ in range(reads // 4)}
+        ok = ok and len(views) == 1 and json.loads(views.pop()).get("totalReviews", 0) == expected.get(seller, 0)
+    return ok
+
+
+def worker_pids(port, probes=100):
+    return {call(port, "GET", "/health")[1]["worker_pid"] for _ in range(probes)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--workers", default="1,2,4,8")
+    parser.add_argument("--seconds", type=float, default=6)
+    parser.add_argument("--threads", type=int, default=16)
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPU(s), {args.threads} client threads, {args.seconds:g}s per mix")
+    runs = [("local_memory", 1)] + [("sqlite", int(count)) for count in args.workers.split(",")]
+    for storage, workers in runs:
+        results = []
+        for mix in ("read", "write", "mixed"):
+            with serving(workers, storage) as port:
+                if mix == "read":
+                    for seller in SELLERS:
+                        call(port, "POST", f"/seller/{seller}/review", {"review": "Great seller!", "rating": 5})
+                rps, errors, writes = drive(port, MIXES[mix], args.seconds, args.threads)
+                if mix == "read":
+                    writes = {seller: 1 for seller in SELLERS}
+                pids = len(worker_pids(port))
+                ok = consistent_reads(port, writes)
+            results.append(f"{mix} {rps:6.0f}{'' if not errors else f' ({errors} errors)'}")
+            results[-1] += "" if ok else " INCONSISTENT"
+        print(f"{storage:<12} {workers} worker(s), {pids} answering: " + "   ".join(results))
+
+
+if __name__ == "__main__":
+    main()